@@ -1,5 +1,5 @@
 use axum::{
-    extract::{Path, State},
+    extract::{Path, Query, State},
     middleware,
     routing::{delete, get, post},
     Json, Router,
@@ -42,6 +42,7 @@ pub fn broker_read_routes() -> Router<AppState> {
     Router::new()
         .route("/api/broker/account", get(get_account_info))
         .route("/api/broker/positions", get(get_broker_positions))
+        .route("/api/broker/positions/:symbol", get(get_broker_position))
         .route("/api/broker/orders", get(get_orders))
         .route("/api/broker/orders/:id", get(get_order))
 }
@@ -494,6 +495,33 @@ async fn get_broker_positions(
     Ok(Json(ApiResponse::success(positions)))
 }
 
+#[utoipa::path(
+    get,
+    path = "/api/broker/positions/{symbol}",
+    tag = "Trading",
+    params(
+        ("symbol" = String, Path, description = "Stock ticker symbol"),
+    ),
+    responses(
+        (status = 200, description = "Open broker position for the symbol, or null if none"),
+        (status = 500, description = "Broker not configured or API error"),
+    ),
+)]
+/// Get the open position for a single symbol
+async fn get_broker_position(
+    State(state): State<AppState>,
+    Path(symbol): Path<String>,
+) -> Result<Json<ApiResponse<Option<BrokerPosition>>>, AppError> {
+    let broker = state
+        .broker_client
+        .as_ref()
+        .ok_or_else(|| anyhow::anyhow!("Broker not configured"))?;
+
+    let position = broker.get_position(&symbol.to_uppercase()).await?;
+
+    Ok(Json(ApiResponse::success(position)))
+}
+
 #[utoipa::path(
     delete,
     path = "/api/broker/positions/{symbol}",
@@ -581,25 +609,34 @@ async fn close_broker_position(
     Ok(Json(ApiResponse::success(order)))
 }
 
+#[derive(Deserialize, utoipa::IntoParams)]
+struct OrdersQuery {
+    /// Maximum number of orders to return (1-50, default 50)
+    limit: Option<usize>,
+}
+
 #[utoipa::path(
     get,
     path = "/api/broker/orders",
     tag = "Trading",
+    params(OrdersQuery),
     responses(
         (status = 200, description = "List of recent broker orders (up to 50)"),
         (status = 500, description = "Broker not configured or API error"),
     ),
 )]
-/// Get all orders
+/// Get recent orders
 async fn get_orders(
     State(state): State<AppState>,
+    Query(query): Query<OrdersQuery>,
 ) -> Result<Json<ApiResponse<Vec<BrokerOrder>>>, AppError> {
     let broker = state
         .broker_client
         .as_ref()
         .ok_or_else(|| anyhow::anyhow!("Broker not configured"))?;
 
-    let orders = broker.get_orders(Some(50)).await?;
+    let limit = query.limit.unwrap_or(50).clamp(1, 50);
+    let orders = broker.get_orders(Some(limit)).await?;
 
     Ok(Json(ApiResponse::success(orders)))
 }
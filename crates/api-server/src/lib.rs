@@ -71,6 +71,7 @@ use tower::ServiceBuilder;
 use tower_governor::{
     governor::GovernorConfigBuilder, key_extractor::SmartIpKeyExtractor, GovernorLayer,
 };
+use tower_http::compression::CompressionLayer;
 use tower_http::cors::CorsLayer;
 use tower_http::trace::TraceLayer;
 use tracing_subscriber::{layer::SubscriberExt, util::SubscriberInitExt};
@@ -1316,6 +1317,9 @@ pub async fn run_server() -> anyhow::Result<()> {
                 }))
                 .layer(TimeoutLayer::new(request_timeout))
                 .layer(axum::extract::DefaultBodyLimit::max(1_048_576)) // 1MB
+                // gzip/br JSON responses for clients that ask (the Dash frontend's
+                // requests session sends Accept-Encoding: gzip by default)
+                .layer(CompressionLayer::new())
                 .layer(TraceLayer::new_for_http())
                 .layer(middleware::from_fn(request_id::request_id_middleware))
                 .layer(middleware::from_fn(
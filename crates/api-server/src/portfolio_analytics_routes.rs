@@ -21,6 +21,13 @@ pub struct BenchmarkQuery {
     pub days: Option<i64>,
 }
 
+#[derive(Deserialize)]
+pub struct BundleQuery {
+    pub days: Option<i64>,
+    pub risk_days: Option<i64>,
+    pub benchmark: Option<String>,
+}
+
 #[derive(Deserialize)]
 pub struct PerformanceMethodQuery {
     pub days: Option<i64>,
@@ -72,6 +79,7 @@ pub fn portfolio_analytics_routes() -> Router<AppState> {
             get(get_performance_analytics),
         )
         .route("/api/portfolio/benchmark", get(get_benchmark))
+        .route("/api/portfolio/bundle", get(get_portfolio_bundle))
         // Reconciliation
         .route("/api/portfolio/reconcile", post(reconcile_positions))
         .route(
@@ -227,6 +235,99 @@ async fn get_benchmark(
     Ok(Json(ApiResponse::success(analysis)))
 }
 
+// ============================================================
+// Bundle: everything the analytics tab shows in one response
+// ============================================================
+
+/// Risk, performance, benchmark, drift, allocations and rebalance in one call.
+///
+/// Positions, targets and snapshots are loaded once and shared by every
+/// section instead of once per endpoint. A section that cannot be computed is
+/// `null` rather than failing the whole bundle.
+async fn get_portfolio_bundle(
+    State(state): State<AppState>,
+    Query(query): Query<BundleQuery>,
+) -> Result<Json<ApiResponse<serde_json::Value>>, AppError> {
+    let pm = get_portfolio_manager(&state)?;
+    let days = query.days.unwrap_or(365);
+    let risk_days = query.risk_days.unwrap_or(90);
+    let benchmark_symbol = query.benchmark.as_deref().unwrap_or("SPY");
+
+    let (snapshots, positions, targets, bars) = tokio::join!(
+        pm.get_snapshots(days.max(risk_days)),
+        build_positions_with_pnl(&state),
+        pm.get_target_allocations(),
+        get_cached_etf_bars(&state, benchmark_symbol, days, 15),
+    );
+    let snapshots = snapshots?;
+    let positions = positions?;
+    let targets = targets.unwrap_or_default();
+
+    // Same cutoffs get_snapshots applies in SQL, taken from the one wider read.
+    let cutoff = |d: i64| (chrono::Utc::now() - chrono::Duration::days(d)).to_rfc3339();
+    let (risk_cutoff, perf_cutoff) = (cutoff(risk_days), cutoff(days));
+    let risk_snapshots: Vec<_> = snapshots
+        .iter()
+        .filter(|s| s.snapshot_date >= risk_cutoff)
+        .cloned()
+        .collect();
+    let perf_snapshots: Vec<_> = snapshots
+        .iter()
+        .filter(|s| s.snapshot_date >= perf_cutoff)
+        .cloned()
+        .collect();
+
+    let sector_map: HashMap<String, String> = HashMap::new();
+    let total_value: rust_decimal::Decimal = positions.iter().map(|p| p.market_value).sum();
+
+    let risk = RiskCalculator::compute(&risk_snapshots, &positions, &sector_map);
+
+    let performance = match get_trade_logger(&state) {
+        Ok(tl) => match tl.get_all_trades(None).await {
+            Ok(trades) => Some(RiskCalculator::compute_performance(
+                &perf_snapshots,
+                &positions,
+                &trades,
+            )),
+            Err(e) => {
+                tracing::warn!("bundle: failed to load trades: {}", e);
+                None
+            }
+        },
+        Err(_) => None,
+    };
+
+    let benchmark_prices: Vec<(String, f64)> = bars
+        .iter()
+        .map(|b| (b.timestamp.format("%Y-%m-%d").to_string(), b.close))
+        .collect();
+    let benchmark =
+        BenchmarkComparer::compare(&perf_snapshots, &benchmark_prices, benchmark_symbol);
+
+    let drift = RebalanceCalculator::compute_drift(&positions, &targets, total_value, &sector_map);
+
+    let prices: HashMap<String, f64> = positions
+        .iter()
+        .map(|p| {
+            (
+                p.position.symbol.clone(),
+                p.current_price.to_f64().unwrap_or(0.0),
+            )
+        })
+        .collect();
+    let rebalance =
+        RebalanceCalculator::calculate(&positions, &targets, total_value, &prices, &sector_map);
+
+    Ok(Json(ApiResponse::success(serde_json::json!({
+        "risk": risk,
+        "performance": performance,
+        "benchmark": benchmark,
+        "drift": drift,
+        "allocations": targets,
+        "rebalance": rebalance,
+    }))))
+}
+
 // ============================================================
 // Feature 5: Reconciliation
 // ============================================================
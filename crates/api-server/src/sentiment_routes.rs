@@ -48,6 +48,20 @@ fn default_limit() -> i64 {
     100
 }
 
+/// Query parameters for the combined velocity + history read
+#[derive(Deserialize, utoipa::IntoParams)]
+pub struct SentimentDashboardQuery {
+    /// Number of days of history to analyze for velocity (default: 7)
+    #[serde(default = "default_days")]
+    pub days: i64,
+    /// Number of days of history to return (default: 30)
+    #[serde(default = "default_history_days")]
+    pub history_days: i64,
+    /// Limit number of history records (default: 100)
+    #[serde(default = "default_limit")]
+    pub limit: i64,
+}
+
 /// Request to record a sentiment data point
 #[derive(Deserialize, utoipa::ToSchema)]
 pub struct RecordSentimentRequest {
@@ -75,6 +89,14 @@ pub struct SentimentHistoryResponse {
     pub summary: SentimentSummary,
 }
 
+/// Response for the combined velocity + history read; a section that
+/// failed is null rather than failing the whole response
+#[derive(Serialize, utoipa::ToSchema)]
+pub struct SentimentDashboardResponse {
+    pub velocity: Option<SentimentVelocityResponse>,
+    pub history: Option<SentimentHistoryResponse>,
+}
+
 /// A point in sentiment history
 #[derive(Serialize, utoipa::ToSchema)]
 pub struct SentimentHistoryPoint {
@@ -103,6 +125,10 @@ pub fn sentiment_routes() -> Router<AppState> {
             get(get_sentiment_velocity),
         )
         .route("/api/sentiment/:symbol/history", get(get_sentiment_history))
+        .route(
+            "/api/sentiment/:symbol/dashboard",
+            get(get_sentiment_dashboard),
+        )
         .route("/api/sentiment/record", post(record_sentiment))
         .route("/api/sentiment/:symbol/analyze", get(analyze_sentiment_now))
         .route("/api/sentiment/:symbol/social", get(get_social_sentiment))
@@ -579,6 +605,70 @@ async fn get_sentiment_history(
     })))
 }
 
+/// Get sentiment velocity and history for a symbol in one request
+///
+/// Velocity runs first because it may record a fresh data point, which the
+/// history read then includes.
+#[utoipa::path(
+    get,
+    path = "/api/sentiment/{symbol}/dashboard",
+    params(
+        ("symbol" = String, Path, description = "Stock ticker symbol"),
+        SentimentDashboardQuery,
+    ),
+    responses((status = 200, description = "Sentiment velocity and history together")),
+    tag = "Sentiment"
+)]
+async fn get_sentiment_dashboard(
+    State(state): State<AppState>,
+    Path(symbol): Path<String>,
+    Query(query): Query<SentimentDashboardQuery>,
+) -> Result<Json<ApiResponse<SentimentDashboardResponse>>, AppError> {
+    let velocity = match get_sentiment_velocity(
+        State(state.clone()),
+        Path(symbol.clone()),
+        Query(VelocityQuery { days: query.days }),
+    )
+    .await
+    {
+        Ok(Json(resp)) => resp.data,
+        Err(e) => {
+            tracing::warn!(
+                "sentiment dashboard: velocity failed for {}: {:#}",
+                symbol,
+                e.inner
+            );
+            None
+        }
+    };
+
+    let history = match get_sentiment_history(
+        State(state),
+        Path(symbol.clone()),
+        Query(HistoryQuery {
+            days: query.history_days,
+            limit: query.limit,
+        }),
+    )
+    .await
+    {
+        Ok(Json(resp)) => resp.data,
+        Err(e) => {
+            tracing::warn!(
+                "sentiment dashboard: history failed for {}: {:#}",
+                symbol,
+                e.inner
+            );
+            None
+        }
+    };
+
+    Ok(Json(ApiResponse::success(SentimentDashboardResponse {
+        velocity,
+        history,
+    })))
+}
+
 /// Record a sentiment data point
 #[utoipa::path(
     post,
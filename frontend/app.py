@@ -1,4 +1,7 @@
+import hashlib
+import json
 import os
+import time
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -6,7 +9,7 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
 import dash
-from dash import dcc, html, Input, Output, State
+from dash import dcc, html, Input, Output, State, ClientsideFunction
 import dash.dependencies
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -15,7 +18,6 @@ import pandas as pd
 from datetime import datetime
 import dash_bootstrap_components as dbc
 import diskcache
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from components.risk_radar import RiskRadarComponent, create_risk_radar_chart, create_risk_breakdown_bars
 from components.confidence_gauge import ConfidenceGaugeComponent, create_confidence_gauge
@@ -60,6 +62,15 @@ if _sentry_dsn:
     except Exception:
         pass  # Sentry is optional — don't block startup
 
+# Dash encodes callback responses through plotly.io.json, so selecting the
+# orjson engine speeds up serialization of every figure-heavy response.
+try:
+    import orjson  # noqa: F401
+    import plotly.io as pio
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass  # orjson is optional — stdlib json remains the fallback
+
 # Initialize the Dash app with a modern theme
 app = dash.Dash(
     __name__,
@@ -68,7 +79,7 @@ app = dash.Dash(
 )
 
 # API Configuration — import from shared config (single source of truth)
-from components.config import API_BASE, API_KEY, API_TIMEOUT, get_headers
+from components.config import API_BASE, API_KEY, API_TIMEOUT, EXECUTOR, get_headers, parse_json
 API_BASE_URL = API_BASE  # alias for backward compat within this file
 
 # Shared frontend cache (diskcache so background processes can read/write)
@@ -335,8 +346,13 @@ app.layout = dbc.Container([
 
     # Paper Trading + Portfolio + Backtesting (tabbed)
     dcc.Store(id='ml-data-store', data={}),
+    # Digest of the last rendered analytics payload, to skip no-op re-renders
+    dcc.Store(id='analytics-data-version', storage_type='memory'),
     dcc.Store(id='paper-trade-symbol-store', data=''),
     dcc.Store(id='paper-trade-notification-store'),
+    # Order submitted in the background, polled by paper-trade-poll until it resolves
+    dcc.Store(id='paper-trade-pending-store'),
+    dcc.Interval(id='paper-trade-poll', interval=500, disabled=True),
     dcc.Store(id='live-trade-symbol-store', data=''),
     dcc.Store(id='bank-accounts-store', storage_type='local', data=[
         {"id": "bank1", "name": "Primary Bank", "lastFour": "0000", "balance": 0, "color": "#F58220"},
@@ -749,12 +765,9 @@ def build_confidence_section(symbol):
         ], className="h-100")
 
 
-def build_sentiment_velocity_section(symbol):
-    """Build sentiment velocity UI"""
+def build_sentiment_velocity_section(symbol, velocity_data, history_data):
+    """Build sentiment velocity UI from prefetched velocity and history data"""
     try:
-        velocity_data = SentimentVelocityComponent.fetch_velocity_data(symbol)
-        history_data = SentimentVelocityComponent.fetch_history_data(symbol)
-
         velocity_card = SentimentVelocityComponent.create_velocity_card(velocity_data, symbol)
 
         children = []
@@ -857,46 +870,47 @@ def update_analysis(analyze_clicks, refresh_clicks, symbol, timeframe, days):
 
     try:
         # Fetch analysis, bars, and ML data in parallel
-        with ThreadPoolExecutor(max_workers=7) as executor:
-            f_analysis = executor.submit(
-                requests.get, f'{API_BASE_URL}/api/analyze/{symbol}',
-                params={'timeframe': timeframe, 'days': days},
-                headers=get_headers(), timeout=30
-            )
-            f_bars = executor.submit(
-                requests.get, f'{API_BASE_URL}/api/bars/{symbol}',
-                params={'timeframe': timeframe, 'days': days},
-                headers=get_headers(), timeout=30
-            )
-            # ML fetches (best-effort, failures are silently ignored)
-            f_ml = {
-                'trade_signal': executor.submit(MLTradeSignalComponent.fetch_data, symbol),
-                'sentiment': executor.submit(MLSentimentComponent.fetch_data, symbol),
-                'price_forecast': executor.submit(MLPriceForecastComponent.fetch_data, symbol, 5, 90),
-                'calibration': executor.submit(MLCalibrationComponent.fetch_data, symbol),
-                'strategy_weights': executor.submit(MLStrategyWeightsComponent.fetch_data),
-            }
-            analysis_response = f_analysis.result()
-            bars_response = f_bars.result()
-
-            # Collect ML results (best effort – don't block main flow)
-            ml_data = {}
-            for key, future in f_ml.items():
-                try:
-                    ml_data[key] = future.result(timeout=10)
-                except Exception:
-                    ml_data[key] = None
+        f_analysis = EXECUTOR.submit(
+            requests.get, f'{API_BASE_URL}/api/analyze/{symbol}',
+            params={'timeframe': timeframe, 'days': days},
+            headers=get_headers(), timeout=30
+        )
+        f_bars = EXECUTOR.submit(
+            requests.get, f'{API_BASE_URL}/api/bars/{symbol}',
+            params={'timeframe': timeframe, 'days': days},
+            headers=get_headers(), timeout=30
+        )
+        # ML fetches (best-effort, failures are silently ignored)
+        f_ml = {
+            'trade_signal': EXECUTOR.submit(MLTradeSignalComponent.fetch_data, symbol),
+            'sentiment': EXECUTOR.submit(MLSentimentComponent.fetch_data, symbol),
+            'price_forecast': EXECUTOR.submit(MLPriceForecastComponent.fetch_data, symbol, 5, 90),
+            'calibration': EXECUTOR.submit(MLCalibrationComponent.fetch_data, symbol),
+            'strategy_weights': EXECUTOR.submit(MLStrategyWeightsComponent.fetch_data),
+        }
+        analysis_response = f_analysis.result()
+        bars_response = f_bars.result()
+
+        # Collect ML results (best effort – don't block main flow)
+        ml_data = {}
+        for key, future in f_ml.items():
+            try:
+                ml_data[key] = future.result(timeout=10)
+            except Exception:
+                ml_data[key] = None
 
         # Check if response is JSON
+        # parse_json may raise orjson's decode error, which is a ValueError
+        # but not a requests.exceptions.JSONDecodeError.
         try:
-            analysis_data = analysis_response.json()
-        except requests.exceptions.JSONDecodeError:
+            analysis_data = parse_json(analysis_response)
+        except ValueError:
             error_msg = f"API Error: {analysis_response.text[:200]}"
             return _error_results(error_msg)
 
         try:
-            bars_data = bars_response.json()
-        except requests.exceptions.JSONDecodeError:
+            bars_data = parse_json(bars_response)
+        except ValueError:
             bars_data = {'success': False, 'data': []}
 
         if not analysis_data.get('success'):
@@ -940,17 +954,16 @@ def update_analysis(analyze_clicks, refresh_clicks, symbol, timeframe, days):
         quant_card = create_quant_card(analysis.get('quantitative'), ml_data)
         sent_card = create_sentiment_card(analysis.get('sentiment'), ml_data)
 
-        # Fetch confidence, sentiment velocity, and daily bars in parallel
+        # Fetch confidence, sentiment velocity/history, and daily bars in parallel
         # Daily bars (365d) are resampled to weekly/monthly locally to avoid
         # exhausting the Polygon rate limit (5 req/min).
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            f_confidence = executor.submit(build_confidence_section, symbol)
-            f_velocity = executor.submit(build_sentiment_velocity_section, symbol)
-            f_daily = executor.submit(_fetch_bars, symbol, '1d', 365)
+        f_confidence = EXECUTOR.submit(build_confidence_section, symbol)
+        f_daily = EXECUTOR.submit(_fetch_bars, symbol, '1d', 365)
+        velocity_data, history_data = SentimentVelocityComponent.fetch_all(symbol)
 
-            confidence = f_confidence.result()
-            sentiment_velocity = f_velocity.result()
-            daily_bars_full = f_daily.result()
+        sentiment_velocity = build_sentiment_velocity_section(symbol, velocity_data, history_data)
+        confidence = f_confidence.result()
+        daily_bars_full = f_daily.result()
 
         # Slice / resample the single daily dataset for each timeframe
         daily_bars = _slice_recent(daily_bars_full, 30)
@@ -2183,11 +2196,9 @@ def update_peer_comparison(analyze_clicks, refresh_clicks, symbol):
         return peer, None
 
     peer_metrics = {}
-    with ThreadPoolExecutor(max_workers=len(peers)) as executor:
-        results = executor.map(_fetch_peer, peers)
-        for peer, metrics in results:
-            if metrics:
-                peer_metrics[peer] = metrics
+    for peer, metrics in EXECUTOR.map(_fetch_peer, peers):
+        if metrics:
+            peer_metrics[peer] = metrics
 
     if not peer_metrics:
         return dbc.Card([
@@ -2349,26 +2360,25 @@ def update_earnings_dividends(analyze_clicks, refresh_clicks, symbol):
     symbol = symbol.upper()
 
     # Fetch earnings and dividends in parallel
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        f_earnings = executor.submit(EarningsPanelComponent.fetch_data, symbol)
-        f_dividends = executor.submit(DividendPanelComponent.fetch_data, symbol)
+    f_earnings = EXECUTOR.submit(EarningsPanelComponent.fetch_data, symbol)
+    f_dividends = EXECUTOR.submit(DividendPanelComponent.fetch_data, symbol)
 
-        try:
-            earnings_data = f_earnings.result()
-            earnings_card = EarningsPanelComponent.create_card(earnings_data, symbol)
-        except Exception as e:
-            earnings_card = dbc.Card([
-                dbc.CardHeader(html.H5("Earnings Analysis", className="mb-0")),
-                dbc.CardBody(html.P("Data unavailable", className="text-muted"))
-            ])
-        try:
-            dividend_data = f_dividends.result()
-            dividend_card = DividendPanelComponent.create_card(dividend_data, symbol)
-        except Exception as e:
-            dividend_card = dbc.Card([
-                dbc.CardHeader(html.H5("Dividend Analysis", className="mb-0")),
-                dbc.CardBody(html.P("Data unavailable", className="text-muted"))
-            ])
+    try:
+        earnings_data = f_earnings.result()
+        earnings_card = EarningsPanelComponent.create_card(earnings_data, symbol)
+    except Exception as e:
+        earnings_card = dbc.Card([
+            dbc.CardHeader(html.H5("Earnings Analysis", className="mb-0")),
+            dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+        ])
+    try:
+        dividend_data = f_dividends.result()
+        dividend_card = DividendPanelComponent.create_card(dividend_data, symbol)
+    except Exception as e:
+        dividend_card = dbc.Card([
+            dbc.CardHeader(html.H5("Dividend Analysis", className="mb-0")),
+            dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+        ])
     return earnings_card, dividend_card
 
 
@@ -2385,27 +2395,30 @@ def update_options_short_interest(analyze_clicks, refresh_clicks, symbol):
         return "", ""
     symbol = symbol.upper()
 
-    # Fetch options and short interest in parallel
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        f_options = executor.submit(OptionsFlowComponent.fetch_data, symbol)
-        f_short = executor.submit(ShortInterestComponent.fetch_data, symbol)
+    # An explicit refresh should not be answered from the prefetch cache
+    if dash.callback_context.triggered[0]['prop_id'].startswith('refresh-button'):
+        OptionsFlowComponent.fetch_data.cache_clear()
 
-        try:
-            options_data = f_options.result()
-            options_card = OptionsFlowComponent.create_card(options_data, symbol)
-        except Exception as e:
-            options_card = dbc.Card([
-                dbc.CardHeader(html.H5("Options Flow", className="mb-0")),
-                dbc.CardBody(html.P("Data unavailable", className="text-muted"))
-            ])
-        try:
-            short_data = f_short.result()
-            short_card = ShortInterestComponent.create_card(short_data, symbol)
-        except Exception as e:
-            short_card = dbc.Card([
-                dbc.CardHeader(html.H5("Short Squeeze Risk", className="mb-0")),
-                dbc.CardBody(html.P("Data unavailable", className="text-muted"))
-            ])
+    # Fetch options and short interest in parallel on the shared pool
+    f_options = EXECUTOR.submit(OptionsFlowComponent.fetch_data, symbol)
+    f_short = EXECUTOR.submit(ShortInterestComponent.fetch_data, symbol)
+
+    try:
+        options_data = f_options.result()
+        options_card = OptionsFlowComponent.create_card(options_data, symbol)
+    except Exception as e:
+        options_card = dbc.Card([
+            dbc.CardHeader(html.H5("Options Flow", className="mb-0")),
+            dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+        ])
+    try:
+        short_data = f_short.result()
+        short_card = ShortInterestComponent.create_card(short_data, symbol)
+    except Exception as e:
+        short_card = dbc.Card([
+            dbc.CardHeader(html.H5("Short Squeeze Risk", className="mb-0")),
+            dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+        ])
     return options_card, short_card
 
 
@@ -2465,28 +2478,27 @@ def update_social_macro(analyze_clicks, refresh_clicks, symbol):
     symbol = symbol.upper()
 
     # Fetch social sentiment, macro indicators, and macro sensitivity in parallel
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        f_social = executor.submit(SocialSentimentComponent.fetch_data, symbol)
-        f_indicators = executor.submit(MacroOverlayComponent.fetch_indicators)
-        f_sensitivity = executor.submit(MacroOverlayComponent.fetch_sensitivity, symbol)
+    f_social = EXECUTOR.submit(SocialSentimentComponent.fetch_data, symbol)
+    f_indicators = EXECUTOR.submit(MacroOverlayComponent.fetch_indicators)
+    f_sensitivity = EXECUTOR.submit(MacroOverlayComponent.fetch_sensitivity, symbol)
 
-        try:
-            social_data = f_social.result()
-            social_card = SocialSentimentComponent.create_card(social_data, symbol)
-        except Exception as e:
-            social_card = dbc.Card([
-                dbc.CardHeader(html.H5("Social Sentiment", className="mb-0")),
-                dbc.CardBody(html.P("Data unavailable", className="text-muted"))
-            ])
-        try:
-            indicators = f_indicators.result()
-            sensitivity = f_sensitivity.result()
-            macro_card = MacroOverlayComponent.create_card(indicators, sensitivity, symbol)
-        except Exception as e:
-            macro_card = dbc.Card([
-                dbc.CardHeader(html.H5("Macro Overlay", className="mb-0")),
-                dbc.CardBody(html.P("Data unavailable", className="text-muted"))
-            ])
+    try:
+        social_data = f_social.result()
+        social_card = SocialSentimentComponent.create_card(social_data, symbol)
+    except Exception as e:
+        social_card = dbc.Card([
+            dbc.CardHeader(html.H5("Social Sentiment", className="mb-0")),
+            dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+        ])
+    try:
+        indicators = f_indicators.result()
+        sensitivity = f_sensitivity.result()
+        macro_card = MacroOverlayComponent.create_card(indicators, sensitivity, symbol)
+    except Exception as e:
+        macro_card = dbc.Card([
+            dbc.CardHeader(html.H5("Macro Overlay", className="mb-0")),
+            dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+        ])
     return social_card, macro_card
 
 
@@ -2506,94 +2518,93 @@ def update_alpha_flow(analyze_clicks, refresh_clicks, symbol):
     if not symbol:
         return "", ""
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        f_alpha = executor.submit(AlphaDecayComponent.fetch_all_strategies_health)
-        f_flow = executor.submit(FlowMapComponent.fetch_sector_flows)
+    f_alpha = EXECUTOR.submit(AlphaDecayComponent.fetch_all_strategies_health)
+    f_flow = EXECUTOR.submit(FlowMapComponent.fetch_sector_flows)
 
-        # --- Alpha Decay: summary + individual strategy cards ---
-        try:
-            alpha_data = f_alpha.result()
-            if alpha_data and alpha_data.get("strategies"):
-                children = [AlphaDecayComponent.create_portfolio_health_card(alpha_data)]
-                # Show individual strategy cards with health details
-                for s in alpha_data.get("strategies", [])[:6]:
-                    children.append(AlphaDecayComponent.create_strategy_card(s))
-                alpha_card = html.Div(children)
-            elif alpha_data:
-                alpha_card = AlphaDecayComponent.create_portfolio_health_card(alpha_data)
-            else:
-                alpha_card = dbc.Card([
-                    dbc.CardHeader(html.H5("Portfolio Strategy Health", className="mb-0")),
-                    dbc.CardBody([
-                        html.P("No strategies tracked yet.", className="text-muted"),
-                        html.Small("Run a backtest to start monitoring strategy health.", className="text-muted fst-italic"),
-                    ])
-                ])
-        except Exception as e:
+    # --- Alpha Decay: summary + individual strategy cards ---
+    try:
+        alpha_data = f_alpha.result()
+        if alpha_data and alpha_data.get("strategies"):
+            children = [AlphaDecayComponent.create_portfolio_health_card(alpha_data)]
+            # Show individual strategy cards with health details
+            for s in alpha_data.get("strategies", [])[:6]:
+                children.append(AlphaDecayComponent.create_strategy_card(s))
+            alpha_card = html.Div(children)
+        elif alpha_data:
+            alpha_card = AlphaDecayComponent.create_portfolio_health_card(alpha_data)
+        else:
             alpha_card = dbc.Card([
-                dbc.CardHeader(html.H5("Alpha Decay", className="mb-0")),
-                dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+                dbc.CardHeader(html.H5("Portfolio Strategy Health", className="mb-0")),
+                dbc.CardBody([
+                    html.P("No strategies tracked yet.", className="text-muted"),
+                    html.Small("Run a backtest to start monitoring strategy health.", className="text-muted fst-italic"),
+                ])
             ])
+    except Exception as e:
+        alpha_card = dbc.Card([
+            dbc.CardHeader(html.H5("Alpha Decay", className="mb-0")),
+            dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+        ])
 
-        # --- Flow Map: summary + sector performance bars + rotation details ---
-        try:
-            flow_data = f_flow.result()
-            if flow_data:
-                flow_children = []
-                flow_summary = flow_data.get("market_summary")
-                if flow_summary:
-                    flow_children.append(FlowMapComponent.create_market_summary_card(flow_summary))
-
-                # Sector performance heatmap
-                sectors = flow_data.get("sectors", [])
-                if sectors:
-                    from components.flow_map import create_sector_heatmap
-                    heatmap = create_sector_heatmap(sectors)
-                    flow_children.append(dcc.Graph(figure=heatmap, config={'displayModeBar': False}))
-
-                # Rotation pattern details
-                rotations = flow_data.get("rotations", [])
-                if rotations:
-                    rot_badges = []
-                    for r in rotations:
-                        rtype = r.get("rotation_type", "Unknown")
-                        conf = r.get("confidence", 0)
-                        strength = r.get("strength", 0)
-                        gaining = r.get("gaining_sectors", [])
-                        losing = r.get("losing_sectors", [])
-                        is_bullish = "Growth" in rtype or "Cyclical" in rtype or "Small" in rtype
-                        color = "success" if is_bullish else "danger" if conf > 0.5 else "warning"
-                        rot_badges.append(
-                            dbc.Card(dbc.CardBody([
-                                html.Div([
-                                    dbc.Badge(rtype, color=color, className="me-2 fs-6"),
-                                    html.Small(f"Confidence: {conf*100:.0f}% | Strength: {strength:.0f}", className="text-muted"),
-                                ], className="mb-2"),
-                                html.Div([
-                                    html.Small("Gaining: ", className="text-muted"),
-                                    html.Span(", ".join(gaining[:3]) if gaining else "None", className="text-success"),
-                                    html.Span(" | ", className="text-muted"),
-                                    html.Small("Losing: ", className="text-muted"),
-                                    html.Span(", ".join(losing[:3]) if losing else "None", className="text-danger"),
-                                ], className="small"),
-                            ]), className="mb-2")
-                        )
-                    flow_children.extend(rot_badges)
-
-                flow_card = html.Div(flow_children) if flow_children else dbc.Card([
-                    dbc.CardHeader(html.H5("Flow Map", className="mb-0")),
-                    dbc.CardBody(html.P("No data available", className="text-muted"))
-                ])
-            else:
-                flow_card = dbc.Card([
-                    dbc.CardHeader(html.H5("Flow Map", className="mb-0")),
-                    dbc.CardBody(html.P("No data available", className="text-muted"))
-                ])
-        except Exception as e:
+    # --- Flow Map: summary + sector performance bars + rotation details ---
+    try:
+        flow_data = f_flow.result()
+        if flow_data:
+            flow_children = []
+            flow_summary = flow_data.get("market_summary")
+            if flow_summary:
+                flow_children.append(FlowMapComponent.create_market_summary_card(flow_summary))
+
+            # Sector performance heatmap
+            sectors = flow_data.get("sectors", [])
+            if sectors:
+                from components.flow_map import create_sector_heatmap
+                heatmap = create_sector_heatmap(sectors)
+                flow_children.append(dcc.Graph(figure=heatmap, config={'displayModeBar': False}))
+
+            # Rotation pattern details
+            rotations = flow_data.get("rotations", [])
+            if rotations:
+                rot_badges = []
+                for r in rotations:
+                    rtype = r.get("rotation_type", "Unknown")
+                    conf = r.get("confidence", 0)
+                    strength = r.get("strength", 0)
+                    gaining = r.get("gaining_sectors", [])
+                    losing = r.get("losing_sectors", [])
+                    is_bullish = "Growth" in rtype or "Cyclical" in rtype or "Small" in rtype
+                    color = "success" if is_bullish else "danger" if conf > 0.5 else "warning"
+                    rot_badges.append(
+                        dbc.Card(dbc.CardBody([
+                            html.Div([
+                                dbc.Badge(rtype, color=color, className="me-2 fs-6"),
+                                html.Small(f"Confidence: {conf*100:.0f}% | Strength: {strength:.0f}", className="text-muted"),
+                            ], className="mb-2"),
+                            html.Div([
+                                html.Small("Gaining: ", className="text-muted"),
+                                html.Span(", ".join(gaining[:3]) if gaining else "None", className="text-success"),
+                                html.Span(" | ", className="text-muted"),
+                                html.Small("Losing: ", className="text-muted"),
+                                html.Span(", ".join(losing[:3]) if losing else "None", className="text-danger"),
+                            ], className="small"),
+                        ]), className="mb-2")
+                    )
+                flow_children.extend(rot_badges)
+
+            flow_card = html.Div(flow_children) if flow_children else dbc.Card([
+                dbc.CardHeader(html.H5("Flow Map", className="mb-0")),
+                dbc.CardBody(html.P("No data available", className="text-muted"))
+            ])
+        else:
             flow_card = dbc.Card([
                 dbc.CardHeader(html.H5("Flow Map", className="mb-0")),
-                dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+                dbc.CardBody(html.P("No data available", className="text-muted"))
             ])
+    except Exception as e:
+        flow_card = dbc.Card([
+            dbc.CardHeader(html.H5("Flow Map", className="mb-0")),
+            dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+        ])
     return alpha_card, flow_card
 
 
@@ -2617,57 +2628,60 @@ def update_watchlist_tax(analyze_clicks, refresh_clicks, symbol):
     if not symbol:
         return "", None, 0, ""
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        f_watchlist = executor.submit(SmartWatchlistComponent.fetch_personalized_feed)
-        f_tax = executor.submit(TaxDashboardComponent.fetch_harvest_opportunities)
+    f_watchlist = EXECUTOR.submit(SmartWatchlistComponent.fetch_personalized_feed)
+    f_tax = EXECUTOR.submit(TaxDashboardComponent.fetch_harvest_opportunities)
 
-        # --- Smart Watchlist: summary header (cards rendered by pagination callback) ---
-        watchlist_raw = None
-        try:
-            watchlist_data = f_watchlist.result()
-            if watchlist_data:
-                watchlist_summary = SmartWatchlistComponent.create_feed_summary(watchlist_data)
-                watchlist_raw = watchlist_data.get("opportunities", [])
-                watchlist_card = watchlist_summary
-            else:
-                watchlist_card = dbc.Card([
-                    dbc.CardHeader(html.H5("Smart Watchlist", className="mb-0")),
-                    dbc.CardBody(html.P("No data available", className="text-muted"))
-                ])
-        except Exception as e:
+    # --- Smart Watchlist: summary header (cards rendered by pagination callback) ---
+    watchlist_raw = None
+    try:
+        watchlist_data = f_watchlist.result()
+        if watchlist_data:
+            watchlist_summary = SmartWatchlistComponent.create_feed_summary(watchlist_data)
+            watchlist_raw = watchlist_data.get("opportunities", [])
+            watchlist_card = watchlist_summary
+            # Warm options data for the first page of suggestions
+            OptionsFlowComponent.prefetch(
+                [o.get("symbol") for o in watchlist_raw[:WATCHLIST_PAGE_SIZE]]
+            )
+        else:
             watchlist_card = dbc.Card([
                 dbc.CardHeader(html.H5("Smart Watchlist", className="mb-0")),
-                dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+                dbc.CardBody(html.P("No data available", className="text-muted"))
             ])
+    except Exception as e:
+        watchlist_card = dbc.Card([
+            dbc.CardHeader(html.H5("Smart Watchlist", className="mb-0")),
+            dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+        ])
 
-        # --- Tax Dashboard: summary banner + opportunity cards ---
-        try:
-            tax_data = f_tax.result()
-            if tax_data:
-                tax_children = []
-                tax_summary = tax_data.get("summary")
-                if tax_summary:
-                    tax_children.append(TaxDashboardComponent.create_summary_banner(tax_summary))
-
-                opportunities = tax_data.get("opportunities", [])
-                if opportunities:
-                    for opp in opportunities[:5]:
-                        tax_children.append(TaxDashboardComponent.create_opportunity_card(opp))
-
-                tax_card = html.Div(tax_children) if tax_children else dbc.Card([
-                    dbc.CardHeader(html.H5("Tax Dashboard", className="mb-0")),
-                    dbc.CardBody(html.P("No tax data available", className="text-muted"))
-                ])
-            else:
-                tax_card = dbc.Card([
-                    dbc.CardHeader(html.H5("Tax Dashboard", className="mb-0")),
-                    dbc.CardBody(html.P("No data available", className="text-muted"))
-                ])
-        except Exception as e:
+    # --- Tax Dashboard: summary banner + opportunity cards ---
+    try:
+        tax_data = f_tax.result()
+        if tax_data:
+            tax_children = []
+            tax_summary = tax_data.get("summary")
+            if tax_summary:
+                tax_children.append(TaxDashboardComponent.create_summary_banner(tax_summary))
+
+            opportunities = tax_data.get("opportunities", [])
+            if opportunities:
+                for opp in opportunities[:5]:
+                    tax_children.append(TaxDashboardComponent.create_opportunity_card(opp))
+
+            tax_card = html.Div(tax_children) if tax_children else dbc.Card([
+                dbc.CardHeader(html.H5("Tax Dashboard", className="mb-0")),
+                dbc.CardBody(html.P("No tax data available", className="text-muted"))
+            ])
+        else:
             tax_card = dbc.Card([
                 dbc.CardHeader(html.H5("Tax Dashboard", className="mb-0")),
-                dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+                dbc.CardBody(html.P("No data available", className="text-muted"))
             ])
+    except Exception as e:
+        tax_card = dbc.Card([
+            dbc.CardHeader(html.H5("Tax Dashboard", className="mb-0")),
+            dbc.CardBody(html.P("Data unavailable", className="text-muted"))
+        ])
     return watchlist_card, watchlist_raw, 0, tax_card
 
 
@@ -2788,8 +2802,7 @@ def update_paper_trading(analyze_clicks, refresh_clicks, notification_data, symb
     symbol = symbol.upper()
 
     try:
-        account = PaperTradingComponent.fetch_account()
-        position = PaperTradingComponent.fetch_position(symbol)
+        account, position = PaperTradingComponent.fetch_account_and_position(symbol)
 
         # Try to get cached analysis for the signal suggestion
         cached_analysis = _cache_get(f'analysis:{symbol}')
@@ -2803,16 +2816,71 @@ def update_paper_trading(analyze_clicks, refresh_clicks, notification_data, symb
         ]), symbol
 
 
+# Seconds the poll waits for a submitted paper trade before giving up on it:
+# room for a queued executor slot plus one broker round trip.
+_PAPER_TRADE_DEADLINE = 2 * API_TIMEOUT
+
+
 @app.callback(
     [Output('paper-trade-notification-store', 'data'),
-     Output('paper-trade-notification-area', 'children')],
+     Output('paper-trade-notification-area', 'children'),
+     Output('paper-trade-pending-store', 'data'),
+     Output('paper-trade-poll', 'disabled')],
     [Input('paper-trade-buy-btn', 'n_clicks'),
-     Input('paper-trade-sell-btn', 'n_clicks')],
+     Input('paper-trade-sell-btn', 'n_clicks'),
+     Input('paper-trade-poll', 'n_intervals')],
     [State('paper-trade-shares', 'value'),
-     State('paper-trade-symbol-store', 'data')],
+     State('paper-trade-symbol-store', 'data'),
+     State('paper-trade-pending-store', 'data')],
     prevent_initial_call=True
 )
-def execute_paper_trade(buy_clicks, sell_clicks, shares, symbol):
+def execute_paper_trade(buy_clicks, sell_clicks, n_intervals, shares, symbol, pending):
+    ctx = dash.callback_context
+    if not ctx.triggered:
+        raise dash.exceptions.PreventUpdate
+
+    triggered_id = ctx.triggered[0]['prop_id'].split('.')[0]
+
+    if triggered_id == 'paper-trade-poll':
+        if not pending:
+            return dash.no_update, dash.no_update, None, True
+        result = PaperTradingComponent.get_trade_result(pending['trade_id'])
+        action, symbol, shares = pending['action'], pending['symbol'], pending['shares']
+        if result is None:
+            if time.time() < pending.get('deadline', 0):
+                raise dash.exceptions.PreventUpdate
+            # Never resolved (e.g. the worker running it restarted); the order
+            # may still have reached the broker, so don't report a failure.
+            alert = dbc.Alert(
+                f"No confirmation for {action.upper()} {shares} shares of {symbol}. "
+                "Check Orders before retrying.",
+                color="warning",
+                dismissable=True,
+            )
+            return dash.no_update, alert, None, True
+
+        if result.get('success'):
+            order_data = result.get('data', {})
+            status = order_data.get('status', 'submitted')
+            alert = dbc.Alert(
+                f"Order {action.upper()} {shares} shares of {symbol} - Status: {status}",
+                color="success",
+                dismissable=True,
+                duration=5000,
+            )
+            notification = {'type': 'success', 'action': action, 'symbol': symbol}
+        else:
+            error = result.get('error', 'Unknown error')
+            alert = dbc.Alert(
+                f"Trade failed: {error}",
+                color="danger",
+                dismissable=True,
+                duration=5000,
+            )
+            notification = {'type': 'error', 'error': error}
+
+        return notification, alert, None, True
+
     if not symbol or not shares:
         raise dash.exceptions.PreventUpdate
 
@@ -2820,12 +2888,6 @@ def execute_paper_trade(buy_clicks, sell_clicks, shares, symbol):
     if not buy_clicks and not sell_clicks:
         raise dash.exceptions.PreventUpdate
 
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        raise dash.exceptions.PreventUpdate
-
-    triggered_id = ctx.triggered[0]['prop_id'].split('.')[0]
-
     if triggered_id == 'paper-trade-buy-btn':
         action = 'buy'
     elif triggered_id == 'paper-trade-sell-btn':
@@ -2833,29 +2895,27 @@ def execute_paper_trade(buy_clicks, sell_clicks, shares, symbol):
     else:
         raise dash.exceptions.PreventUpdate
 
-    result = PaperTradingComponent.execute_trade(symbol, action, float(shares))
-
-    if result.get('success'):
-        order_data = result.get('data', {})
-        status = order_data.get('status', 'submitted')
+    if pending:
         alert = dbc.Alert(
-            f"Order {action.upper()} {shares} shares of {symbol} - Status: {status}",
-            color="success",
+            "Previous order is still being submitted",
+            color="warning",
             dismissable=True,
-            duration=5000,
+            duration=3000,
         )
-        notification = {'type': 'success', 'action': action, 'symbol': symbol}
-    else:
-        error = result.get('error', 'Unknown error')
-        alert = dbc.Alert(
-            f"Trade failed: {error}",
-            color="danger",
-            dismissable=True,
-            duration=5000,
-        )
-        notification = {'type': 'error', 'error': error}
-
-    return notification, alert
+        return dash.no_update, alert, dash.no_update, dash.no_update
+
+    # Answer the click now; the poll picks up the broker's response.
+    trade_id = PaperTradingComponent.submit_trade(symbol, action, float(shares))
+    alert = dbc.Alert(
+        f"Submitting {action.upper()} {shares} shares of {symbol}...",
+        color="info",
+        dismissable=True,
+    )
+    pending = {
+        'trade_id': trade_id, 'action': action, 'symbol': symbol, 'shares': shares,
+        'deadline': time.time() + _PAPER_TRADE_DEADLINE,
+    }
+    return dash.no_update, alert, pending, False
 
 
 # ============================================================================
@@ -2877,8 +2937,7 @@ def update_live_trading(analyze_clicks, refresh_clicks, notification_data, symbo
     symbol = symbol.upper()
 
     try:
-        account = LiveTradingComponent.fetch_account()
-        position = LiveTradingComponent.fetch_position(symbol)
+        account, position = LiveTradingComponent.fetch_account_and_position(symbol)
 
         # Try to get cached analysis for the signal suggestion
         cached_analysis = _cache_get(f'analysis:{symbol}')
@@ -3000,6 +3059,12 @@ def update_agent_trades(active_tab, sub_tab, _notification):
     return trades_panel, show, dash.no_update, hide
 
 
+def _invalidate_broker_caches():
+    """Drop cached broker reads after an order or position changes."""
+    PortfolioDashboardComponent.invalidate_cache()
+    PaperTradingComponent.invalidate_cache()
+
+
 @app.callback(
     Output('agent-trade-notification-area', 'children'),
     [Input({'type': 'agent-approve-btn', 'index': dash.ALL}, 'n_clicks'),
@@ -3035,6 +3100,7 @@ def handle_agent_trade_actions(approve_clicks, reject_clicks, cancel_clicks, clo
     elif btn_type == 'agent-cancel-btn':
         result = AgentTradesComponent.cancel_order(index)
         if result.get('success'):
+            _invalidate_broker_caches()
             return dbc.Alert(f"Order {index[:8]}... canceled.", color="warning", dismissable=True, duration=4000)
         else:
             return dbc.Alert(f"Cancel failed: {result.get('error', 'Unknown')}", color="danger", dismissable=True, duration=5000)
@@ -3042,6 +3108,7 @@ def handle_agent_trade_actions(approve_clicks, reject_clicks, cancel_clicks, clo
     elif btn_type == 'agent-close-btn':
         result = AgentTradesComponent.close_position(index)
         if result.get('success'):
+            _invalidate_broker_caches()
             return dbc.Alert(f"Position {index} closed.", color="warning", dismissable=True, duration=4000)
         else:
             return dbc.Alert(f"Close failed: {result.get('error', 'Unknown')}", color="danger", dismissable=True, duration=5000)
@@ -3068,7 +3135,6 @@ def handle_portfolio_order_actions(cancel_clicks, close_clicks):
     if not triggered['value']:
         raise dash.exceptions.PreventUpdate
 
-    import json
     prop_id = json.loads(triggered['prop_id'].rsplit('.', 1)[0])
     btn_type = prop_id['type']
     index = prop_id['index']
@@ -3078,6 +3144,7 @@ def handle_portfolio_order_actions(cancel_clicks, close_clicks):
     if btn_type == 'order-cancel-btn':
         result = AgentTradesComponent.cancel_order(index)
         if result.get('success'):
+            _invalidate_broker_caches()
             return dbc.Alert(f"Order canceled.", color="warning", dismissable=True, duration=4000)
         else:
             return dbc.Alert(f"Cancel failed: {result.get('error', 'Unknown')}", color="danger", dismissable=True, duration=5000)
@@ -3085,6 +3152,7 @@ def handle_portfolio_order_actions(cancel_clicks, close_clicks):
     elif btn_type == 'position-close-btn':
         result = AgentTradesComponent.close_position(index)
         if result.get('success'):
+            _invalidate_broker_caches()
             return dbc.Alert(f"Position {index} closed.", color="warning", dismissable=True, duration=4000)
         else:
             return dbc.Alert(f"Close failed: {result.get('error', 'Unknown')}", color="danger", dismissable=True, duration=5000)
@@ -3100,25 +3168,21 @@ def handle_portfolio_order_actions(cancel_clicks, close_clicks):
     Output('portfolio-dashboard-section', 'children'),
     [Input('analyze-button', 'n_clicks'),
      Input('refresh-button', 'n_clicks'),
-     Input('paper-trade-notification-store', 'data'),
-     Input('bank-accounts-store', 'data'),
-     Input('transfer-history-store', 'data')],
-    [State('symbol-input', 'value')],
+     Input('paper-trade-notification-store', 'data')],
+    [State('bank-accounts-store', 'data'),
+     State('transfer-history-store', 'data'),
+     State('symbol-input', 'value')],
     prevent_initial_call=True
 )
 def update_portfolio_dashboard(analyze_clicks, refresh_clicks, notification_data, bank_accounts, transfer_history, symbol):
     if not symbol:
         return ""
 
-    try:
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            f_account = executor.submit(PortfolioDashboardComponent.fetch_account)
-            f_positions = executor.submit(PortfolioDashboardComponent.fetch_positions)
-            f_orders = executor.submit(PortfolioDashboardComponent.fetch_orders, 20)
+    if dash.callback_context.triggered[0]['prop_id'].split('.')[0] in ('refresh-button', 'paper-trade-notification-store'):
+        PortfolioDashboardComponent.invalidate_cache()
 
-            account = f_account.result()
-            positions = f_positions.result()
-            orders = f_orders.result()
+    try:
+        account, positions, orders = PortfolioDashboardComponent.fetch_all(20)
 
         return PortfolioDashboardComponent.create_dashboard(
             account, positions, orders, bank_accounts, transfer_history
@@ -3130,6 +3194,20 @@ def update_portfolio_dashboard(analyze_clicks, refresh_clicks, notification_data
         ])
 
 
+@app.callback(
+    [Output('portfolio-bank-section', 'children'),
+     Output('portfolio-transfer-history', 'children')],
+    [Input('bank-accounts-store', 'data'),
+     Input('transfer-history-store', 'data')],
+    prevent_initial_call=True
+)
+def update_portfolio_bank_sections(bank_accounts, transfer_history):
+    # Store edits only touch the bank cards and transfer history; the broker
+    # sections of the dashboard are left as rendered. Not called while the
+    # dashboard (and so these containers) is not on the page.
+    return PortfolioDashboardComponent.build_bank_sections(bank_accounts, transfer_history)
+
+
 # ============================================================================
 # TRANSFER FUNDS CALLBACKS
 # ============================================================================
@@ -3506,46 +3584,59 @@ def _health():
 # ============================================================================
 
 @app.callback(
-    Output('portfolio-analytics-section', 'children'),
+    [Output('portfolio-analytics-section', 'children'),
+     Output('analytics-data-version', 'data')],
     [Input('trading-tabs', 'active_tab'),
      Input('analyze-button', 'n_clicks'),
      Input('refresh-button', 'n_clicks')],
+    State('analytics-data-version', 'data'),
     prevent_initial_call=True
 )
-def update_analytics_tab(active_tab, analyze_clicks, refresh_clicks):
+def fetch_analytics_data(active_tab, analyze_clicks, refresh_clicks, version):
+    # Only fetch while the tab is visible; the rendered section is kept as-is
+    # when switching away, so coming back shows it immediately.
     if active_tab != 'tab-analytics':
-        return html.Div()
+        raise dash.exceptions.PreventUpdate
+
+    if dash.callback_context.triggered[0]['prop_id'].startswith('refresh-button'):
+        PortfolioAnalyticsComponent.invalidate_cache()
 
     try:
-        from concurrent.futures import ThreadPoolExecutor
+        data = PortfolioAnalyticsComponent.fetch_all()
+    except Exception as e:
+        data = {'_error': str(e)}
+    if not data:
+        raise dash.exceptions.PreventUpdate
 
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            risk_future = executor.submit(PortfolioAnalyticsComponent.fetch_risk_metrics)
-            perf_future = executor.submit(PortfolioAnalyticsComponent.fetch_performance)
-            bench_future = executor.submit(PortfolioAnalyticsComponent.fetch_benchmark)
-            drift_future = executor.submit(PortfolioAnalyticsComponent.fetch_drift)
+    # Unchanged payload (e.g. a tab switch inside the fetch TTLs): leave the
+    # section alone so the panels and their figures are not rebuilt.
+    new_version = hashlib.sha1(
+        json.dumps(data, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    if new_version == version:
+        raise dash.exceptions.PreventUpdate
+    # Rendered here rather than via a store so the raw payload (full benchmark
+    # series included) never round-trips through the browser.
+    return _render_analytics(data), new_version
 
-            risk_data = risk_future.result()
-            perf_data = perf_future.result()
-            bench_data = bench_future.result()
-            drift_data = drift_future.result()
 
-        rebal_data = None
-        if drift_data:
-            rebal_data = PortfolioAnalyticsComponent.fetch_rebalance()
+def _render_analytics(data):
+    if data.get('_error'):
+        return html.Div(f"Error loading analytics: {data['_error']}", style={"color": "#EF553B"})
 
+    try:
         return html.Div([
             html.H5("Risk Metrics", style={"color": "#636EFA", "marginTop": "8px"}),
-            PortfolioAnalyticsComponent.create_risk_panel(risk_data),
+            PortfolioAnalyticsComponent.create_risk_panel(data["risk"]),
             html.Hr(style={"borderColor": "#333"}),
             html.H5("Performance", style={"color": "#636EFA"}),
-            PortfolioAnalyticsComponent.create_performance_panel(perf_data),
+            PortfolioAnalyticsComponent.create_performance_panel(data["performance"]),
             html.Hr(style={"borderColor": "#333"}),
             html.H5("Benchmark Comparison", style={"color": "#636EFA"}),
-            PortfolioAnalyticsComponent.create_benchmark_panel(bench_data),
+            PortfolioAnalyticsComponent.create_benchmark_panel(data["benchmark"]),
             html.Hr(style={"borderColor": "#333"}),
             html.H5("Rebalancing", style={"color": "#636EFA"}),
-            PortfolioAnalyticsComponent.create_rebalance_panel(rebal_data, drift_data),
+            PortfolioAnalyticsComponent.create_rebalance_panel(data["rebalance"], data["drift"]),
         ])
     except Exception as e:
         return html.Div(f"Error loading analytics: {e}", style={"color": "#EF553B"})
@@ -3603,6 +3694,16 @@ def update_ml_insights(ml_data, symbol):
         return html.Div(f"Error loading ML insights: {e}", style={"color": "#EF553B"})
 
 
+# Trade signal badges only depend on two fields of the store, so build them in
+# the browser; create_panel leaves their span empty. Dash also fires this when
+# update_ml_insights inserts a fresh span.
+app.clientside_callback(
+    ClientsideFunction(namespace='ml', function_name='updateTradeSignalBadge'),
+    Output('ml-trade-signal-badges', 'children'),
+    Input('ml-data-store', 'data'),
+)
+
+
 # ============================================================================
 # SCREENER CALLBACKS
 # ============================================================================
@@ -0,0 +1,27 @@
+/* InvestIQ ML clientside callbacks */
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    ml: {
+        /* Rebuild the ML Trade Signal header badges from ml-data-store. */
+        updateTradeSignalBadge: function(mlData) {
+            var ts = mlData && mlData.trade_signal;
+            if (!ts || ts._unavailable) {
+                return window.dash_clientside.no_update;
+            }
+            var rec = ts.recommendation || "SKIP";
+
+            function badge(text, color, style) {
+                return {
+                    namespace: "dash_bootstrap_components",
+                    type: "Badge",
+                    props: {children: text, color: color, className: "ms-2", style: style},
+                };
+            }
+
+            return [
+                badge(rec, rec === "EXECUTE" ? "success" : "danger"),
+                badge(ts.backend || "unknown", "info", {fontSize: "0.65rem"}),
+            ];
+        }
+    }
+});
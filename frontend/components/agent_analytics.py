@@ -3,9 +3,8 @@ import requests
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 from dash import dcc, html
-from concurrent.futures import ThreadPoolExecutor
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import API_BASE, get_headers, API_TIMEOUT, EXECUTOR
 
 CHART_LAYOUT = dict(
     template="plotly_dark",
@@ -51,21 +50,20 @@ class AgentAnalyticsComponent:
     def create_panel():
         """Build the analytics dashboard from analysis_features data."""
         # Fetch all analytics data in parallel (6 requests)
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            futures = {
-                'summary': executor.submit(_fetch, "/api/agent/analytics/analysis-summary"),
-                'signal_dist': executor.submit(_fetch, "/api/agent/analytics/signal-distribution"),
-                'regime_dist': executor.submit(_fetch, "/api/agent/analytics/regime-distribution"),
-                'conviction_dist': executor.submit(_fetch, "/api/agent/analytics/conviction-distribution"),
-                'top_symbols': executor.submit(_fetch, "/api/agent/analytics/top-symbols"),
-                'history': executor.submit(_fetch, "/api/agent/analytics/analysis-history", {"days": 30}),
-            }
-            summary = futures['summary'].result() or {}
-            signal_dist = futures['signal_dist'].result() or []
-            regime_dist = futures['regime_dist'].result() or []
-            conviction_dist = futures['conviction_dist'].result() or []
-            top_symbols = futures['top_symbols'].result() or []
-            history = futures['history'].result() or []
+        futures = {
+            'summary': EXECUTOR.submit(_fetch, "/api/agent/analytics/analysis-summary"),
+            'signal_dist': EXECUTOR.submit(_fetch, "/api/agent/analytics/signal-distribution"),
+            'regime_dist': EXECUTOR.submit(_fetch, "/api/agent/analytics/regime-distribution"),
+            'conviction_dist': EXECUTOR.submit(_fetch, "/api/agent/analytics/conviction-distribution"),
+            'top_symbols': EXECUTOR.submit(_fetch, "/api/agent/analytics/top-symbols"),
+            'history': EXECUTOR.submit(_fetch, "/api/agent/analytics/analysis-history", {"days": 30}),
+        }
+        summary = futures['summary'].result() or {}
+        signal_dist = futures['signal_dist'].result() or []
+        regime_dist = futures['regime_dist'].result() or []
+        conviction_dist = futures['conviction_dist'].result() or []
+        top_symbols = futures['top_symbols'].result() or []
+        history = futures['history'].result() or []
 
         total = summary.get("total_analyses", 0)
         if total == 0:
@@ -4,7 +4,7 @@ import requests
 import dash_bootstrap_components as dbc
 from dash import html
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import API_BASE, get_headers, API_TIMEOUT, parse_json
 
 
 class AgentTradesComponent:
@@ -17,7 +17,7 @@ class AgentTradesComponent:
                 headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
-            data = response.json()
+            data = parse_json(response)
             return data.get("data", []) if data.get("success") else []
         except Exception as e:
             print(f"Error fetching agent trades: {e}")
@@ -32,7 +32,7 @@ class AgentTradesComponent:
                 headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
-            data = response.json()
+            data = parse_json(response)
             return data.get("data") if data.get("success") else None
         except Exception:
             return None
@@ -47,7 +47,7 @@ class AgentTradesComponent:
                 headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
-            return response.json()
+            return parse_json(response)
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -64,7 +64,7 @@ class AgentTradesComponent:
                 headers=headers,
                 timeout=API_TIMEOUT,
             )
-            return response.json()
+            return parse_json(response)
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -81,7 +81,7 @@ class AgentTradesComponent:
                 headers=headers,
                 timeout=API_TIMEOUT,
             )
-            return response.json()
+            return parse_json(response)
         except Exception as e:
             return {"success": False, "error": str(e)}
 
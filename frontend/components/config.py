@@ -1,5 +1,21 @@
 """Shared API configuration for all components."""
+import atexit
+import functools
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    import json
+    _json_loads = json.loads
 
 API_BASE = os.getenv("API_BASE_URL", "http://localhost:3000")
 API_KEY = os.getenv("API_KEY", "") or os.getenv("API_KEYS", "").split(",")[0].strip()
@@ -20,3 +36,87 @@ if not API_KEY:
 
 def get_headers():
     return {"X-API-Key": API_KEY, "Content-Type": "application/json"}
+
+
+def parse_json(response):
+    """Decode a response body, using orjson when it is installed."""
+    return _json_loads(response.content)
+
+
+# Shared keep-alive session: components reuse pooled connections to the API
+# instead of paying a TCP (and TLS) handshake on every call.
+# Idempotent GETs are retried on connection failures and gateway errors only:
+# POSTs (trades, transfers) must never be resent, read timeouts are not
+# retried so a slow backend can't multiply API_TIMEOUT, and 503 is left alone
+# because the ML routes use it to mean "model not loaded".
+_RETRY = Retry(
+    total=2, connect=2, read=0, status=2,
+    backoff_factor=0.1,
+    status_forcelist=(502, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+)
+# requests speaks HTTP/1.1 only, so every in-flight call holds its own socket:
+# the per-host pool must cover the fetch executor plus Dash's request threads.
+# (HTTP/2 multiplexing would mean httpx[http2]; the bundle routes already
+# collapse the widest bursts into single requests instead.)
+# One analyze click fans out ~20 reads across callbacks, all on EXECUTOR.
+_FETCH_WORKERS = 16
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=4 * _FETCH_WORKERS, max_retries=_RETRY)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+# Auth headers are fixed for the process lifetime, so they're set once here;
+# requests merges any per-request headers over these defaults.
+SESSION.headers.update(get_headers())
+
+# Shared pool for overlapping independent API reads within one callback.
+# Tasks must not wait on other EXECUTOR futures, or a full pool deadlocks.
+EXECUTOR = ThreadPoolExecutor(max_workers=_FETCH_WORKERS, thread_name_prefix="api-fetch")
+# Drop queued reads at exit instead of running them against a dying process.
+atexit.register(EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+
+def ttl_cache(ttl: float, maxsize: int = 64, stale: float = 0):
+    """Reuse a fetcher's result for ``ttl`` seconds per set of arguments.
+
+    Coalesces the repeated reads a single dashboard render makes against the
+    same endpoint. ``None`` (the fetchers' failure value) is never cached;
+    with ``stale`` > 0, a failed refresh instead returns the expired result
+    if it is no more than ``stale`` seconds past its TTL.
+    Callers share the cached object and must not mutate it. The wrapper
+    exposes ``cache_clear()`` for invalidation after writes.
+    """
+    def decorator(fn):
+        cache = {}
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(key)
+                if hit is not None and now - hit[0] < ttl:
+                    return hit[1]
+
+            value = fn(*args, **kwargs)
+            if value is None:
+                if hit is not None and now - hit[0] < ttl + stale:
+                    return hit[1]
+            else:
+                with lock:
+                    cache.pop(key, None)
+                    if len(cache) >= maxsize:
+                        cache.pop(next(iter(cache)))
+                    cache[key] = (now, value)
+            return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,82 @@
+"""Content-addressed memoization for pure Plotly figure builders."""
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+try:
+    import orjson
+    _ORJSON_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Shared placeholders for builders with nothing to plot. Treat as read-only.
+EMPTY_FIG_200 = {"data": [], "layout": {"height": 200, "paper_bgcolor": "rgba(0,0,0,0)"}}
+EMPTY_FIG_220 = {"data": [], "layout": {"height": 220, "paper_bgcolor": "rgba(0,0,0,0)"}}
+
+
+@functools.lru_cache(maxsize=1)
+def dark_template():
+    """Resolved plotly_dark template for raw figure dicts.
+
+    Plotly.js cannot look templates up by name, so figures built without
+    ``go.Figure`` must embed the template itself.
+    """
+    import plotly.io as pio
+    return pio.templates["plotly_dark"].to_plotly_json()
+
+
+def _digest(args, kwargs) -> bytes:
+    """Stable digest of a builder's inputs (dict key order does not matter).
+
+    With orjson, NumPy arrays are hashed by their full contents; the stdlib
+    path falls back to ``str()``, which elides the middle of large arrays.
+    """
+    if orjson is not None:
+        payload = orjson.dumps([args, kwargs], default=str, option=_ORJSON_OPTS)
+    else:
+        payload = json.dumps([args, kwargs], sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def memoize_figure(maxsize: int = 256):
+    """Cache a figure builder's output keyed by a hash of its arguments.
+
+    The builder must be a pure function of its inputs. Results are stored as
+    plain figure dicts (``dcc.Graph`` accepts them directly) and each call
+    returns a shallow copy, so callers can replace top-level keys without
+    touching the cached entry. Entries live until evicted or process restart.
+    """
+    def decorator(fn):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = _digest(args, kwargs)
+            with lock:
+                fig = cache.get(key)
+                if fig is not None:
+                    cache.move_to_end(key)
+                    return dict(fig)
+
+            fig = fn(*args, **kwargs)
+            # Duck-typed so importing this module does not pull in plotly.
+            if not isinstance(fig, dict):
+                fig = fig.to_dict()
+
+            with lock:
+                cache[key] = fig
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return dict(fig)
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -1,10 +1,13 @@
 """Live Trading Panel Component for main dashboard integration."""
+import logging
 import os
 import requests
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import API_BASE, get_headers, API_TIMEOUT, SESSION, EXECUTOR, parse_json
+
+_logger = logging.getLogger(__name__)
 
 
 class LiveTradingComponent:
@@ -12,30 +15,28 @@ class LiveTradingComponent:
     def fetch_account():
         """Fetch Alpaca live trading account info."""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{API_BASE}/api/broker/account",
-                headers=get_headers(),
                 timeout=API_TIMEOUT
             )
-            data = response.json()
+            data = parse_json(response)
             return data.get("data") if data.get("success") else None
         except Exception as e:
-            print(f"Error fetching broker account: {e}")
+            _logger.warning("Error fetching broker account: %s", e)
             return None
 
     @staticmethod
     def fetch_positions():
         """Fetch all Alpaca broker positions."""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{API_BASE}/api/broker/positions",
-                headers=get_headers(),
                 timeout=API_TIMEOUT
             )
-            data = response.json()
+            data = parse_json(response)
             return data.get("data", []) if data.get("success") else []
         except Exception as e:
-            print(f"Error fetching broker positions: {e}")
+            _logger.warning("Error fetching broker positions: %s", e)
             return []
 
     @staticmethod
@@ -47,6 +48,13 @@ class LiveTradingComponent:
                 return pos
         return None
 
+    @staticmethod
+    def fetch_account_and_position(symbol):
+        """Fetch account and one symbol's position concurrently; returns (account, position)."""
+        f_account = EXECUTOR.submit(LiveTradingComponent.fetch_account)
+        f_position = EXECUTOR.submit(LiveTradingComponent.fetch_position, symbol)
+        return f_account.result(), f_position.result()
+
     @staticmethod
     def get_trade_headers():
         """Get headers for live trade execution (always sends X-Live-Trading-Key)."""
@@ -81,8 +89,8 @@ class LiveTradingComponent:
             )
             if response.status_code != 200:
                 return {"success": False, "error": f"HTTP {response.status_code}: {response.text[:200]}"}
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return parse_json(response)
+        except (requests.exceptions.RequestException, ValueError) as e:
             return {"success": False, "error": str(e)}
 
     @staticmethod
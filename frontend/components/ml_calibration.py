@@ -8,9 +8,8 @@ import plotly.graph_objects as go
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 from typing import Dict, Optional
-import requests
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import API_BASE, API_TIMEOUT, SESSION
 
 
 class MLCalibrationComponent:
@@ -18,9 +17,8 @@ class MLCalibrationComponent:
     @staticmethod
     def fetch_data(symbol: str) -> Optional[Dict]:
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{API_BASE}/api/ml/calibration/{symbol}",
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
             if resp.status_code == 200:
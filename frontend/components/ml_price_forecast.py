@@ -4,13 +4,22 @@ ML Price Forecast Component
 PatchTST direction prediction with confidence bands.
 """
 
+import numpy as np
 import plotly.graph_objects as go
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 from typing import Dict, Optional
-import requests
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import API_BASE, API_TIMEOUT, SESSION
+from components.figure_cache import memoize_figure, EMPTY_FIG_220
+
+# Fields read by the chart builders and panel; anything else the API sends
+# would only bloat the ml-data-store payload.
+_FIELDS = ("predicted_prices", "current_price", "direction",
+           "probabilities", "confidence", "backend")
+_DIRECTION_RGB = {"up": (0, 204, 150), "down": (239, 85, 59), "neutral": (99, 110, 250)}
+_DIRECTION_COLORS = {d: "#{:02x}{:02x}{:02x}".format(*rgb) for d, rgb in _DIRECTION_RGB.items()}
+_FILL_RGBA = {d: f"rgba({r},{g},{b},0.1)" for d, (r, g, b) in _DIRECTION_RGB.items()}
 
 
 class MLPriceForecastComponent:
@@ -18,72 +27,76 @@ class MLPriceForecastComponent:
     @staticmethod
     def fetch_data(symbol: str, horizon: int = 5, days: int = 90) -> Optional[Dict]:
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{API_BASE}/api/ml/price-forecast/{symbol}",
                 params={"horizon": horizon, "days": days},
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
             if resp.status_code == 200:
                 data = resp.json()
                 if data.get("success"):
-                    return data.get("data")
+                    return MLPriceForecastComponent._project(data.get("data"))
             if resp.status_code == 503:
-                body = resp.json()
-                return {"_unavailable": True, "_message": body.get("error", "Model not loaded")}
+                try:
+                    message = resp.json().get("error", "Model not loaded")
+                except (ValueError, AttributeError):
+                    message = "Model not loaded"
+                return {"_unavailable": True, "_message": message}
             return None
         except Exception as e:
             print(f"ML price forecast error: {e}")
             return None
 
     @staticmethod
-    def create_forecast_chart(data: Dict) -> go.Figure:
+    def _project(payload: Optional[Dict]) -> Optional[Dict]:
+        if not payload:
+            return payload
+        return {k: payload[k] for k in _FIELDS if k in payload}
+
+    @staticmethod
+    @memoize_figure()
+    def create_forecast_chart(data: Dict) -> Dict:
         predicted = data.get("predicted_prices", [])
         current = data.get("current_price")
         direction = data.get("direction", "neutral")
 
         if not predicted or current is None:
-            fig = go.Figure()
-            fig.update_layout(height=220, paper_bgcolor="rgba(0,0,0,0)")
-            return fig
+            return EMPTY_FIG_220
 
-        color_map = {"up": "#00cc96", "down": "#ef553b", "neutral": "#636efa"}
-        line_color = color_map.get(direction, "#636efa")
+        line_color = _DIRECTION_COLORS.get(direction, _DIRECTION_COLORS["neutral"])
 
         # Build x-axis: day 0 = current, day 1..N = forecast
-        x_vals = list(range(len(predicted) + 1))
-        y_vals = [current] + predicted
+        p = np.asarray(predicted, dtype=np.float64)
+        x_vals = np.arange(p.size + 1)
+        y_vals = np.concatenate(([current], p))
 
         fig = go.Figure()
 
         # Current price point
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=[0], y=[current], mode="markers",
             marker=dict(size=10, color="white"),
             name="Current",
         ))
 
         # Forecast line (dashed)
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=x_vals, y=y_vals, mode="lines+markers",
             line=dict(color=line_color, width=2, dash="dash"),
             marker=dict(size=5),
             name=f"Forecast ({direction})",
         ))
 
-        # Confidence band (simple +/- 2% per step)
-        upper = [current]
-        lower = [current]
-        for i, p in enumerate(predicted, 1):
-            band = current * 0.02 * i
-            upper.append(p + band)
-            lower.append(p - band)
+        # Confidence band (simple +/- 2% per step); x_vals * 0.02 is 0 at day 0
+        band = current * 0.02 * x_vals
+        upper = y_vals + band
+        lower = y_vals - band
 
         fig.add_trace(go.Scatter(
-            x=x_vals + x_vals[::-1],
-            y=upper + lower[::-1],
+            x=np.concatenate((x_vals, x_vals[::-1])),
+            y=np.concatenate((upper, lower[::-1])),
             fill="toself",
-            fillcolor=f"rgba({','.join(str(int(c)) for c in go.colors.hex_to_rgb(line_color))},0.1)" if hasattr(go.colors, 'hex_to_rgb') else "rgba(99,110,250,0.1)",
+            fillcolor=_FILL_RGBA.get(direction, _FILL_RGBA["neutral"]),
             line=dict(width=0),
             showlegend=False,
         ))
@@ -100,7 +113,8 @@ class MLPriceForecastComponent:
         return fig
 
     @staticmethod
-    def create_direction_bars(data: Dict) -> go.Figure:
+    @memoize_figure()
+    def create_direction_bars(data: Dict) -> Dict:
         probs = data.get("probabilities", {})
         up = probs.get("up", 0)
         down = probs.get("down", 0)
@@ -124,16 +138,16 @@ class MLPriceForecastComponent:
 
     @staticmethod
     def create_panel(data: Optional[Dict], symbol: str) -> dbc.Card:
-        if not data:
+        if data and data.get("_unavailable"):
             return dbc.Card(dbc.CardBody([
                 html.H6("ML Price Forecast", className="card-title"),
-                html.P("No forecast data available", className="text-muted small"),
+                html.P(data.get("_message", "Model not loaded"), className="text-warning small"),
             ]), className="h-100")
 
-        if data.get("_unavailable"):
+        if not data or not (data.get("predicted_prices") or data.get("probabilities")):
             return dbc.Card(dbc.CardBody([
                 html.H6("ML Price Forecast", className="card-title"),
-                html.P(data.get("_message", "Model not loaded"), className="text-warning small"),
+                html.P("No forecast data available", className="text-muted small"),
             ]), className="h-100")
 
         direction = data.get("direction", "neutral")
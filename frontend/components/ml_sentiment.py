@@ -8,9 +8,16 @@ import plotly.graph_objects as go
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 from typing import Dict, Optional, List
-import requests
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import API_BASE, API_TIMEOUT, SESSION
+from components.figure_cache import memoize_figure, EMPTY_FIG_200
+
+# Fields read by the chart builders, panel and app.py summary cards.
+_FIELDS = ("score", "overall_sentiment", "positive_ratio", "negative_ratio",
+           "neutral_ratio", "article_count", "confidence", "backend")
+_ARTICLE_FIELDS = ("headline", "positive", "negative", "neutral")
+_SENTIMENT_COLORS = {"positive": "#00cc96", "negative": "#ef553b", "neutral": "#636efa"}
+_PIE_COLORS = (_SENTIMENT_COLORS["positive"], _SENTIMENT_COLORS["negative"], _SENTIMENT_COLORS["neutral"])
 
 
 class MLSentimentComponent:
@@ -18,30 +25,44 @@ class MLSentimentComponent:
     @staticmethod
     def fetch_data(symbol: str) -> Optional[Dict]:
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{API_BASE}/api/ml/sentiment/{symbol}",
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
             if resp.status_code == 200:
                 data = resp.json()
                 if data.get("success"):
-                    return data.get("data")
+                    return MLSentimentComponent._project(data.get("data"))
             if resp.status_code == 503:
-                body = resp.json()
-                return {"_unavailable": True, "_message": body.get("error", "Model not loaded")}
+                try:
+                    message = resp.json().get("error", "Model not loaded")
+                except (ValueError, AttributeError):
+                    message = "Model not loaded"
+                return {"_unavailable": True, "_message": message}
             return None
         except Exception as e:
             print(f"ML sentiment error: {e}")
             return None
 
     @staticmethod
-    def create_sentiment_gauge(data: Dict) -> go.Figure:
+    def _project(payload: Optional[Dict]) -> Optional[Dict]:
+        if not payload:
+            return payload
+        out = {k: payload[k] for k in _FIELDS if k in payload}
+        if "articles" in payload:
+            out["articles"] = [
+                {k: a[k] for k in _ARTICLE_FIELDS if k in a}
+                for a in payload["articles"] or []
+            ]
+        return out
+
+    @staticmethod
+    @memoize_figure()
+    def create_sentiment_gauge(data: Dict) -> Dict:
         score = data.get("score", 0)
         overall = data.get("overall_sentiment", "neutral")
 
-        color_map = {"positive": "#00cc96", "negative": "#ef553b", "neutral": "#636efa"}
-        color = color_map.get(overall, "#636efa")
+        color = _SENTIMENT_COLORS.get(overall, _SENTIMENT_COLORS["neutral"])
 
         fig = go.Figure(go.Indicator(
             mode="gauge+number",
@@ -63,7 +84,8 @@ class MLSentimentComponent:
         return fig
 
     @staticmethod
-    def create_distribution_pie(data: Dict) -> go.Figure:
+    @memoize_figure()
+    def create_distribution_pie(data: Dict) -> Dict:
         pos = data.get("positive_ratio", 0)
         neg = data.get("negative_ratio", 0)
         neu = data.get("neutral_ratio", 0)
@@ -71,7 +93,7 @@ class MLSentimentComponent:
         fig = go.Figure(go.Pie(
             values=[pos, neg, neu],
             labels=["Positive", "Negative", "Neutral"],
-            marker=dict(colors=["#00cc96", "#ef553b", "#636efa"]),
+            marker=dict(colors=_PIE_COLORS),
             hole=0.4,
             textinfo="percent+label",
             textfont=dict(size=10),
@@ -82,50 +104,56 @@ class MLSentimentComponent:
         return fig
 
     @staticmethod
-    def create_article_bars(articles: List[Dict]) -> go.Figure:
+    @memoize_figure()
+    def create_article_bars(articles: List[Dict]) -> Dict:
         if not articles:
-            fig = go.Figure()
-            fig.update_layout(height=200, paper_bgcolor="rgba(0,0,0,0)")
-            return fig
+            return EMPTY_FIG_200
 
         # Show up to 10 articles
         articles = articles[:10]
-        headlines = [a.get("headline", "")[:40] + "..." for a in articles]
-        pos_vals = [a.get("positive", 0) for a in articles]
-        neg_vals = [a.get("negative", 0) for a in articles]
-        neu_vals = [a.get("neutral", 0) for a in articles]
-
-        fig = go.Figure()
-        fig.add_trace(go.Bar(y=headlines, x=pos_vals, name="Positive",
-                             orientation="h", marker_color="#00cc96"))
-        fig.add_trace(go.Bar(y=headlines, x=neg_vals, name="Negative",
-                             orientation="h", marker_color="#ef553b"))
-        fig.add_trace(go.Bar(y=headlines, x=neu_vals, name="Neutral",
-                             orientation="h", marker_color="#636efa"))
-        fig.update_layout(
-            barmode="stack",
-            title="Per-Article Sentiment",
-            height=max(200, len(articles) * 25 + 60),
-            margin=dict(t=35, b=10, l=200, r=10),
-            paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
-            font_color="white", font_size=9,
-            yaxis={"autorange": "reversed"},
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, font=dict(size=9)),
-        )
-        return fig
+        headlines, pos_vals, neg_vals, neu_vals = [], [], [], []
+        for a in articles:
+            headlines.append(a.get("headline", "")[:40] + "...")
+            pos_vals.append(a.get("positive", 0))
+            neg_vals.append(a.get("negative", 0))
+            neu_vals.append(a.get("neutral", 0))
+
+        # Plain dict traces: skips graph_objects validation on every build
+        return {
+            "data": [
+                {"type": "bar", "orientation": "h", "y": headlines, "x": vals,
+                 "name": name, "marker": {"color": color}}
+                for vals, name, color in (
+                    (pos_vals, "Positive", _SENTIMENT_COLORS["positive"]),
+                    (neg_vals, "Negative", _SENTIMENT_COLORS["negative"]),
+                    (neu_vals, "Neutral", _SENTIMENT_COLORS["neutral"]),
+                )
+            ],
+            "layout": {
+                "barmode": "stack",
+                "title": {"text": "Per-Article Sentiment"},
+                "height": max(200, len(articles) * 25 + 60),
+                "margin": {"t": 35, "b": 10, "l": 200, "r": 10},
+                "paper_bgcolor": "rgba(0,0,0,0)", "plot_bgcolor": "rgba(0,0,0,0)",
+                "font": {"color": "white", "size": 9},
+                "yaxis": {"autorange": "reversed"},
+                "legend": {"orientation": "h", "yanchor": "bottom", "y": 1.02,
+                           "font": {"size": 9}},
+            },
+        }
 
     @staticmethod
     def create_panel(data: Optional[Dict], symbol: str) -> dbc.Card:
-        if not data:
+        if data and data.get("_unavailable"):
             return dbc.Card(dbc.CardBody([
                 html.H6("ML Sentiment (FinBERT)", className="card-title"),
-                html.P("No sentiment data available", className="text-muted small"),
+                html.P(data.get("_message", "Model not loaded"), className="text-warning small"),
             ]), className="h-100")
 
-        if data.get("_unavailable"):
+        if not data or not (data.get("articles") or data.get("article_count")):
             return dbc.Card(dbc.CardBody([
                 html.H6("ML Sentiment (FinBERT)", className="card-title"),
-                html.P(data.get("_message", "Model not loaded"), className="text-warning small"),
+                html.P("No sentiment data available", className="text-muted small"),
             ]), className="h-100")
 
         articles = data.get("articles", [])
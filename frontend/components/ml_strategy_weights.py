@@ -4,60 +4,91 @@ ML Strategy Weights Component
 Bayesian strategy weights, credible intervals, and stats.
 """
 
+import numpy as np
 import plotly.graph_objects as go
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 from typing import Dict, Optional, List
-import requests
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import API_BASE, API_TIMEOUT, SESSION
+from components.figure_cache import memoize_figure, EMPTY_FIG_220
+
+# Per-strategy fields read by the forest plot and stats table; drops bulky
+# extras such as posterior_samples.
+_STRATEGY_FIELDS = ("name", "win_rate", "credible_interval", "total_samples", "weight")
+# Validator and body of the last 200 response; the endpoint is global, so most
+# refreshes can be answered with a 304 when the API sends an ETag.
+_ETAG: Optional[str] = None
+_LAST_BODY: Optional[Dict] = None
+_WEIGHT_PALETTE = ("#636efa", "#00cc96", "#ef553b", "#ffa15a", "#ab63fa")
 
 
 class MLStrategyWeightsComponent:
 
     @staticmethod
     def fetch_data() -> Optional[Dict]:
+        global _ETAG, _LAST_BODY
         try:
-            resp = requests.get(
+            headers = None
+            if _ETAG and _LAST_BODY is not None:
+                headers = {"If-None-Match": _ETAG}
+            resp = SESSION.get(
                 f"{API_BASE}/api/ml/strategy-weights",
-                headers=get_headers(),
+                headers=headers,
                 timeout=API_TIMEOUT,
             )
+            if resp.status_code == 304 and _LAST_BODY is not None:
+                return _LAST_BODY
             if resp.status_code == 200:
                 data = resp.json()
                 if data.get("success"):
-                    return data.get("data")
+                    body = MLStrategyWeightsComponent._project(data.get("data"))
+                    _ETAG = resp.headers.get("ETag")
+                    _LAST_BODY = body if _ETAG else None
+                    return body
             if resp.status_code == 503:
-                body = resp.json()
-                return {"_unavailable": True, "_message": body.get("error", "Model not loaded")}
+                try:
+                    message = resp.json().get("error", "Model not loaded")
+                except (ValueError, AttributeError):
+                    message = "Model not loaded"
+                return {"_unavailable": True, "_message": message}
             return None
         except Exception as e:
             print(f"ML strategy weights error: {e}")
             return None
 
     @staticmethod
-    def create_weights_bar(data: Dict) -> go.Figure:
+    def _project(payload: Optional[Dict]) -> Optional[Dict]:
+        if not payload:
+            return payload
+        out = {k: payload[k] for k in ("weights", "backend") if k in payload}
+        if "strategies" in payload:
+            out["strategies"] = [
+                {k: s[k] for k in _STRATEGY_FIELDS if k in s}
+                for s in payload["strategies"] or []
+            ]
+        return out
+
+    @staticmethod
+    @memoize_figure()
+    def create_weights_bar(data: Dict) -> Dict:
         weights = data.get("weights", {})
         if not weights:
-            fig = go.Figure()
-            fig.update_layout(height=220, paper_bgcolor="rgba(0,0,0,0)")
-            return fig
+            return EMPTY_FIG_220
 
         names = list(weights.keys())
-        values = [weights[n] * 100 for n in names]
+        values = np.fromiter(weights.values(), dtype=np.float64, count=len(names)) * 100
         display_names = [n.replace("_", " ").title() for n in names]
 
-        colors = ["#636efa", "#00cc96", "#ef553b", "#ffa15a", "#ab63fa"]
-
         fig = go.Figure(go.Bar(
             x=display_names, y=values,
-            marker_color=colors[:len(names)],
-            text=[f"{v:.1f}%" for v in values],
+            marker_color=_WEIGHT_PALETTE[:len(names)],
+            text=[f"{v:.1f}%" for v in values.tolist()],
             textposition="outside",
         ))
         fig.update_layout(
             title="Engine Weights",
-            yaxis=dict(range=[0, max(values) * 1.3 if values else 100], title="%"),
+            yaxis=dict(range=[0, float(values.max()) * 1.3], title="%"),
             height=220, margin=dict(t=35, b=30, l=40, r=10),
             paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
             font_color="white",
@@ -65,12 +96,11 @@ class MLStrategyWeightsComponent:
         return fig
 
     @staticmethod
-    def create_forest_plot(strategies: List[Dict]) -> go.Figure:
+    @memoize_figure()
+    def create_forest_plot(strategies: List[Dict]) -> Dict:
         """Forest plot showing win rates with credible intervals."""
         if not strategies:
-            fig = go.Figure()
-            fig.update_layout(height=220, paper_bgcolor="rgba(0,0,0,0)")
-            return fig
+            return EMPTY_FIG_220
 
         names = []
         win_rates = []
@@ -92,7 +122,7 @@ class MLStrategyWeightsComponent:
         error_low = [wr - lo for wr, lo in zip(win_rates, ci_lows)]
         error_high = [hi - wr for wr, hi in zip(win_rates, ci_highs)]
 
-        fig = go.Figure(go.Scatter(
+        fig = go.Figure(go.Scattergl(
             x=win_rates, y=names,
             mode="markers",
             marker=dict(size=10, color="#636efa"),
@@ -146,16 +176,16 @@ class MLStrategyWeightsComponent:
 
     @staticmethod
     def create_panel(data: Optional[Dict]) -> dbc.Card:
-        if not data:
+        if data and data.get("_unavailable"):
             return dbc.Card(dbc.CardBody([
                 html.H6("ML Strategy Weights", className="card-title"),
-                html.P("No strategy data available", className="text-muted small"),
+                html.P(data.get("_message", "Model not loaded"), className="text-warning small"),
             ]), className="h-100")
 
-        if data.get("_unavailable"):
+        if not data or not (data.get("weights") or data.get("strategies")):
             return dbc.Card(dbc.CardBody([
                 html.H6("ML Strategy Weights", className="card-title"),
-                html.P(data.get("_message", "Model not loaded"), className="text-warning small"),
+                html.P("No strategy data available", className="text-muted small"),
             ]), className="h-100")
 
         strategies = data.get("strategies", [])
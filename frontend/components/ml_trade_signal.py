@@ -4,13 +4,20 @@ ML Trade Signal Component
 Meta-model prediction: probability gauge, feature importance, recommendation badge.
 """
 
+import heapq
+
 import plotly.graph_objects as go
 import dash_bootstrap_components as dbc
 from dash import html
 from typing import Dict, Optional
-import requests
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import API_BASE, API_TIMEOUT, SESSION
+from components.figure_cache import memoize_figure, EMPTY_FIG_200
+
+# Fields read by the chart builders, panel and app.py signal card.
+_FIELDS = ("probability", "recommendation", "expected_return", "backend")
+# The feature chart only ever shows this many features.
+_TOP_FEATURES = 8
 
 
 class MLTradeSignalComponent:
@@ -18,25 +25,40 @@ class MLTradeSignalComponent:
     @staticmethod
     def fetch_data(symbol: str) -> Optional[Dict]:
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{API_BASE}/api/ml/trade-signal/{symbol}",
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
             if resp.status_code == 200:
                 data = resp.json()
                 if data.get("success"):
-                    return data.get("data")
+                    return MLTradeSignalComponent._project(data.get("data"))
             if resp.status_code == 503:
-                body = resp.json()
-                return {"_unavailable": True, "_message": body.get("error", "Model not loaded")}
+                try:
+                    message = resp.json().get("error", "Model not loaded")
+                except (ValueError, AttributeError):
+                    message = "Model not loaded"
+                return {"_unavailable": True, "_message": message}
             return None
         except Exception as e:
             print(f"ML trade signal error: {e}")
             return None
 
     @staticmethod
-    def create_probability_gauge(data: Dict) -> go.Figure:
+    def _project(payload: Optional[Dict]) -> Optional[Dict]:
+        if not payload:
+            return payload
+        out = {k: payload[k] for k in _FIELDS if k in payload}
+        if "features_used" in payload:
+            features = payload["features_used"] or {}
+            out["features_used"] = dict(heapq.nlargest(
+                _TOP_FEATURES, features.items(), key=lambda x: abs(x[1]),
+            ))
+        return out
+
+    @staticmethod
+    @memoize_figure()
+    def create_probability_gauge(data: Dict) -> Dict:
         prob = data.get("probability", 0.5)
         rec = data.get("recommendation", "SKIP")
 
@@ -67,14 +89,13 @@ class MLTradeSignalComponent:
         return fig
 
     @staticmethod
-    def create_feature_chart(data: Dict) -> go.Figure:
+    @memoize_figure()
+    def create_feature_chart(data: Dict) -> Dict:
         features = data.get("features_used", {})
         # Show top 8 features by absolute value
-        sorted_feats = sorted(features.items(), key=lambda x: abs(x[1]), reverse=True)[:8]
+        sorted_feats = heapq.nlargest(_TOP_FEATURES, features.items(), key=lambda x: abs(x[1]))
         if not sorted_feats:
-            fig = go.Figure()
-            fig.update_layout(height=200, paper_bgcolor="rgba(0,0,0,0)")
-            return fig
+            return EMPTY_FIG_200
 
         names = [f[0].replace("_", " ").title() for f in sorted_feats]
         values = [f[1] for f in sorted_feats]
@@ -94,31 +115,28 @@ class MLTradeSignalComponent:
 
     @staticmethod
     def create_panel(data: Optional[Dict], symbol: str) -> dbc.Card:
-        if not data:
+        if data and data.get("_unavailable"):
             return dbc.Card(dbc.CardBody([
                 html.H6("ML Trade Signal", className="card-title"),
-                html.P("No ML signal data available", className="text-muted small"),
+                html.P(data.get("_message", "Model not loaded"), className="text-warning small"),
             ]), className="h-100")
 
-        if data.get("_unavailable"):
+        if not data or ("probability" not in data and not data.get("features_used")):
             return dbc.Card(dbc.CardBody([
                 html.H6("ML Trade Signal", className="card-title"),
-                html.P(data.get("_message", "Model not loaded"), className="text-warning small"),
+                html.P("No ML signal data available", className="text-muted small"),
             ]), className="h-100")
 
-        rec = data.get("recommendation", "SKIP")
         exp_ret = data.get("expected_return", 0)
-        backend = data.get("backend", "unknown")
-
-        rec_color = "success" if rec == "EXECUTE" else "danger"
 
         from dash import dcc
         return dbc.Card([
             dbc.CardHeader([
                 html.H6([
                     "ML Trade Signal ",
-                    dbc.Badge(rec, color=rec_color, className="ms-2"),
-                    dbc.Badge(backend, color="info", className="ms-2", style={"fontSize": "0.65rem"}),
+                    # Badges are filled in the browser from ml-data-store
+                    # (assets/ml_clientside.js), not rendered here.
+                    html.Span(id="ml-trade-signal-badges"),
                 ], className="mb-0"),
             ]),
             dbc.CardBody([
@@ -1,27 +1,87 @@
 """Options Flow Component"""
-import requests
-import plotly.graph_objects as go
+import bisect
+import copy
+import functools
+import logging
+
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import (
+    API_BASE, API_TIMEOUT, SESSION, EXECUTOR, parse_json, ttl_cache,
+)
+from components.figure_cache import dark_template
+
+_logger = logging.getLogger(__name__)
+
+# Long enough for a prefetched symbol to still be warm when the user opens it.
+_OPTIONS_TTL = 60
+
+# Rank badge colours: <=40 success, <=70 warning, above that danger.
+_RANK_CUTS = (40, 70)
+_RANK_COLORS = ("success", "warning", "danger")
+_CONTRACT_CLASS = {"call": "text-success", "put": "text-danger"}
+
+@functools.lru_cache(maxsize=1)
+def _gauge_template():
+    """Rank gauge skeleton, validated on first use; renders only swap value/title."""
+    import plotly.graph_objects as go
+    return go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=0,
+        title={'text': "", 'font': {'size': 14}},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': '#00aaff'},
+            'steps': [
+                {'range': [0, 25], 'color': '#1a472a'},
+                {'range': [25, 50], 'color': '#3a5a3a'},
+                {'range': [50, 75], 'color': '#5a4a2a'},
+                {'range': [75, 100], 'color': '#6a2a2a'},
+            ],
+        },
+        number={'suffix': '%'},
+    )).update_layout(
+        height=180, template='plotly_dark',
+        margin=dict(l=30, r=30, t=40, b=10),
+    ).to_dict()
+
+
+def _rank_color(value):
+    """Badge colour for a 0-100 IV/HV rank."""
+    return _RANK_COLORS[bisect.bisect_left(_RANK_CUTS, value)]
+
+
+def _make_rank_gauge(value, title):
+    """Rank gauge figure dict built from the shared skeleton."""
+    template = _gauge_template()
+    gauge = {'data': copy.deepcopy(template['data']), 'layout': template['layout']}
+    gauge['data'][0]['value'] = value
+    gauge['data'][0]['title']['text'] = title
+    return gauge
 
 
 class OptionsFlowComponent:
     @staticmethod
+    @ttl_cache(_OPTIONS_TTL)
     def fetch_data(symbol):
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{API_BASE}/api/options/{symbol}",
-                headers=get_headers(),
                 timeout=API_TIMEOUT
             )
-            data = response.json()
+            data = parse_json(response)
             return data.get("data") if data.get("success") else None
         except Exception as e:
-            print(f"Error fetching options: {e}")
+            _logger.warning("Error fetching options for %s: %s", symbol, e)
             return None
 
+    @staticmethod
+    def prefetch(symbols):
+        """Warm the options cache for symbols the user is likely to open next."""
+        for symbol in dict.fromkeys(s.upper() for s in symbols if s):
+            EXECUTOR.submit(OptionsFlowComponent.fetch_data, symbol)
+
     @staticmethod
     def create_card(data, symbol):
         if not data or not data.get("available"):
@@ -48,7 +108,7 @@ class OptionsFlowComponent:
             if hv_proxy is not None:
                 badges.append(dbc.Badge(f"HV (20d): {hv_proxy:.1f}%", color="info", className="me-2 fs-6"))
             if hv_rank is not None:
-                color = "danger" if hv_rank > 70 else ("warning" if hv_rank > 40 else "success")
+                color = _rank_color(hv_rank)
                 badges.append(dbc.Badge(f"HV Rank: {hv_rank:.0f}%", color=color, className="me-2 fs-6"))
             if max_dd is not None:
                 badges.append(dbc.Badge(f"Max Drawdown: {max_dd:.1f}%", color="danger", className="me-2"))
@@ -58,27 +118,10 @@ class OptionsFlowComponent:
 
             # HV Rank gauge
             if hv_rank is not None:
-                gauge = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=hv_rank,
-                    title={'text': "HV Rank (IV Proxy)", 'font': {'size': 14}},
-                    gauge={
-                        'axis': {'range': [0, 100]},
-                        'bar': {'color': '#00aaff'},
-                        'steps': [
-                            {'range': [0, 25], 'color': '#1a472a'},
-                            {'range': [25, 50], 'color': '#3a5a3a'},
-                            {'range': [50, 75], 'color': '#5a4a2a'},
-                            {'range': [75, 100], 'color': '#6a2a2a'},
-                        ],
-                    },
-                    number={'suffix': '%'},
+                children.append(dcc.Graph(
+                    figure=_make_rank_gauge(hv_rank, "HV Rank (IV Proxy)"),
+                    config={'displayModeBar': False},
                 ))
-                gauge.update_layout(
-                    height=180, template='plotly_dark',
-                    margin=dict(l=30, r=30, t=40, b=10),
-                )
-                children.append(dcc.Graph(figure=gauge, config={'displayModeBar': False}))
 
             children.append(html.P(
                 "Options chain requires a premium plan. HV Rank uses historical volatility "
@@ -105,7 +148,7 @@ class OptionsFlowComponent:
         # Top badges row
         badges = []
         if iv_rank is not None:
-            color = "danger" if iv_rank > 70 else ("warning" if iv_rank > 40 else "success")
+            color = _rank_color(iv_rank)
             badges.append(dbc.Badge(f"IV Rank: {iv_rank:.0f}", color=color, className="me-2 fs-6"))
         if pcr is not None:
             color = "danger" if pcr > 1.0 else "success"
@@ -118,59 +161,43 @@ class OptionsFlowComponent:
 
         # IV Rank gauge
         if iv_rank is not None:
-            gauge = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=iv_rank,
-                title={'text': "IV Rank", 'font': {'size': 14}},
-                gauge={
-                    'axis': {'range': [0, 100]},
-                    'bar': {'color': '#00aaff'},
-                    'steps': [
-                        {'range': [0, 25], 'color': '#1a472a'},
-                        {'range': [25, 50], 'color': '#3a5a3a'},
-                        {'range': [50, 75], 'color': '#5a4a2a'},
-                        {'range': [75, 100], 'color': '#6a2a2a'},
-                    ],
-                },
-                number={'suffix': '%'},
+            children.append(dcc.Graph(
+                figure=_make_rank_gauge(iv_rank, "IV Rank"),
+                config={'displayModeBar': False},
             ))
-            gauge.update_layout(
-                height=180, template='plotly_dark',
-                margin=dict(l=30, r=30, t=40, b=10),
-            )
-            children.append(dcc.Graph(figure=gauge, config={'displayModeBar': False}))
 
         # Put/Call volume bar
         if call_vol or put_vol:
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                y=['Volume'], x=[call_vol], orientation='h',
-                name='Calls', marker_color='#00cc66',
-                text=[f"Calls: {call_vol:,}"], textposition='inside',
-            ))
-            fig.add_trace(go.Bar(
-                y=['Volume'], x=[put_vol], orientation='h',
-                name='Puts', marker_color='#ff4444',
-                text=[f"Puts: {put_vol:,}"], textposition='inside',
-            ))
-            fig.update_layout(
-                barmode='stack', height=80, template='plotly_dark',
-                margin=dict(l=10, r=10, t=5, b=5),
-                showlegend=False, yaxis_visible=False,
-            )
+            fig = {
+                'data': [
+                    {'type': 'bar', 'y': ['Volume'], 'x': [call_vol], 'orientation': 'h',
+                     'name': 'Calls', 'marker': {'color': '#00cc66'},
+                     'text': [f"Calls: {call_vol:,}"], 'textposition': 'inside'},
+                    {'type': 'bar', 'y': ['Volume'], 'x': [put_vol], 'orientation': 'h',
+                     'name': 'Puts', 'marker': {'color': '#ff4444'},
+                     'text': [f"Puts: {put_vol:,}"], 'textposition': 'inside'},
+                ],
+                'layout': {
+                    'barmode': 'stack', 'height': 80, 'template': dark_template(),
+                    'margin': {'l': 10, 'r': 10, 't': 5, 'b': 5},
+                    'showlegend': False, 'yaxis': {'visible': False},
+                },
+            }
             children.append(dcc.Graph(figure=fig, config={'displayModeBar': False}))
 
         # Unusual activity table
         if unusual:
-            rows = []
-            for u in unusual[:5]:
-                rows.append(html.Tr([
-                    html.Td(u.get("contract_type", "").upper(), className="text-success" if u.get("contract_type") == "call" else "text-danger"),
+            rows = [
+                html.Tr([
+                    html.Td((ct := u.get("contract_type", "")).upper(),
+                            className=_CONTRACT_CLASS.get(ct, "text-danger")),
                     html.Td(f"${u.get('strike', 0):.0f}"),
                     html.Td(u.get("expiration", "")[:10]),
                     html.Td(f"{u.get('volume', 0):,}"),
                     html.Td(f"{u.get('vol_oi_ratio', 0):.1f}x"),
-                ]))
+                ])
+                for u in unusual[:5]
+            ]
             table = dbc.Table([
                 html.Thead(html.Tr([
                     html.Th("Type"), html.Th("Strike"), html.Th("Exp"),
@@ -1,51 +1,171 @@
 """Paper Trading Panel Component for main dashboard integration."""
+import logging
 import os
+import uuid
+import diskcache
 import requests
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import (
+    API_BASE, get_headers, API_TIMEOUT, SESSION, EXECUTOR, parse_json, ttl_cache,
+)
+
+_logger = logging.getLogger(__name__)
+
+# Seconds a broker read is reused; long enough to coalesce one render's calls.
+_BROKER_TTL = 3
+
+# Alpaca returns these as strings; create_panel coerces them in this order.
+_ACCOUNT_FIELDS = ("buying_power", "portfolio_value", "cash")
+_POSITION_FIELDS = (
+    "qty", "avg_entry_price", "market_value",
+    "unrealized_pl", "unrealized_plpc", "current_price",
+)
+
+
+def _fmt_pnl(pl, plpc):
+    """Signed P&L label and its class, e.g. ("-$12.50 (-1.3%)", "text-danger fw-bold")."""
+    if pl >= 0:
+        return f"+${pl:,.2f} (+{abs(plpc):.1f}%)", "text-success fw-bold"
+    return f"-${-pl:,.2f} (-{abs(plpc):.1f}%)", "text-danger fw-bold"
+
+
+# (positions list, symbol -> position) for the last list seen by find_position.
+# fetch_positions hands out the same cached list within its TTL, so lookups
+# against it reuse the index instead of rescanning.
+_positions_index = (None, {})
+
+# _read_position results standing in for None, which ttl_cache never stores:
+# the symbol has no open position, or the backend has no single-position route.
+_NO_POSITION = object()
+_NO_POSITION_ROUTE = object()
+
+
+@ttl_cache(_BROKER_TTL)
+def _read_position(symbol):
+    """GET the single-position route: the position, a sentinel above, or None on error."""
+    try:
+        response = SESSION.get(
+            f"{API_BASE}/api/broker/positions/{symbol}",
+            timeout=API_TIMEOUT
+        )
+        if response.status_code in (404, 405):
+            return _NO_POSITION_ROUTE
+        data = parse_json(response)
+        if not data.get("success"):
+            return None
+        return data.get("data") or _NO_POSITION
+    except Exception as e:
+        _logger.warning("Error fetching broker position for %s: %s", symbol, e)
+        return None
+
+
+# Orders submitted via submit_trade, keyed "paper-trade:<trade_id>": a pending
+# marker until the broker answers, then the execute_trade result. Kept in the
+# app's diskcache (same directory as app.py's _frontend_cache) rather than in
+# process memory, so any gunicorn worker can answer the poll. Opened on first
+# use so importing this module leaves the cache directory alone.
+_trade_store = None
+_TRADE_TTL = 600
+_TRADE_PENDING = {"pending": True}
+
+
+def _get_trade_store():
+    global _trade_store
+    if _trade_store is None:
+        _trade_store = diskcache.Cache(
+            os.path.join(os.path.dirname(os.path.dirname(__file__)), ".cache", "app")
+        )
+    return _trade_store
+
+
+def _trade_key(trade_id):
+    return f"paper-trade:{trade_id}"
+
+
+def _run_trade(trade_id, symbol, action, shares):
+    """Execute a submitted trade and publish its result for get_trade_result."""
+    try:
+        result = PaperTradingComponent.execute_trade(symbol, action, shares)
+    except Exception as e:
+        _logger.warning("Paper trade %s failed: %s", trade_id, e)
+        result = {"success": False, "error": str(e)}
+    _get_trade_store().set(_trade_key(trade_id), result, expire=_TRADE_TTL)
 
 
 class PaperTradingComponent:
     @staticmethod
+    @ttl_cache(_BROKER_TTL)
     def fetch_account():
         """Fetch Alpaca paper trading account info."""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{API_BASE}/api/broker/account",
-                headers=get_headers(),
                 timeout=API_TIMEOUT
             )
-            data = response.json()
+            data = parse_json(response)
             return data.get("data") if data.get("success") else None
         except Exception as e:
-            print(f"Error fetching broker account: {e}")
+            _logger.warning("Error fetching broker account: %s", e)
             return None
 
     @staticmethod
+    @ttl_cache(_BROKER_TTL)
     def fetch_positions():
         """Fetch all Alpaca broker positions."""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{API_BASE}/api/broker/positions",
-                headers=get_headers(),
                 timeout=API_TIMEOUT
             )
-            data = response.json()
+            data = parse_json(response)
             return data.get("data", []) if data.get("success") else []
         except Exception as e:
-            print(f"Error fetching broker positions: {e}")
+            _logger.warning("Error fetching broker positions: %s", e)
             return []
 
+    @staticmethod
+    def fetch_account_and_positions():
+        """Fetch account and positions concurrently; returns (account, positions)."""
+        f_account = EXECUTOR.submit(PaperTradingComponent.fetch_account)
+        f_positions = EXECUTOR.submit(PaperTradingComponent.fetch_positions)
+        return f_account.result(), f_positions.result()
+
+    @staticmethod
+    def find_position(positions, symbol):
+        """Pick the position for a specific symbol out of a positions list (or None)."""
+        global _positions_index
+        source, index = _positions_index
+        if source is not positions:
+            index = {pos.get("symbol", "").upper(): pos for pos in positions}
+            _positions_index = (positions, index)
+        return index.get(symbol.upper())
+
     @staticmethod
     def fetch_position(symbol):
         """Fetch position for a specific symbol (or None)."""
-        positions = PaperTradingComponent.fetch_positions()
-        for pos in positions:
-            if pos.get("symbol", "").upper() == symbol.upper():
-                return pos
-        return None
+        return PaperTradingComponent.find_position(PaperTradingComponent.fetch_positions(), symbol)
+
+    @staticmethod
+    def fetch_position_direct(symbol):
+        """Fetch one symbol's position from the single-position route (or None).
+
+        Avoids downloading the whole positions list for large accounts. Only a
+        backend without the route (404/405) falls back to the positions index;
+        a broker error reads as no position, like fetch_position's failures.
+        """
+        result = _read_position(symbol.upper())
+        if result is _NO_POSITION_ROUTE:
+            return PaperTradingComponent.fetch_position(symbol)
+        return None if result is _NO_POSITION else result
+
+    @staticmethod
+    def fetch_account_and_position(symbol):
+        """Fetch account and one symbol's position concurrently; returns (account, position)."""
+        f_account = EXECUTOR.submit(PaperTradingComponent.fetch_account)
+        f_position = EXECUTOR.submit(PaperTradingComponent.fetch_position_direct, symbol)
+        return f_account.result(), f_position.result()
 
     @staticmethod
     def get_trade_headers():
@@ -56,6 +176,13 @@ class PaperTradingComponent:
             headers["X-Live-Trading-Key"] = live_key
         return headers
 
+    @staticmethod
+    def invalidate_cache():
+        """Drop cached account/positions so the next read reflects a trade."""
+        PaperTradingComponent.fetch_account.cache_clear()
+        PaperTradingComponent.fetch_positions.cache_clear()
+        _read_position.cache_clear()
+
     @staticmethod
     def execute_trade(symbol, action, shares):
         """Execute a paper trade via broker API."""
@@ -66,18 +193,51 @@ class PaperTradingComponent:
                 "shares": shares,
                 "notes": "Executed from main dashboard",
             }
-            response = requests.post(
+            # Auth headers come from the session; only the live key is per-request.
+            live_key = os.getenv("LIVE_TRADING_KEY", "")
+            response = SESSION.post(
                 f"{API_BASE}/api/broker/execute",
                 json=trade_data,
-                headers=PaperTradingComponent.get_trade_headers(),
+                headers={"X-Live-Trading-Key": live_key} if live_key else None,
                 timeout=API_TIMEOUT
             )
             if response.status_code != 200:
                 return {"success": False, "error": f"HTTP {response.status_code}: {response.text[:200]}"}
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            result = parse_json(response)
+            if result.get("success"):
+                PaperTradingComponent.invalidate_cache()
+            return result
+        except (requests.exceptions.RequestException, OSError, ValueError) as e:
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def submit_trade(symbol, action, shares):
+        """Run execute_trade in the background and return a trade id to poll.
+
+        Lets the click callback answer immediately instead of waiting out the
+        broker round trip; collect the outcome with get_trade_result.
+        """
+        trade_id = uuid.uuid4().hex
+        _get_trade_store().set(_trade_key(trade_id), _TRADE_PENDING, expire=_TRADE_TTL)
+        EXECUTOR.submit(_run_trade, trade_id, symbol, action, shares)
+        return trade_id
+
+    @staticmethod
+    def get_trade_result(trade_id):
+        """Return the execute_trade result for trade_id, or None while pending.
+
+        An id with no entry (not yet visible, or its worker restarted) also
+        reads as pending; the caller decides when to stop waiting. A finished
+        result is handed out once and then forgotten.
+        """
+        key = _trade_key(trade_id)
+        store = _get_trade_store()
+        result = store.get(key)
+        if result is None or result.get("pending"):
+            return None
+        # pop is atomic, so only one concurrent poll gets the result.
+        return store.pop(key)
+
     @staticmethod
     def create_panel(account, position, symbol, analysis=None):
         """Build the paper trading card for the dashboard.
@@ -99,9 +259,9 @@ class PaperTradingComponent:
                 ),
             ])
 
-        buying_power = float(account.get("buying_power", 0))
-        portfolio_value = float(account.get("portfolio_value", 0))
-        cash = float(account.get("cash", 0))
+        buying_power, portfolio_value, cash = (
+            float(account.get(k, 0)) for k in _ACCOUNT_FIELDS
+        )
 
         # --- Account summary ---
         account_row = dbc.Row([
@@ -121,15 +281,12 @@ class PaperTradingComponent:
 
         # --- Current position in this symbol ---
         if position:
-            qty = float(position.get("qty", 0))
-            avg_entry = float(position.get("avg_entry_price", 0))
-            market_value = float(position.get("market_value", 0))
-            unrealized_pl = float(position.get("unrealized_pl", 0))
-            unrealized_plpc = float(position.get("unrealized_plpc", 0)) * 100
-            current_price = float(position.get("current_price", 0))
+            qty, avg_entry, market_value, unrealized_pl, unrealized_plpc, current_price = (
+                float(position.get(k, 0)) for k in _POSITION_FIELDS
+            )
+            unrealized_plpc *= 100
 
-            pnl_color = "success" if unrealized_pl >= 0 else "danger"
-            pnl_icon = "+" if unrealized_pl >= 0 else ""
+            pnl_text, pnl_class = _fmt_pnl(unrealized_pl, unrealized_plpc)
 
             position_section = dbc.Row([
                 dbc.Col([
@@ -150,10 +307,7 @@ class PaperTradingComponent:
                 ], width=3, className="text-center"),
                 dbc.Col([
                     html.Small("Unrealized P&L", className="text-muted d-block"),
-                    html.Span(
-                        f"{pnl_icon}${unrealized_pl:,.2f} ({pnl_icon}{unrealized_plpc:.1f}%)",
-                        className=f"text-{pnl_color} fw-bold",
-                    ),
+                    html.Span(pnl_text, className=pnl_class),
                 ], width=3, className="text-center"),
             ], className="mb-3")
 
@@ -176,8 +330,6 @@ class PaperTradingComponent:
             if signal:
                 suggestion = f"Analysis signal: {signal} at {confidence:.0f}% confidence"
 
-        suggestion_block = html.P(suggestion, className="small text-info mb-2") if suggestion else None
-
         # --- Trade controls ---
         trade_controls = dbc.Row([
             dbc.Col([
@@ -212,6 +364,11 @@ class PaperTradingComponent:
             ], md=4),
         ])
 
+        body = [account_row, html.Hr(), position_block]
+        if suggestion:
+            body.append(html.P(suggestion, className="small text-info mb-2"))
+        body.append(trade_controls)
+
         return dbc.Card([
             dbc.CardHeader(
                 html.Div([
@@ -219,11 +376,5 @@ class PaperTradingComponent:
                     dbc.Badge("PAPER", color="info", className="ms-2"),
                 ], className="d-flex align-items-center")
             ),
-            dbc.CardBody([
-                account_row,
-                html.Hr(),
-                position_block,
-                suggestion_block,
-                trade_controls,
-            ]),
+            dbc.CardBody(body),
         ])
@@ -1,105 +1,260 @@
 """Portfolio Analytics Component — risk metrics, performance, benchmark, rebalancing."""
-import requests
+import heapq
+
+import numpy as np
 from dash import html, dcc
 import plotly.graph_objects as go
-from .config import API_BASE, API_TIMEOUT, get_headers
+from .config import API_BASE, API_TIMEOUT, EXECUTOR, SESSION, parse_json, ttl_cache
+
+# Seconds each endpoint's result is reused. Snapshot-derived analytics change
+# slowly; the benchmark series moves least of all.
+_RISK_TTL = 60
+_PERFORMANCE_TTL = 60
+_BENCHMARK_TTL = 120
+_PORTFOLIO_TTL = 60
+
+# Shared cell styles for the analytics tables.
+_BOLD = {"fontWeight": "bold"}
+_GAIN_STYLE = {"color": "#00CC96"}
+_LOSS_STYLE = {"color": "#EF553B"}
+_ROW_STYLE = {"borderBottom": "1px solid #333"}
+
+
+def _signed_color(value):
+    """Green for gains, red for losses, grey for zero/missing."""
+    if value and value > 0:
+        return "#00CC96"
+    if value and value < 0:
+        return "#EF553B"
+    return "#aaa"
+
+
+def _metric_card(label, value, fmt, size="18px", padding="12px", color=None):
+    """Small label-over-value tile used by the risk/performance/benchmark panels."""
+    value_style = {"fontSize": size, "fontWeight": "bold"}
+    if color:
+        value_style["color"] = color
+    return html.Div(
+        [
+            html.Div(label, style={"fontSize": "11px", "color": "#aaa"}),
+            html.Div(fmt.format(value) if value is not None else "N/A", style=value_style),
+        ],
+        style={
+            "background": "#1e1e2f",
+            "borderRadius": "8px",
+            "padding": padding,
+            "textAlign": "center",
+            "minWidth": "80px",
+        },
+    )
+
+
+# Most points drawn per line on the benchmark chart; longer series are
+# downsampled with LTTB, which keeps the visual shape of the line.
+_MAX_LINE_POINTS = 2000
+
+
+def _lttb_indices(values, threshold):
+    """Indices of the points Largest-Triangle-Three-Buckets keeps from ``values``.
+
+    Points are treated as evenly spaced on x. Always keeps the first and last
+    point; returns every index when the series is already short enough.
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return range(n)
+
+    y = np.asarray(values, dtype=np.float64)
+    x = np.arange(n, dtype=np.float64)
+    every = (n - 2) / (threshold - 2)
+    keep = np.empty(threshold, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        # Twice the triangle area between the last kept point, each candidate
+        # in this bucket and the next bucket's centroid.
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    return keep
 
 
 class PortfolioAnalyticsComponent:
 
     @staticmethod
+    @ttl_cache(_RISK_TTL)
     def fetch_risk_metrics(days=90):
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{API_BASE}/api/portfolio/risk-metrics",
                 params={"days": days},
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
-            data = resp.json()
-            if data.get("success"):
-                return data["data"]
+            if resp.status_code == 200:
+                data = parse_json(resp)
+                if data.get("success"):
+                    return data["data"]
         except Exception:
             pass
         return None
 
     @staticmethod
+    @ttl_cache(_PERFORMANCE_TTL)
     def fetch_performance(days=365):
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{API_BASE}/api/portfolio/performance-analytics",
                 params={"days": days},
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
-            data = resp.json()
-            if data.get("success"):
-                return data["data"]
+            if resp.status_code == 200:
+                data = parse_json(resp)
+                if data.get("success"):
+                    return data["data"]
         except Exception:
             pass
         return None
 
     @staticmethod
+    @ttl_cache(_BENCHMARK_TTL)
     def fetch_benchmark(symbol="SPY", days=365):
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{API_BASE}/api/portfolio/benchmark",
                 params={"symbol": symbol, "days": days},
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
-            data = resp.json()
-            if data.get("success"):
-                return data["data"]
+            if resp.status_code == 200:
+                data = parse_json(resp)
+                if data.get("success"):
+                    return data["data"]
         except Exception:
             pass
         return None
 
     @staticmethod
+    @ttl_cache(_PORTFOLIO_TTL)
     def fetch_drift():
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{API_BASE}/api/portfolio/drift",
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
-            data = resp.json()
-            if data.get("success"):
-                return data["data"]
+            if resp.status_code == 200:
+                data = parse_json(resp)
+                if data.get("success"):
+                    return data["data"]
         except Exception:
             pass
         return None
 
     @staticmethod
+    @ttl_cache(_PORTFOLIO_TTL)
     def fetch_allocations():
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{API_BASE}/api/portfolio/allocations",
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
-            data = resp.json()
-            if data.get("success"):
-                return data["data"]
+            if resp.status_code == 200:
+                data = parse_json(resp)
+                if data.get("success"):
+                    return data["data"]
         except Exception:
             pass
         return []
 
     @staticmethod
+    @ttl_cache(_PORTFOLIO_TTL)
     def fetch_rebalance():
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"{API_BASE}/api/portfolio/rebalance",
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
-            data = resp.json()
-            if data.get("success"):
-                return data["data"]
+            if resp.status_code == 200:
+                data = parse_json(resp)
+                if data.get("success"):
+                    return data["data"]
         except Exception:
             pass
         return None
 
+    @staticmethod
+    @ttl_cache(_RISK_TTL)
+    def fetch_bundle(days=365, benchmark="SPY", risk_days=90):
+        """Fetch every analytics section from the single bundle route.
+
+        Returns a dict keyed risk/performance/benchmark/drift/allocations/
+        rebalance, or None if the route failed (e.g. an older backend).
+        """
+        try:
+            resp = SESSION.get(
+                f"{API_BASE}/api/portfolio/bundle",
+                params={"days": days, "benchmark": benchmark, "risk_days": risk_days},
+                timeout=API_TIMEOUT,
+            )
+            if resp.status_code == 200:
+                data = parse_json(resp)
+                if data.get("success"):
+                    return data["data"]
+        except Exception:
+            pass
+        return None
+
+    @staticmethod
+    def invalidate_cache():
+        """Drop every cached analytics response (e.g. on the Refresh button)."""
+        for fetcher in (
+            PortfolioAnalyticsComponent.fetch_risk_metrics,
+            PortfolioAnalyticsComponent.fetch_performance,
+            PortfolioAnalyticsComponent.fetch_benchmark,
+            PortfolioAnalyticsComponent.fetch_drift,
+            PortfolioAnalyticsComponent.fetch_allocations,
+            PortfolioAnalyticsComponent.fetch_rebalance,
+            PortfolioAnalyticsComponent.fetch_bundle,
+        ):
+            fetcher.cache_clear()
+
+    @staticmethod
+    def fetch_all(days_risk=90, days_perf=365, benchmark="SPY"):
+        """Fetch everything the analytics tab shows.
+
+        Returns a dict keyed risk/performance/benchmark/drift/rebalance; each
+        value is whatever the matching fetcher returned. Uses the bundle route
+        when the backend has it, otherwise overlaps the per-endpoint requests.
+        Rebalance is requested alongside drift rather than after it, and
+        dropped when there is no drift to act on.
+        """
+        bundle = PortfolioAnalyticsComponent.fetch_bundle(days_perf, benchmark, days_risk)
+        if bundle is not None:
+            results = {
+                name: bundle.get(name)
+                for name in ("risk", "performance", "benchmark", "drift", "rebalance")
+            }
+            if not results["drift"]:
+                results["rebalance"] = None
+            return results
+
+        futures = {
+            "risk": EXECUTOR.submit(PortfolioAnalyticsComponent.fetch_risk_metrics, days_risk),
+            "performance": EXECUTOR.submit(PortfolioAnalyticsComponent.fetch_performance, days_perf),
+            "benchmark": EXECUTOR.submit(PortfolioAnalyticsComponent.fetch_benchmark, benchmark, days_perf),
+            "drift": EXECUTOR.submit(PortfolioAnalyticsComponent.fetch_drift),
+            "rebalance": EXECUTOR.submit(PortfolioAnalyticsComponent.fetch_rebalance),
+        }
+        results = {name: f.result() for name, f in futures.items()}
+        if not results["drift"]:
+            results["rebalance"] = None
+        return results
+
     # ---- Panel builders ----
 
     @staticmethod
@@ -110,7 +265,6 @@ class PortfolioAnalyticsComponent:
                 style={"color": "#999", "textAlign": "center", "padding": "40px"},
             )
 
-        cards = []
         card_data = [
             ("Sharpe", metrics.get("sharpe_ratio"), "{:.2f}"),
             ("Sortino", metrics.get("sortino_ratio"), "{:.2f}"),
@@ -121,26 +275,10 @@ class PortfolioAnalyticsComponent:
             ("HHI", metrics.get("herfindahl_index"), "{:.3f}"),
             ("Vol 20d", metrics.get("rolling_volatility_20d"), "{:.1%}"),
         ]
-        for label, value, fmt in card_data:
-            display = fmt.format(value) if value is not None else "N/A"
-            cards.append(
-                html.Div(
-                    [
-                        html.Div(label, style={"fontSize": "11px", "color": "#aaa"}),
-                        html.Div(display, style={"fontSize": "18px", "fontWeight": "bold"}),
-                    ],
-                    style={
-                        "background": "#1e1e2f",
-                        "borderRadius": "8px",
-                        "padding": "12px",
-                        "textAlign": "center",
-                        "minWidth": "80px",
-                    },
-                )
-            )
+        cards = [_metric_card(label, value, fmt) for label, value, fmt in card_data]
 
         # Concentration donut
-        top = metrics.get("top_holdings", [])
+        top = metrics.get("top_holdings", [])[:10]
         donut = go.Figure()
         if top:
             donut.add_trace(
@@ -186,38 +324,21 @@ class PortfolioAnalyticsComponent:
             ("YTD", analytics.get("ytd_return"), "{:.1f}%"),
             ("1Y Return", analytics.get("rolling_1y_return"), "{:.1f}%"),
         ]
-        cards = []
-        for label, value, fmt in cards_data:
-            display = fmt.format(value) if value is not None else "N/A"
-            color = "#00CC96" if value and value > 0 else "#EF553B" if value and value < 0 else "#aaa"
-            cards.append(
-                html.Div(
-                    [
-                        html.Div(label, style={"fontSize": "11px", "color": "#aaa"}),
-                        html.Div(display, style={"fontSize": "18px", "fontWeight": "bold", "color": color}),
-                    ],
-                    style={
-                        "background": "#1e1e2f",
-                        "borderRadius": "8px",
-                        "padding": "12px",
-                        "textAlign": "center",
-                        "minWidth": "80px",
-                    },
-                )
-            )
+        cards = [
+            _metric_card(label, value, fmt, color=_signed_color(value))
+            for label, value, fmt in cards_data
+        ]
 
         # Monthly returns heatmap
         monthly = analytics.get("monthly_returns", [])
         heatmap = go.Figure()
         if monthly:
-            months_map = {}
+            years = sorted({m["year"] for m in monthly})
+            year_idx = {year: i for i, year in enumerate(years)}
+            # Months without a return stay NaN (null in the figure JSON).
+            z = np.full((len(years), 12), np.nan)
             for m in monthly:
-                months_map[(m["year"], m["month"])] = m["return_percent"]
-            years = sorted(set(m["year"] for m in monthly))
-            z = []
-            for year in years:
-                row = [months_map.get((year, mo), None) for mo in range(1, 13)]
-                z.append(row)
+                z[year_idx[m["year"]], m["month"] - 1] = m["return_percent"]
             heatmap.add_trace(
                 go.Heatmap(
                     z=z,
@@ -225,8 +346,8 @@ class PortfolioAnalyticsComponent:
                     y=[str(y) for y in years],
                     colorscale=[[0, "#EF553B"], [0.5, "#1e1e2f"], [1, "#00CC96"]],
                     zmid=0,
-                    text=[[f"{v:.1f}%" if v is not None else "" for v in row] for row in z],
-                    texttemplate="%{text}",
+                    # Labels are formatted from z in the browser; blank months get none.
+                    texttemplate="%{z:.1f}%",
                     hovertemplate="Year: %{y}<br>Month: %{x}<br>Return: %{z:.1f}%<extra></extra>",
                 )
             )
@@ -241,20 +362,31 @@ class PortfolioAnalyticsComponent:
 
         # Attribution table
         attr = analytics.get("symbol_attribution", [])
+        top_attr = heapq.nlargest(10, attr, key=lambda x: abs(x.get("contribution_percent", 0)))
         attr_rows = []
-        for a in sorted(attr, key=lambda x: abs(x.get("contribution_percent", 0)), reverse=True)[:10]:
-            color = "#00CC96" if a.get("contribution_percent", 0) >= 0 else "#EF553B"
-            attr_rows.append(
+        if top_attr:
+            # Format each column in one pass instead of per cell.
+            cols = np.array(
+                [(a.get("weight_percent", 0), a.get("return_percent", 0), a.get("contribution_percent", 0))
+                 for a in top_attr],
+                dtype=np.float64,
+            )
+            weight_txt = np.char.mod("%.1f%%", cols[:, 0])
+            return_txt = np.char.mod("%.1f%%", cols[:, 1])
+            contrib_txt = np.char.mod("%.2f%%", cols[:, 2])
+            gains = cols[:, 2] >= 0
+            attr_rows = [
                 html.Tr(
                     [
-                        html.Td(a["symbol"], style={"fontWeight": "bold"}),
-                        html.Td(f'{a.get("weight_percent", 0):.1f}%'),
-                        html.Td(f'{a.get("return_percent", 0):.1f}%', style={"color": color}),
-                        html.Td(f'{a.get("contribution_percent", 0):.2f}%', style={"color": color}),
+                        html.Td(a["symbol"], style=_BOLD),
+                        html.Td(w),
+                        html.Td(r, style=_GAIN_STYLE if up else _LOSS_STYLE),
+                        html.Td(c, style=_GAIN_STYLE if up else _LOSS_STYLE),
                     ],
-                    style={"borderBottom": "1px solid #333"},
+                    style=_ROW_STYLE,
                 )
-            )
+                for a, w, r, c, up in zip(top_attr, weight_txt, return_txt, contrib_txt, gains)
+            ]
 
         attr_table = html.Table(
             [
@@ -289,32 +421,19 @@ class PortfolioAnalyticsComponent:
             ("Info Ratio", benchmark.get("information_ratio"), "{:.2f}"),
             ("Excess Return", benchmark.get("excess_return_percent"), "{:.1f}%"),
         ]
-        cards = []
-        for label, value, fmt in cards_data:
-            display = fmt.format(value) if value is not None else "N/A"
-            cards.append(
-                html.Div(
-                    [
-                        html.Div(label, style={"fontSize": "11px", "color": "#aaa"}),
-                        html.Div(display, style={"fontSize": "16px", "fontWeight": "bold"}),
-                    ],
-                    style={
-                        "background": "#1e1e2f",
-                        "borderRadius": "8px",
-                        "padding": "10px",
-                        "textAlign": "center",
-                        "minWidth": "80px",
-                    },
-                )
-            )
+        cards = [
+            _metric_card(label, value, fmt, size="16px", padding="10px")
+            for label, value, fmt in cards_data
+        ]
 
         # Indexed performance chart
         fig = go.Figure()
         pi = benchmark.get("portfolio_indexed", [])
         bi = benchmark.get("benchmark_indexed", [])
         if pi:
+            pi = [pi[i] for i in _lttb_indices([p["value"] for p in pi], _MAX_LINE_POINTS)]
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=[p["date"] for p in pi],
                     y=[p["value"] for p in pi],
                     name="Portfolio",
@@ -322,8 +441,9 @@ class PortfolioAnalyticsComponent:
                 )
             )
         if bi:
+            bi = [bi[i] for i in _lttb_indices([p["value"] for p in bi], _MAX_LINE_POINTS)]
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=[p["date"] for p in bi],
                     y=[p["value"] for p in bi],
                     name=benchmark.get("benchmark_symbol", "SPY"),
@@ -338,6 +458,7 @@ class PortfolioAnalyticsComponent:
             height=300,
             margin=dict(t=30, b=30, l=40, r=10),
             legend=dict(orientation="h", y=-0.15),
+            hovermode="x",
             yaxis=dict(gridcolor="#333"),
             xaxis=dict(gridcolor="#333"),
         )
@@ -355,15 +476,9 @@ class PortfolioAnalyticsComponent:
 
         # Drift bar chart
         if drift:
-            symbols = []
-            drifts = []
-            colors = []
-            for d in drift:
-                label = d.get("symbol") or d.get("sector") or "?"
-                symbols.append(label)
-                dv = d.get("drift_percent", 0)
-                drifts.append(dv)
-                colors.append("#EF553B" if d.get("needs_rebalance") else "#636EFA")
+            symbols = [d.get("symbol") or d.get("sector") or "?" for d in drift]
+            drifts = [d.get("drift_percent", 0) for d in drift]
+            colors = ["#EF553B" if d.get("needs_rebalance") else "#636EFA" for d in drift]
 
             fig = go.Figure()
             fig.add_trace(
@@ -382,22 +497,20 @@ class PortfolioAnalyticsComponent:
 
         # Proposed trades table
         if proposal and proposal.get("trades"):
-            rows = []
-            for t in proposal["trades"]:
-                color = "#00CC96" if t["action"] == "buy" else "#EF553B"
-                rows.append(
-                    html.Tr(
-                        [
-                            html.Td(t["symbol"], style={"fontWeight": "bold"}),
-                            html.Td(t["action"].upper(), style={"color": color}),
-                            html.Td(f'{t["shares"]:.2f}'),
-                            html.Td(f'{t["current_weight_percent"]:.1f}%'),
-                            html.Td(f'{t["target_weight_percent"]:.1f}%'),
-                            html.Td(f'${t["estimated_value"]:.0f}'),
-                        ],
-                        style={"borderBottom": "1px solid #333"},
-                    )
+            rows = [
+                html.Tr(
+                    [
+                        html.Td(t["symbol"], style=_BOLD),
+                        html.Td(t["action"].upper(), style=_GAIN_STYLE if t["action"] == "buy" else _LOSS_STYLE),
+                        html.Td(f'{t["shares"]:.2f}'),
+                        html.Td(f'{t["current_weight_percent"]:.1f}%'),
+                        html.Td(f'{t["target_weight_percent"]:.1f}%'),
+                        html.Td(f'${t["estimated_value"]:.0f}'),
+                    ],
+                    style=_ROW_STYLE,
                 )
+                for t in proposal["trades"]
+            ]
             table = html.Table(
                 [
                     html.Thead(html.Tr([html.Th(h) for h in ["Symbol", "Action", "Shares", "Current", "Target", "Value"]])),
@@ -1,15 +1,124 @@
 """Portfolio Dashboard Component - positions, allocation, P&L, bank accounts, transfers."""
+import functools
 import json
+import logging
+
+import numpy as np
 import plotly.graph_objects as go
 import dash_bootstrap_components as dbc
-from dash import html, dcc
+from dash import html, dcc, dash_table
+from dash.dash_table.Format import Format, Group, Scheme, Sign, Symbol
+
+from components.config import API_BASE, API_TIMEOUT, EXECUTOR, SESSION, parse_json, ttl_cache
+from components.figure_cache import dark_template, memoize_figure
+
+_logger = logging.getLogger(__name__)
+
+# Seconds broker reads are reused across the dashboard's re-renders (bank or
+# transfer store edits re-run the callback without new broker data).
+_ACCOUNT_TTL = 10
+_ORDERS_TTL = 5
+# Most orders /api/broker/orders returns; it clamps larger limits itself and
+# has no offset to page past them.
+_ORDERS_MAX_LIMIT = 50
+
+# Account fields read by build_account_row, in unpacking order.
+_ACCOUNT_FIELDS = ("equity", "cash", "buying_power", "last_equity")
+# Caption class for the account summary stats.
+_STAT_LABEL_CLASS = "text-muted d-block"
+
+# Positions table rows per page, and most bars on the P&L chart; both keep
+# render cost flat for large accounts.
+_POSITIONS_PAGE_SIZE = 25
+_PL_CHART_MAX_BARS = 25
+
+# Allocation donut shows at most this many positions, each holding at least
+# this share of the total; the rest fold into "Other".
+_ALLOCATION_TOP_N = 10
+_ALLOCATION_MIN_SHARE = 0.01
+
+# Positions table columns. Cells hold raw numbers and are formatted by the
+# DataTable in the browser; P&L colouring is a filter_query rule, not per-row.
+_MONEY = Format(precision=2, scheme=Scheme.fixed, symbol=Symbol.yes, symbol_prefix="$")
+_GROUPED_MONEY = Format(precision=2, scheme=Scheme.fixed, symbol=Symbol.yes, symbol_prefix="$",
+                        group=Group.yes)
+_SIGNED_MONEY = Format(precision=2, scheme=Scheme.fixed, symbol=Symbol.yes, symbol_prefix="$",
+                       group=Group.yes, sign=Sign.positive)
+_SIGNED_PCT = Format(precision=1, scheme=Scheme.percentage, sign=Sign.positive)
+_POSITION_COLUMNS = [
+    {"name": "Symbol", "id": "symbol"},
+    {"name": "Qty", "id": "qty", "type": "numeric"},
+    {"name": "Avg Cost", "id": "avg_cost", "type": "numeric", "format": _MONEY},
+    {"name": "Current", "id": "current", "type": "numeric", "format": _MONEY},
+    {"name": "Mkt Value", "id": "mkt_value", "type": "numeric", "format": _GROUPED_MONEY},
+    {"name": "P&L ($)", "id": "pnl", "type": "numeric", "format": _SIGNED_MONEY},
+    {"name": "P&L (%)", "id": "pnl_pct", "type": "numeric", "format": _SIGNED_PCT},
+    {"name": "Today", "id": "change_today", "type": "numeric", "format": _SIGNED_PCT},
+]
+_POSITION_ROW_KEYS = tuple(col["id"] for col in _POSITION_COLUMNS)
+_POSITION_STYLE_CONDITIONAL = [
+    {"if": {"column_id": "symbol"}, "fontWeight": "bold"},
+    {"if": {"filter_query": "{pnl} >= 0", "column_id": ["pnl", "pnl_pct"]}, "color": "#00CC96"},
+    {"if": {"filter_query": "{pnl} < 0", "column_id": ["pnl", "pnl_pct"]}, "color": "#EF553B"},
+    {"if": {"filter_query": "{change_today} >= 0", "column_id": "change_today"}, "color": "#00CC96"},
+    {"if": {"filter_query": "{change_today} < 0", "column_id": "change_today"}, "color": "#EF553B"},
+]
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+_ORDER_STATUS_COLORS = {
+    "filled": "success",
+    "partially_filled": "info",
+    "new": "primary",
+    "accepted": "primary",
+    "canceled": "secondary",
+    "rejected": "danger",
+    "pending_new": "warning",
+}
+_CANCELABLE_STATUSES = frozenset(("new", "accepted", "pending_new", "partially_filled"))
+_ORDER_HEADERS = ("Time", "Symbol", "Side", "Qty", "Fill Price", "Status", "")
+_TRANSFER_HEADERS = ("Date", "Total", "PNC", "Capital One")
+# Transfer split preset buttons: (label, PNC percentage).
+_TRANSFER_PRESETS = (("20/80", 20), ("40/60", 40), ("50/50", 50), ("60/40", 60), ("80/20", 80))
+
+# Numeric position fields, extracted once per render by _positions_to_soa.
+_POSITION_FIELDS = (
+    "qty", "avg_entry_price", "current_price", "market_value", "cost_basis",
+    "unrealized_pl", "unrealized_plpc", "change_today",
+)
+
+
+def _positions_to_soa(positions):
+    """Column arrays for a positions list: float64 per numeric field plus ``symbol``.
+
+    Alpaca sends numbers as strings; each is parsed exactly once here and the
+    totals, table and charts all read the arrays.
+    """
+    n = len(positions)
+    soa = {
+        field: np.fromiter((float(p.get(field, 0) or 0) for p in positions), np.float64, count=n)
+        for field in _POSITION_FIELDS
+    }
+    soa["symbol"] = [p.get("symbol", "?") for p in positions]
+    return soa
+
+
+def _aggregate_positions(soa):
+    """Portfolio P&L totals from SoA columns: (unrealized P&L, cost basis, P&L %)."""
+    total_pl = float(soa["unrealized_pl"].sum())
+    total_cost = float(soa["cost_basis"].sum())
+    total_pl_pct = total_pl / total_cost * 100 if total_cost > 0 else 0
+    return total_pl, total_cost, total_pl_pct
+
+
+@functools.lru_cache(maxsize=16)
+def _bank_styles(color):
+    """(icon style, card style) for a bank colour, shared across renders. Read-only."""
+    return {"color": color, "fontSize": "1.3rem"}, {"borderLeft": f"4px solid {color}"}
+
+
+def _fmt_split(split):
+    """Transfer-history cell for one bank's share, e.g. "$1,250.00 (50%)"."""
+    return f"${split['amount']:,.2f} ({split['pct']}%)" if split else "-"
 
-try:
-    import requests
-except ImportError:
-    pass
 
 DEFAULT_BANK_ACCOUNTS = [
     {"id": "bank1", "name": "Primary Bank", "lastFour": "0000", "balance": 0, "color": "#F58220"},
@@ -17,53 +126,110 @@ DEFAULT_BANK_ACCOUNTS = [
 ]
 
 
+# Placeholders for empty accounts (the common first-login case), built once
+# and shared by every render. Treat as read-only.
+_NOT_CONFIGURED_CARD = dbc.Card([
+    dbc.CardHeader(
+        html.Div([
+            html.H5("Portfolio Dashboard", className="mb-0 d-inline"),
+            dbc.Badge("PAPER", color="info", className="ms-2"),
+        ], className="d-flex align-items-center")
+    ),
+    dbc.CardBody(
+        dbc.Alert(
+            "Alpaca broker not configured. Set APCA_API_KEY_ID and APCA_API_SECRET_KEY environment variables to enable paper trading.",
+            color="warning",
+        )
+    ),
+])
+_EMPTY_POSITIONS_ROW = dbc.Row([
+    dbc.Col([
+        html.H6("Open Positions", className="mb-2"),
+        html.P("No open positions", className="text-muted text-center py-3"),
+    ], md=7),
+    dbc.Col([
+        html.H6("Allocation", className="mb-2"),
+        html.P("No positions to chart", className="text-muted text-center py-3"),
+    ], md=5),
+])
+_EMPTY_CHART = html.Div()
+_EMPTY_ORDERS = html.P("No recent orders", className="text-muted small")
+_EMPTY_TRANSFERS = html.P("No transfers yet", className="text-muted small mt-3")
+
+
 class PortfolioDashboardComponent:
     @staticmethod
+    @ttl_cache(_ACCOUNT_TTL)
     def fetch_account():
         """Fetch Alpaca paper trading account info."""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{API_BASE}/api/broker/account",
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
-            data = response.json()
+            if response.status_code != 200:
+                return None
+            data = parse_json(response)
             return data.get("data") if data.get("success") else None
         except Exception as e:
-            print(f"[portfolio-dashboard] Error fetching account: {e}")
+            _logger.warning("Error fetching account: %s", e)
             return None
 
     @staticmethod
+    @ttl_cache(_ACCOUNT_TTL)
     def fetch_positions():
         """Fetch all Alpaca broker positions."""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{API_BASE}/api/broker/positions",
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
-            data = response.json()
+            if response.status_code != 200:
+                return []
+            data = parse_json(response)
             return data.get("data", []) if data.get("success") else []
         except Exception as e:
-            print(f"[portfolio-dashboard] Error fetching positions: {e}")
+            _logger.warning("Error fetching positions: %s", e)
             return []
 
     @staticmethod
+    @ttl_cache(_ORDERS_TTL)
     def fetch_orders(limit=20):
-        """Fetch recent orders from Alpaca broker."""
+        """Fetch recent orders from Alpaca broker (at most _ORDERS_MAX_LIMIT)."""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{API_BASE}/api/broker/orders",
-                params={"limit": limit},
-                headers=get_headers(),
+                params={"limit": max(1, min(limit, _ORDERS_MAX_LIMIT))},
                 timeout=API_TIMEOUT,
             )
-            data = response.json()
+            if response.status_code != 200:
+                return []
+            data = parse_json(response)
             return data.get("data", []) if data.get("success") else []
         except Exception as e:
-            print(f"[portfolio-dashboard] Error fetching orders: {e}")
+            _logger.warning("Error fetching orders: %s", e)
             return []
 
+    @staticmethod
+    def invalidate_cache():
+        """Drop cached broker reads so the next render reflects a trade or refresh."""
+        PortfolioDashboardComponent.fetch_account.cache_clear()
+        PortfolioDashboardComponent.fetch_positions.cache_clear()
+        PortfolioDashboardComponent.fetch_orders.cache_clear()
+
+    @staticmethod
+    def fetch_all(orders_limit=20):
+        """Fetch account, positions and orders concurrently; returns (account, positions, orders).
+
+        Orders are read on the calling thread while the pool handles the other
+        two, so a render holds two pool workers rather than three plus an idle
+        caller.
+        """
+        f_account = EXECUTOR.submit(PortfolioDashboardComponent.fetch_account)
+        f_positions = EXECUTOR.submit(PortfolioDashboardComponent.fetch_positions)
+        orders = PortfolioDashboardComponent.fetch_orders(orders_limit)
+        return f_account.result(), f_positions.result(), orders
+
     @staticmethod
     def create_dashboard(account, positions, orders, bank_accounts=None, transfer_history=None):
         """Build the full portfolio dashboard card.
@@ -74,39 +240,53 @@ class PortfolioDashboardComponent:
             orders: list of order dicts
             bank_accounts: list of bank account dicts (from dcc.Store)
             transfer_history: list of transfer record dicts (from dcc.Store)
-        """
-        if bank_accounts is None:
-            bank_accounts = DEFAULT_BANK_ACCOUNTS
-        if transfer_history is None:
-            transfer_history = []
 
+        The bank cards and transfer history sit in their own containers
+        (``portfolio-bank-section`` / ``portfolio-transfer-history``) so store
+        edits can refresh just those via build_bank_sections().
+        """
         if account is None:
-            return dbc.Card([
-                dbc.CardHeader(
-                    html.Div([
-                        html.H5("Portfolio Dashboard", className="mb-0 d-inline"),
-                        dbc.Badge("PAPER", color="info", className="ms-2"),
-                    ], className="d-flex align-items-center")
-                ),
-                dbc.CardBody(
-                    dbc.Alert(
-                        "Alpaca broker not configured. Set APCA_API_KEY_ID and APCA_API_SECRET_KEY environment variables to enable paper trading.",
-                        color="warning",
-                    )
+            return _NOT_CONFIGURED_CARD
+
+        soa = _positions_to_soa(positions)
+        bank_section, history_table = PortfolioDashboardComponent.build_bank_sections(
+            bank_accounts, transfer_history
+        )
+
+        return dbc.Card([
+            dbc.CardHeader(
+                html.Div([
+                    html.H5("Portfolio Dashboard", className="mb-0 d-inline"),
+                    dbc.Badge("PAPER", color="info", className="ms-2"),
+                ], className="d-flex align-items-center")
+            ),
+            dbc.CardBody([
+                PortfolioDashboardComponent.build_account_row(account, soa),
+                html.Hr(),
+                PortfolioDashboardComponent.build_positions_row(positions, soa),
+                html.Hr(),
+                PortfolioDashboardComponent._create_pl_bar_chart(positions, soa),
+                html.Hr(),
+                html.Div(bank_section, id="portfolio-bank-section"),
+                html.Hr(),
+                PortfolioDashboardComponent._create_transfer_section(
+                    html.Div(history_table, id="portfolio-transfer-history")
                 ),
-            ])
+                html.Hr(),
+                PortfolioDashboardComponent.build_orders_section(orders),
+            ]),
+        ])
 
+    @staticmethod
+    def build_account_row(account, soa):
+        """Equity / cash / buying power / P&L / day-change summary row."""
         # Alpaca returns all numeric fields as strings
-        portfolio_value = float(account.get("portfolio_value", 0))
-        buying_power = float(account.get("buying_power", 0))
-        cash = float(account.get("cash", 0))
-        equity = float(account.get("equity", 0))
-        last_equity = float(account.get("last_equity", 0) or 0)
+        equity, cash, buying_power, last_equity = (
+            float(account.get(k) or 0) for k in _ACCOUNT_FIELDS
+        )
 
         # P&L totals
-        total_unrealized_pl = sum(float(p.get("unrealized_pl", 0)) for p in positions)
-        total_cost_basis = sum(float(p.get("cost_basis", 0)) for p in positions)
-        total_pl_pct = (total_unrealized_pl / total_cost_basis * 100) if total_cost_basis > 0 else 0
+        total_unrealized_pl, _, total_pl_pct = _aggregate_positions(soa)
         day_change = equity - last_equity if last_equity > 0 else 0
         day_change_pct = (day_change / last_equity * 100) if last_equity > 0 else 0
 
@@ -115,78 +295,83 @@ class PortfolioDashboardComponent:
         day_color = "text-success" if day_change >= 0 else "text-danger"
         day_sign = "+" if day_change >= 0 else ""
 
-        # --- Row 1: Account Summary ---
-        account_row = dbc.Row([
+        return dbc.Row([
             dbc.Col([
-                html.Small("Equity", className="text-muted d-block"),
+                html.Small("Equity", className=_STAT_LABEL_CLASS),
                 html.H4(f"${equity:,.2f}", className="text-info mb-0"),
             ], md=2, className="text-center"),
             dbc.Col([
-                html.Small("Cash", className="text-muted d-block"),
+                html.Small("Cash", className=_STAT_LABEL_CLASS),
                 html.H4(f"${cash:,.2f}", className="text-warning mb-0"),
             ], md=2, className="text-center"),
             dbc.Col([
-                html.Small("Buying Power", className="text-muted d-block"),
+                html.Small("Buying Power", className=_STAT_LABEL_CLASS),
                 html.H4(f"${buying_power:,.2f}", className="text-success mb-0"),
             ], md=2, className="text-center"),
             dbc.Col([
-                html.Small("Unrealized P&L", className="text-muted d-block"),
+                html.Small("Unrealized P&L", className=_STAT_LABEL_CLASS),
                 html.H4(f"{pl_sign}${total_unrealized_pl:,.2f}", className=f"{pl_color} mb-0"),
                 html.Small(f"{pl_sign}{total_pl_pct:.2f}%", className=pl_color),
             ], md=3, className="text-center"),
             dbc.Col([
-                html.Small("Day Change", className="text-muted d-block"),
+                html.Small("Day Change", className=_STAT_LABEL_CLASS),
                 html.H4(f"{day_sign}${day_change:,.2f}", className=f"{day_color} mb-0"),
                 html.Small(f"{day_sign}{day_change_pct:.2f}%", className=day_color),
             ], md=3, className="text-center"),
         ], className="mb-3")
 
-        # --- Row 2: Positions table + Allocation chart ---
-        if positions:
-            pos_rows = []
-            for pos in positions:
-                sym = pos.get("symbol", "?")
-                qty = float(pos.get("qty", 0))
-                avg_cost = float(pos.get("avg_entry_price", 0))
-                current = float(pos.get("current_price", 0))
-                mkt_value = float(pos.get("market_value", 0))
-                pnl = float(pos.get("unrealized_pl", 0))
-                pnl_pct = float(pos.get("unrealized_plpc", 0)) * 100
-                change_today = float(pos.get("change_today", 0)) * 100
-
-                pnl_color = "text-success" if pnl >= 0 else "text-danger"
-                pnl_sign = "+" if pnl >= 0 else ""
-                today_color = "text-success" if change_today >= 0 else "text-danger"
-                today_sign = "+" if change_today >= 0 else ""
-
-                pos_rows.append(html.Tr([
-                    html.Td(html.Strong(sym)),
-                    html.Td(f"{qty:g}"),
-                    html.Td(f"${avg_cost:.2f}"),
-                    html.Td(f"${current:.2f}"),
-                    html.Td(f"${mkt_value:,.2f}"),
-                    html.Td(f"{pnl_sign}${pnl:,.2f}", className=pnl_color),
-                    html.Td(f"{pnl_sign}{pnl_pct:.1f}%", className=pnl_color),
-                    html.Td(f"{today_sign}{change_today:.1f}%", className=today_color),
-                ]))
-
-            positions_table = dbc.Table(
-                [html.Thead(html.Tr([
-                    html.Th("Symbol"), html.Th("Qty"), html.Th("Avg Cost"),
-                    html.Th("Current"), html.Th("Mkt Value"),
-                    html.Th("P&L ($)"), html.Th("P&L (%)"), html.Th("Today"),
-                ]))] + [html.Tbody(pos_rows)],
-                bordered=True, hover=True, responsive=True,
-                className="table-dark table-sm",
+    @staticmethod
+    def build_positions_row(positions, soa):
+        """Positions table beside the allocation donut."""
+        if not positions:
+            return _EMPTY_POSITIONS_ROW
+
+        # plpc/change_today are fractions, which the percentage format
+        # scales for display.
+        pos_rows = [
+            dict(zip(_POSITION_ROW_KEYS, row))
+            for row in zip(
+                soa["symbol"],
+                soa["qty"].tolist(),
+                soa["avg_entry_price"].tolist(),
+                soa["current_price"].tolist(),
+                soa["market_value"].tolist(),
+                soa["unrealized_pl"].tolist(),
+                soa["unrealized_plpc"].tolist(),
+                soa["change_today"].tolist(),
             )
+        ]
+
+        positions_table = dash_table.DataTable(
+            data=pos_rows,
+            columns=_POSITION_COLUMNS,
+            style_table={"overflowX": "auto"},
+            style_cell={
+                "textAlign": "center",
+                "padding": "4px 8px",
+                "fontSize": "13px",
+                "border": "1px solid #444",
+            },
+            style_header={
+                "backgroundColor": "#1a1a2e",
+                "color": "#e0e0e0",
+                "fontWeight": "bold",
+            },
+            style_data={
+                "backgroundColor": "#212529",
+                "color": "#e0e0e0",
+            },
+            style_data_conditional=_POSITION_STYLE_CONDITIONAL,
+            sort_action="native",
+            page_size=_POSITIONS_PAGE_SIZE,
+        )
 
-            allocation_chart = PortfolioDashboardComponent._create_allocation_chart(positions)
-            chart_block = dcc.Graph(figure=allocation_chart, config={"displayModeBar": False})
-        else:
-            positions_table = html.P("No open positions", className="text-muted text-center py-3")
-            chart_block = html.P("No positions to chart", className="text-muted text-center py-3")
+        allocation_chart = PortfolioDashboardComponent._allocation_figure(
+            *PortfolioDashboardComponent._allocation_slices(positions, soa)
+        )
+        chart_block = dcc.Graph(figure=allocation_chart, config={"displayModeBar": False})
 
-        positions_row = dbc.Row([
+        return dbc.Row([
             dbc.Col([
                 html.H6("Open Positions", className="mb-2"),
                 positions_table,
@@ -197,125 +382,105 @@ class PortfolioDashboardComponent:
             ], md=5),
         ])
 
-        # --- P&L Bar Chart ---
-        pl_chart_section = PortfolioDashboardComponent._create_pl_bar_chart(positions)
-
-        # --- Bank Accounts ---
-        bank_section = PortfolioDashboardComponent._create_bank_accounts_section(bank_accounts)
-
-        # --- Transfer Form ---
-        transfer_section = PortfolioDashboardComponent._create_transfer_section(bank_accounts, transfer_history)
-
-        # --- Recent Orders ---
+    @staticmethod
+    def build_orders_section(orders):
+        """Recent-orders table, or a placeholder when there are none."""
         if orders:
-            order_rows = []
-            for order in orders[:20]:
-                submitted_at = order.get("submitted_at", "")
-                if submitted_at and len(submitted_at) > 16:
-                    submitted_at = submitted_at[:16].replace("T", " ")
-
-                sym = order.get("symbol", "?")
-                side = order.get("side", "?")
-                qty = order.get("qty", "?")
-                filled_price = order.get("filled_avg_price")
-                price_display = f"${float(filled_price):.2f}" if filled_price else "-"
-                status = order.get("status", "unknown")
-
-                side_color = "text-success" if side == "buy" else "text-danger"
-                status_colors = {
-                    "filled": "success",
-                    "partially_filled": "info",
-                    "new": "primary",
-                    "accepted": "primary",
-                    "canceled": "secondary",
-                    "rejected": "danger",
-                    "pending_new": "warning",
-                }
-                badge_color = status_colors.get(status, "secondary")
-
-                order_id = order.get("id", "")
-                cancelable = status in ("new", "accepted", "pending_new", "partially_filled")
-
-                action_cell = html.Td("")
-                if cancelable and order_id:
-                    action_cell = html.Td(
-                        dbc.Button(
-                            "Cancel",
-                            id={"type": "order-cancel-btn", "index": order_id},
-                            color="warning",
-                            size="sm",
-                        )
-                    )
-                elif status == "filled" and order_id:
-                    action_cell = html.Td(
-                        dbc.Button(
-                            "Close",
-                            id={"type": "position-close-btn", "index": sym},
-                            color="outline-danger",
-                            size="sm",
-                        )
-                    )
-
-                order_rows.append(html.Tr([
-                    html.Td(submitted_at, className="small"),
-                    html.Td(sym),
-                    html.Td(side.upper(), className=f"{side_color} fw-bold"),
-                    html.Td(str(qty)),
-                    html.Td(price_display),
-                    html.Td(dbc.Badge(status, color=badge_color)),
-                    action_cell,
-                ]))
+            order_rows = [PortfolioDashboardComponent._order_row(order) for order in orders]
 
             orders_table = dbc.Table(
-                [html.Thead(html.Tr([
-                    html.Th("Time"), html.Th("Symbol"), html.Th("Side"),
-                    html.Th("Qty"), html.Th("Fill Price"), html.Th("Status"),
-                    html.Th(""),
-                ]))] + [html.Tbody(order_rows)],
+                [html.Thead(html.Tr(list(map(html.Th, _ORDER_HEADERS)))), html.Tbody(order_rows)],
                 bordered=True, hover=True, responsive=True,
                 className="table-dark table-sm",
             )
-            orders_section = html.Div([
+            return html.Div([
                 html.H6("Recent Orders", className="mb-2"),
                 orders_table,
             ])
-        else:
-            orders_section = html.P("No recent orders", className="text-muted small")
+        return _EMPTY_ORDERS
 
-        return dbc.Card([
-            dbc.CardHeader(
-                html.Div([
-                    html.H5("Portfolio Dashboard", className="mb-0 d-inline"),
-                    dbc.Badge("PAPER", color="info", className="ms-2"),
-                ], className="d-flex align-items-center")
-            ),
-            dbc.CardBody([
-                account_row,
-                html.Hr(),
-                positions_row,
-                html.Hr(),
-                pl_chart_section,
-                html.Hr(),
-                bank_section,
-                html.Hr(),
-                transfer_section,
-                html.Hr(),
-                orders_section,
-            ]),
+    @staticmethod
+    def build_bank_sections(bank_accounts, transfer_history):
+        """(bank cards, transfer history table) for the two store-driven containers."""
+        if bank_accounts is None:
+            bank_accounts = DEFAULT_BANK_ACCOUNTS
+        return (
+            PortfolioDashboardComponent._create_bank_accounts_section(bank_accounts),
+            PortfolioDashboardComponent._create_transfer_history(transfer_history or []),
+        )
+
+    @staticmethod
+    def _order_row(order):
+        """One recent-orders table row, with a Cancel or Close button when applicable."""
+        submitted_at = order.get("submitted_at", "")
+        if submitted_at and len(submitted_at) > 16:
+            submitted_at = submitted_at[:16].replace("T", " ")
+
+        sym = order.get("symbol", "?")
+        side = order.get("side", "?")
+        qty = order.get("qty", "?")
+        filled_price = order.get("filled_avg_price")
+        price_display = f"${float(filled_price):.2f}" if filled_price else "-"
+        status = order.get("status", "unknown")
+
+        side_color = "text-success" if side == "buy" else "text-danger"
+        badge_color = _ORDER_STATUS_COLORS.get(status, "secondary")
+
+        order_id = order.get("id", "")
+        cancelable = status in _CANCELABLE_STATUSES
+
+        action_cell = html.Td("")
+        if cancelable and order_id:
+            action_cell = html.Td(
+                dbc.Button(
+                    "Cancel",
+                    id={"type": "order-cancel-btn", "index": order_id},
+                    color="warning",
+                    size="sm",
+                )
+            )
+        elif status == "filled" and order_id:
+            action_cell = html.Td(
+                dbc.Button(
+                    "Close",
+                    id={"type": "position-close-btn", "index": sym},
+                    color="outline-danger",
+                    size="sm",
+                )
+            )
+
+        return html.Tr([
+            html.Td(submitted_at, className="small"),
+            html.Td(sym),
+            html.Td(side.upper(), className=f"{side_color} fw-bold"),
+            *map(html.Td, (str(qty), price_display, dbc.Badge(status, color=badge_color))),
+            action_cell,
         ])
 
     @staticmethod
     def _create_allocation_chart(positions):
         """Create a donut pie chart showing portfolio allocation by position."""
-        labels = []
-        values = []
-        for pos in positions:
-            sym = pos.get("symbol", "?")
-            mkt_value = abs(float(pos.get("market_value", 0)))
-            if mkt_value > 0:
-                labels.append(sym)
-                values.append(mkt_value)
+        return PortfolioDashboardComponent._allocation_pie(
+            *PortfolioDashboardComponent._allocation_slices(positions)
+        )
+
+    @staticmethod
+    def _allocation_slices(positions, soa=None):
+        """(symbols, absolute market values) of the positions worth charting.
+
+        Pass the render's _positions_to_soa() columns as ``soa`` to skip
+        re-parsing the position dicts.
+        """
+        if soa is None:
+            soa = _positions_to_soa(positions)
+        mkt_values = np.abs(soa["market_value"])
+        keep = np.flatnonzero(mkt_values > 0)
+        symbols = soa["symbol"]
+        return [symbols[i] for i in keep], mkt_values[keep].tolist()
 
+    @staticmethod
+    def _allocation_pie(labels, values):
+        """Allocation donut for parallel symbol/value lists."""
         if not labels:
             fig = go.Figure()
             fig.add_annotation(
@@ -328,6 +493,25 @@ class PortfolioDashboardComponent:
             )
             return fig
 
+        # Largest positions get their own slice; the long tail and any dust
+        # below _ALLOCATION_MIN_SHARE are one "Other" slice whose hover lists
+        # the symbols it covers.
+        hover = {}
+        ranked = sorted(zip(values, labels), reverse=True)
+        floor = sum(values) * _ALLOCATION_MIN_SHARE
+        n_head = next(
+            (i for i, (v, _) in enumerate(ranked[:_ALLOCATION_TOP_N]) if v < floor),
+            min(len(ranked), _ALLOCATION_TOP_N),
+        )
+        if n_head < len(ranked):
+            head, tail = ranked[:n_head], ranked[n_head:]
+            values = [v for v, _ in head] + [sum(v for v, _ in tail)]
+            labels = [sym for _, sym in head] + ["Other"]
+            hover = dict(
+                customdata=[""] * n_head + [", ".join(sym for _, sym in tail)],
+                hovertemplate="%{label}<br>$%{value:,.2f} (%{percent})<br>%{customdata}<extra></extra>",
+            )
+
         fig = go.Figure(data=[go.Pie(
             labels=labels,
             values=values,
@@ -335,6 +519,7 @@ class PortfolioDashboardComponent:
             textinfo="label+percent",
             textfont=dict(size=11),
             marker=dict(line=dict(color="#1a1a2e", width=2)),
+            **hover,
         )])
         fig.update_layout(
             template="plotly_dark",
@@ -345,70 +530,114 @@ class PortfolioDashboardComponent:
         return fig
 
     @staticmethod
-    def _create_pl_bar_chart(positions):
-        """Create a horizontal bar chart showing P&L per position."""
-        if not positions:
-            return html.Div()
+    @memoize_figure(maxsize=32)
+    def _allocation_figure(labels, values):
+        """Allocation donut as a cached figure dict, ready for dcc.Graph.
 
-        sorted_positions = sorted(
-            positions,
-            key=lambda p: float(p.get("unrealized_pl", 0)),
-            reverse=True,
-        )
+        Keyed on the charted symbols and values only, so renders where other
+        position fields moved still reuse the figure.
+        """
+        return PortfolioDashboardComponent._allocation_pie(labels, values)
 
-        symbols = [p.get("symbol", "?") for p in sorted_positions]
-        pnl_values = [float(p.get("unrealized_pl", 0)) for p in sorted_positions]
-        colors = ["#00CC96" if v >= 0 else "#EF553B" for v in pnl_values]
-
-        fig = go.Figure(data=[go.Bar(
-            y=symbols,
-            x=pnl_values,
-            orientation="h",
-            marker=dict(color=colors),
-            text=[f"${v:+,.2f}" for v in pnl_values],
-            textposition="auto",
-            textfont=dict(size=11),
-        )])
-        fig.update_layout(
-            template="plotly_dark",
-            height=max(200, len(symbols) * 40),
-            margin=dict(l=60, r=20, t=10, b=10),
-            xaxis=dict(title="P&L ($)", gridcolor="rgba(255,255,255,0.1)"),
-            yaxis=dict(autorange="reversed"),
-            plot_bgcolor="rgba(0,0,0,0)",
-            paper_bgcolor="rgba(0,0,0,0)",
-        )
-        fig.add_vline(x=0, line_dash="dash", line_color="rgba(255,255,255,0.3)")
+    @staticmethod
+    def _create_pl_bar_chart(positions, soa=None):
+        """Create a horizontal bar chart showing P&L per position.
+
+        Pass the render's _positions_to_soa() columns as ``soa`` to skip
+        re-parsing the position dicts.
+        """
+        if not positions:
+            return _EMPTY_CHART
+
+        if soa is None:
+            soa = _positions_to_soa(positions)
+        pnl = soa["unrealized_pl"]
+        symbols = soa["symbol"]
+        title = "P&L by Position"
+        if len(pnl) > _PL_CHART_MAX_BARS:
+            # Keep the biggest movers either way so the chart height stays bounded.
+            shown = np.sort(np.argpartition(-np.abs(pnl), _PL_CHART_MAX_BARS)[:_PL_CHART_MAX_BARS])
+            symbols = [symbols[i] for i in shown]
+            pnl = pnl[shown]
+            title = f"P&L by Position (top {_PL_CHART_MAX_BARS} by size)"
 
         return html.Div([
-            html.H6("P&L by Position", className="mb-2"),
-            dcc.Graph(figure=fig, config={"displayModeBar": False}),
+            html.H6(title, className="mb-2"),
+            dcc.Graph(
+                figure=PortfolioDashboardComponent._pl_bar_figure(
+                    symbols,
+                    pnl.tolist(),
+                ),
+                config={"displayModeBar": False},
+            ),
         ])
 
+    @staticmethod
+    @memoize_figure(maxsize=32)
+    def _pl_bar_figure(symbols, pnl_values):
+        """P&L-per-position bars as a cached figure dict, keyed on (symbol, P&L) only."""
+        pnl = np.asarray(pnl_values, dtype=np.float64)
+        # Stable, so equal P&L keeps the broker's order like sorted() did.
+        order = np.argsort(-pnl, kind="stable")
+        symbols = np.asarray(symbols, dtype=object)[order].tolist()
+        pnl_values = pnl[order].tolist()
+        colors = np.where(pnl >= 0, "#00CC96", "#EF553B")[order].tolist()
+
+        # Plain dict: the inputs are already clean, so plotly's per-attribute
+        # validation is skipped.
+        return {
+            "data": [{
+                "type": "bar",
+                "y": symbols,
+                "x": pnl_values,
+                "orientation": "h",
+                "marker": {"color": colors},
+                # Labels are formatted by plotly.js, like the table's _SIGNED_MONEY.
+                "texttemplate": "%{x:+$,.2f}",
+                "textposition": "auto",
+                "textfont": {"size": 11},
+            }],
+            "layout": {
+                "template": dark_template(),
+                "height": max(200, len(symbols) * 40),
+                "margin": {"l": 60, "r": 20, "t": 10, "b": 10},
+                "xaxis": {"title": {"text": "P&L ($)"}, "gridcolor": "rgba(255,255,255,0.1)"},
+                "yaxis": {"autorange": "reversed"},
+                "plot_bgcolor": "rgba(0,0,0,0)",
+                "paper_bgcolor": "rgba(0,0,0,0)",
+                # Zero line, as fig.add_vline(x=0) would draw it.
+                "shapes": [{
+                    "type": "line", "x0": 0, "x1": 0, "xref": "x",
+                    "y0": 0, "y1": 1, "yref": "y domain",
+                    "line": {"color": "rgba(255,255,255,0.3)", "dash": "dash"},
+                }],
+            },
+        }
+
+    @staticmethod
+    def _bank_card(bank):
+        """Card column for one linked bank account."""
+        icon_style, card_style = _bank_styles(bank.get("color", "#888"))
+        return dbc.Col([
+            dbc.Card([
+                dbc.CardBody([
+                    html.Div([
+                        html.I(className="fas fa-university me-2", style=icon_style),
+                        html.Div([
+                            html.Strong(bank.get("name", "Bank"), className="d-block"),
+                            html.Small(f"****{bank.get('lastFour', '0000')}", className="text-muted"),
+                        ]),
+                    ], className="d-flex align-items-center mb-2"),
+                    html.H4(f"${bank.get('balance', 0):,.2f}", className="mb-0"),
+                    html.Small("Transferred total", className="text-muted"),
+                ]),
+            ], style=card_style),
+        ], md=6)
+
     @staticmethod
     def _create_bank_accounts_section(bank_accounts):
         """Create bank account cards for PNC and Capital One."""
-        cards = []
-        for bank in bank_accounts:
-            balance = bank.get("balance", 0)
-            color = bank.get("color", "#888")
-            cards.append(
-                dbc.Col([
-                    dbc.Card([
-                        dbc.CardBody([
-                            html.Div([
-                                html.I(className="fas fa-university me-2", style={"color": color, "fontSize": "1.3rem"}),
-                                html.Div([
-                                    html.Strong(bank.get("name", "Bank"), className="d-block"),
-                                    html.Small(f"****{bank.get('lastFour', '0000')}", className="text-muted"),
-                                ]),
-                            ], className="d-flex align-items-center mb-2"),
-                            html.H4(f"${balance:,.2f}", className="mb-0"),
-                            html.Small("Transferred total", className="text-muted"),
-                        ]),
-                    ], style={"borderLeft": f"4px solid {color}"}),
-                ], md=6),
-            )
+        cards = [PortfolioDashboardComponent._bank_card(bank) for bank in bank_accounts]
 
         return html.Div([
             html.H6("Linked Bank Accounts", className="mb-2"),
@@ -416,22 +645,49 @@ class PortfolioDashboardComponent:
         ])
 
     @staticmethod
-    def _create_transfer_section(bank_accounts, transfer_history):
-        """Create the transfer form and history table."""
-        pnc = next((b for b in bank_accounts if b["id"] == "pnc"), bank_accounts[0] if bank_accounts else {})
-        cap1 = next((b for b in bank_accounts if b["id"] == "cap1"), bank_accounts[1] if len(bank_accounts) > 1 else {})
-
-        preset_buttons = []
-        for label, pnc_pct in [("20/80", 20), ("40/60", 40), ("50/50", 50), ("60/40", 60), ("80/20", 80)]:
-            preset_buttons.append(
-                dbc.Button(
-                    label,
-                    id={"type": "transfer-preset-btn", "index": pnc_pct},
-                    color="outline-primary",
-                    size="sm",
-                    className="me-1",
-                )
+    def _transfer_row(t):
+        """One transfer-history table row."""
+        date_str = t.get("date", "")
+        if date_str and len(date_str) > 10:
+            date_str = date_str[:10]
+        splits = {s.get("bankId"): s for s in t.get("splits", [])}
+        pnc_split, cap1_split = splits.get("pnc"), splits.get("cap1")
+
+        return html.Tr([
+            html.Td(date_str, className="small"),
+            *map(html.Td, (
+                f"${t.get('totalAmount', 0):,.2f}", _fmt_split(pnc_split), _fmt_split(cap1_split),
+            )),
+        ])
+
+    @staticmethod
+    def _create_transfer_history(transfer_history):
+        """Table of the 20 most recent transfers."""
+        if transfer_history:
+            history_rows = [
+                PortfolioDashboardComponent._transfer_row(t) for t in transfer_history[:20]
+            ]
+
+            return dbc.Table(
+                [html.Thead(html.Tr(list(map(html.Th, _TRANSFER_HEADERS)))), html.Tbody(history_rows)],
+                bordered=True, hover=True, responsive=True,
+                className="table-dark table-sm mt-3",
             )
+        return _EMPTY_TRANSFERS
+
+    @staticmethod
+    def _create_transfer_section(history_table):
+        """Create the transfer form above the given history table."""
+        preset_buttons = [
+            dbc.Button(
+                label,
+                id={"type": "transfer-preset-btn", "index": pnc_pct},
+                color="outline-primary",
+                size="sm",
+                className="me-1",
+            )
+            for label, pnc_pct in _TRANSFER_PRESETS
+        ]
 
         transfer_form = dbc.Card([
             dbc.CardBody([
@@ -472,36 +728,6 @@ class PortfolioDashboardComponent:
             ]),
         ])
 
-        # Transfer history
-        if transfer_history:
-            history_rows = []
-            for t in transfer_history[:20]:
-                date_str = t.get("date", "")
-                if date_str and len(date_str) > 10:
-                    date_str = date_str[:10]
-                total = t.get("totalAmount", 0)
-                splits = t.get("splits", [])
-                pnc_split = next((s for s in splits if s.get("bankId") == "pnc"), None)
-                cap1_split = next((s for s in splits if s.get("bankId") == "cap1"), None)
-
-                history_rows.append(html.Tr([
-                    html.Td(date_str, className="small"),
-                    html.Td(f"${total:,.2f}"),
-                    html.Td(f"${pnc_split['amount']:,.2f} ({pnc_split['pct']}%)" if pnc_split else "-"),
-                    html.Td(f"${cap1_split['amount']:,.2f} ({cap1_split['pct']}%)" if cap1_split else "-"),
-                ]))
-
-            history_table = dbc.Table(
-                [html.Thead(html.Tr([
-                    html.Th("Date"), html.Th("Total"),
-                    html.Th("PNC"), html.Th("Capital One"),
-                ]))] + [html.Tbody(history_rows)],
-                bordered=True, hover=True, responsive=True,
-                className="table-dark table-sm mt-3",
-            )
-        else:
-            history_table = html.P("No transfers yet", className="text-muted small mt-3")
-
         return html.Div([
             transfer_form,
             html.H6("Transfer History", className="mt-3 mb-2"),
@@ -10,27 +10,133 @@ Multi-dimensional risk visualization using a radar/spider chart showing:
 - Sentiment Risk (news volatility)
 """
 
+import heapq
+import logging
+from operator import itemgetter
+
+import numpy as np
 import plotly.graph_objects as go
 import dash_bootstrap_components as dbc
 from dash import html
 from typing import Dict, List, Any, Optional
-import requests
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import API_BASE, API_TIMEOUT, SESSION, parse_json, ttl_cache
+from components.figure_cache import memoize_figure
+
+_logger = logging.getLogger(__name__)
+
+# Seconds a radar read is reused, and how long past that a cached radar may
+# stand in when a refresh fails.
+_RADAR_TTL = 30
+_RADAR_STALE = 300
+
+# Risk dimensions in display order: chart labels, score keys, and the score
+# assumed when a key is missing.
+_DIMENSIONS = (
+    "Market Risk",
+    "Volatility",
+    "Liquidity",
+    "Event Risk",
+    "Concentration",
+    "Sentiment",
+)
+_DIMENSIONS_CLOSED = _DIMENSIONS + (_DIMENSIONS[0],)
+_RISK_KEYS = (
+    "market_risk",
+    "volatility_risk",
+    "liquidity_risk",
+    "event_risk",
+    "concentration_risk",
+    "sentiment_risk",
+)
+_RISK_DEFAULTS = (50, 50, 30, 30, 50, 50)
+# Short names for the card's top-factor list, in _RISK_KEYS order.
+_FACTOR_NAMES = ("Market", "Volatility", "Liquidity", "Event", "Concentration", "Sentiment")
+
+# Score bands, looked up with np.searchsorted(..., side="right"): below 30,
+# 30-50, 50-70 and 70+. Shared by the overall level and the breakdown bars.
+_RISK_THRESHOLDS = np.array([30, 50, 70])
+_LEVEL_LABELS = ("Low", "Moderate", "Elevated", "High")
+_LEVEL_COLORS = ("success", "info", "warning", "danger")
+_BAR_COLORS = np.array(["#00cc88", "#00ccff", "#ffaa00", "#ff4444"])
+
+# Top-factor text classes: up to 40, up to 60, above 60 (side="left").
+_FACTOR_THRESHOLDS = np.array([40, 60])
+_FACTOR_CLASSES = np.array(["text-success", "text-warning", "text-danger"])
+
+
+def _risk_values(risk: Dict[str, float]) -> List[float]:
+    """Scores for each dimension in _RISK_KEYS order, defaults filled in."""
+    return [risk.get(k, d) for k, d in zip(_RISK_KEYS, _RISK_DEFAULTS)]
+
+
+_NAN = float("nan")
+
+
+def _num(value) -> float:
+    """value as a float, or NaN if it is not a number."""
+    return float(value) if isinstance(value, (int, float)) else _NAN
+
+
+def _risk_scores(beta, volatility, max_dd, sent_conf, positive, negative, total, tech_conf):
+    """Risk scores (0-100) in _RISK_KEYS order from raw analysis inputs.
+
+    Works on scalars or equal-length arrays alike. A NaN input means the
+    analysis lacked it; that dimension keeps its default (or, for max_dd and
+    the article counts, skips its adjustment).
+    """
+    # Market risk from beta: > 1.5 is high risk, < 0.5 is low
+    market = np.where(np.isnan(beta), 50.0, np.clip(beta * 50, 0, 100))
+
+    # Volatility risk: annualized vol > 50% is very high risk, blended with
+    # max drawdown when it is known
+    vol = np.where(np.isnan(volatility), 50.0, np.clip(volatility * 2, 0, 100))
+    vol = np.where(np.isnan(max_dd), vol, np.clip(vol * 0.6 + np.abs(max_dd) * 2 * 0.4, 0, 100))
+
+    # Sentiment risk: low confidence = high uncertainty; mixed article
+    # sentiment raises it further
+    sent = np.where(np.isnan(sent_conf), 50.0, np.clip((1 - sent_conf) * 100, 0, 100))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        balance = np.abs(positive - negative) / total
+    sent = np.where((total > 0) & ~np.isnan(balance), np.clip(sent * 0.5 + (1 - balance) * 100 * 0.5, 0, 100), sent)
+
+    # Lower technical confidence = higher event/uncertainty risk
+    event = np.where(np.isnan(tech_conf), 30.0, np.clip((1 - tech_conf) * 60 + 20, 0, 100))
+
+    liquidity = np.full_like(market, 30.0)
+    concentration = np.full_like(market, 50.0)
+    return market, vol, liquidity, event, concentration, sent
+
+
+def _risk_inputs(analysis: Dict) -> tuple:
+    """Raw _risk_scores arguments pulled from one /api/analyze response."""
+    quant = analysis.get("quantitative") or analysis.get("quant") or {}
+    metrics = quant.get("metrics", {}) if quant else {}
+    sentiment = analysis.get("sentiment", {})
+    sent_metrics = sentiment.get("metrics", {}) if sentiment else {}
+    technical = analysis.get("technical", {})
+
+    # Inputs for sections the analysis lacks are NaN, which the kernel
+    # maps to the default score.
+    return (
+        _num(metrics.get("beta", 1.0)) if quant else _NAN,
+        # volatility and max_drawdown from the quant engine are already
+        # percentages (e.g. 25.0 for 25%)
+        _num(metrics.get("volatility", 20.0)) if quant else _NAN,
+        _num(metrics.get("max_drawdown", 0)) if quant else _NAN,
+        _num(sentiment.get("confidence", 0.5)) if sentiment else _NAN,
+        _num(sent_metrics.get("positive_articles", 0)),
+        _num(sent_metrics.get("negative_articles", 0)),
+        _num(sent_metrics.get("total_articles", 1)) if sentiment else _NAN,
+        _num(technical.get("confidence", 0.5)) if technical else _NAN,
+    )
 
 
 class RiskRadarComponent:
     """Component for displaying multi-dimensional risk analysis"""
 
     # Risk dimension labels
-    DIMENSIONS = [
-        "Market Risk",
-        "Volatility",
-        "Liquidity",
-        "Event Risk",
-        "Concentration",
-        "Sentiment",
-    ]
+    DIMENSIONS = list(_DIMENSIONS)
 
     # Descriptions for each dimension
     DIMENSION_INFO = {
@@ -43,22 +149,22 @@ class RiskRadarComponent:
     }
 
     @staticmethod
+    @ttl_cache(_RADAR_TTL, stale=_RADAR_STALE)
     def fetch_risk_radar(symbol: Optional[str] = None) -> Optional[Dict]:
         """Fetch risk radar data from API"""
         try:
             endpoint = f"/api/risk/radar/{symbol}" if symbol else "/api/risk/radar"
-            response = requests.get(
+            response = SESSION.get(
                 f"{API_BASE}{endpoint}",
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get("success"):
                     return data.get("data")
             return None
         except Exception as e:
-            print(f"Error fetching risk radar: {e}")
+            _logger.warning("Error fetching risk radar: %s", e)
             return None
 
     @staticmethod
@@ -72,71 +178,23 @@ class RiskRadarComponent:
         Returns:
             Dictionary with risk scores (0-100) for each dimension
         """
-        risk_scores = {
-            "market_risk": 50.0,
-            "volatility_risk": 50.0,
-            "liquidity_risk": 30.0,
-            "event_risk": 30.0,
-            "concentration_risk": 50.0,
-            "sentiment_risk": 50.0,
-        }
-
-        # Extract from quantitative analysis
-        quant = analysis.get("quantitative") or analysis.get("quant") or {}
-        if quant:
-            metrics = quant.get("metrics", {})
-
-            # Market risk from beta
-            beta = metrics.get("beta", 1.0)
-            if isinstance(beta, (int, float)):
-                # Beta > 1.5 is high risk, < 0.5 is low
-                risk_scores["market_risk"] = min(100, max(0, beta * 50))
-
-            # Volatility risk
-            # volatility from quant engine is already a percentage (e.g. 25.0 for 25%)
-            volatility = metrics.get("volatility", 20.0)
-            if isinstance(volatility, (int, float)):
-                # Annualized vol > 50% is very high risk
-                risk_scores["volatility_risk"] = min(100, max(0, volatility * 2))
-
-            # Max drawdown contributes to volatility risk
-            # max_drawdown from quant engine is already a percentage (e.g. 15.0 for 15%)
-            max_dd = metrics.get("max_drawdown", 0)
-            if isinstance(max_dd, (int, float)):
-                risk_scores["volatility_risk"] = min(100, max(0,
-                    risk_scores["volatility_risk"] * 0.6 + abs(max_dd) * 2 * 0.4
-                ))
-
-        # Sentiment risk from sentiment analysis
-        sentiment = analysis.get("sentiment", {})
-        if sentiment:
-            metrics = sentiment.get("metrics", {})
-            confidence = sentiment.get("confidence", 0.5)
-
-            # Low confidence = high uncertainty = high sentiment risk
-            risk_scores["sentiment_risk"] = min(100, max(0, (1 - confidence) * 100))
-
-            # Check article distribution
-            positive = metrics.get("positive_articles", 0)
-            negative = metrics.get("negative_articles", 0)
-            total = metrics.get("total_articles", 1)
-
-            if total > 0:
-                # Mixed sentiment = higher risk
-                balance = abs(positive - negative) / total
-                risk_scores["sentiment_risk"] = min(100, max(0,
-                    risk_scores["sentiment_risk"] * 0.5 + (1 - balance) * 100 * 0.5
-                ))
-
-        # Technical analysis contribution
-        technical = analysis.get("technical", {})
-        if technical:
-            confidence = technical.get("confidence", 0.5)
-            # Lower confidence = higher event/uncertainty risk
-            risk_scores["event_risk"] = min(100, max(0, (1 - confidence) * 60 + 20))
-
-        # Ensure all scores are clamped to 0-100
-        return {k: min(100.0, max(0.0, v)) for k, v in risk_scores.items()}
+        scores = _risk_scores(*_risk_inputs(analysis))
+        return {k: float(v) for k, v in zip(_RISK_KEYS, scores)}
+
+    @staticmethod
+    def calculate_risk_from_portfolio(analyses: List[Dict]) -> np.ndarray:
+        """
+        Calculate risk scores for many analyses at once
+
+        Args:
+            analyses: Unified analysis responses, one per symbol
+
+        Returns:
+            Array of shape (len(analyses), 6) with columns market, volatility,
+            liquidity, event, concentration and sentiment risk (0-100)
+        """
+        inputs = np.array([_risk_inputs(a) for a in analyses], dtype=np.float64).reshape(-1, 8)
+        return np.column_stack(_risk_scores(*inputs.T))
 
     @staticmethod
     def create_risk_card(risk_data: Dict, symbol: Optional[str] = None) -> dbc.Card:
@@ -153,43 +211,22 @@ class RiskRadarComponent:
             )
 
         # Calculate overall risk score
-        risk_values = [
-            risk_data.get("market_risk", 50),
-            risk_data.get("volatility_risk", 50),
-            risk_data.get("liquidity_risk", 30),
-            risk_data.get("event_risk", 30),
-            risk_data.get("concentration_risk", 50),
-            risk_data.get("sentiment_risk", 50),
-        ]
-        avg_risk = sum(risk_values) / len(risk_values)
+        risk_values = _risk_values(risk_data)
+        avg_risk = sum(risk_values) / len(_RISK_KEYS)
 
         # Determine risk level
-        if avg_risk < 30:
-            risk_level = "Low"
-            risk_color = "success"
-        elif avg_risk < 50:
-            risk_level = "Moderate"
-            risk_color = "info"
-        elif avg_risk < 70:
-            risk_level = "Elevated"
-            risk_color = "warning"
-        else:
-            risk_level = "High"
-            risk_color = "danger"
+        band = int(np.searchsorted(_RISK_THRESHOLDS, avg_risk, side="right"))
+        risk_level = _LEVEL_LABELS[band]
+        risk_color = _LEVEL_COLORS[band]
 
         title = f"Risk Radar - {symbol}" if symbol else "Portfolio Risk Radar"
 
         # Find highest risk dimensions
-        risk_items = [
-            ("Market", risk_data.get("market_risk", 50)),
-            ("Volatility", risk_data.get("volatility_risk", 50)),
-            ("Liquidity", risk_data.get("liquidity_risk", 30)),
-            ("Event", risk_data.get("event_risk", 30)),
-            ("Concentration", risk_data.get("concentration_risk", 50)),
-            ("Sentiment", risk_data.get("sentiment_risk", 50)),
-        ]
-        sorted_risks = sorted(risk_items, key=lambda x: x[1], reverse=True)
-        top_risks = sorted_risks[:2]
+        risk_items = list(zip(_FACTOR_NAMES, risk_values))
+        top_risks = heapq.nlargest(2, risk_items, key=itemgetter(1))
+        top_classes = _FACTOR_CLASSES[
+            np.searchsorted(_FACTOR_THRESHOLDS, [score for _, score in top_risks], side="left")
+        ].tolist()
 
         return dbc.Card(
             dbc.CardBody(
@@ -226,11 +263,8 @@ class RiskRadarComponent:
                             html.Small("Top Risk Factors:", className="text-muted"),
                             html.Ul(
                                 [
-                                    html.Li(
-                                        f"{name}: {score:.0f}",
-                                        className=f"text-{'danger' if score > 60 else 'warning' if score > 40 else 'success'}",
-                                    )
-                                    for name, score in top_risks
+                                    html.Li(f"{name}: {score:.0f}", className=cls)
+                                    for (name, score), cls in zip(top_risks, top_classes)
                                 ],
                                 className="mb-0 ps-3",
                             ),
@@ -242,11 +276,12 @@ class RiskRadarComponent:
         )
 
 
+@memoize_figure()
 def create_risk_radar_chart(
     current_risk: Dict[str, float],
     target_risk: Optional[Dict[str, float]] = None,
     title: str = "Risk Radar",
-) -> go.Figure:
+) -> Dict:
     """
     Create a radar/spider chart for multi-dimensional risk visualization
 
@@ -256,30 +291,13 @@ def create_risk_radar_chart(
         title: Chart title
 
     Returns:
-        Plotly figure with radar chart
+        Plotly figure dict with radar chart (cached by input)
     """
-    categories = [
-        "Market Risk",
-        "Volatility",
-        "Liquidity",
-        "Event Risk",
-        "Concentration",
-        "Sentiment",
-    ]
-
     # Extract values in order
-    current_values = [
-        current_risk.get("market_risk", 50),
-        current_risk.get("volatility_risk", 50),
-        current_risk.get("liquidity_risk", 30),
-        current_risk.get("event_risk", 30),
-        current_risk.get("concentration_risk", 50),
-        current_risk.get("sentiment_risk", 50),
-    ]
+    current_values = _risk_values(current_risk)
 
     # Close the polygon
     current_values_closed = current_values + [current_values[0]]
-    categories_closed = categories + [categories[0]]
 
     fig = go.Figure()
 
@@ -287,7 +305,7 @@ def create_risk_radar_chart(
     fig.add_trace(
         go.Scatterpolar(
             r=current_values_closed,
-            theta=categories_closed,
+            theta=_DIMENSIONS_CLOSED,
             fill="toself",
             fillcolor="rgba(255, 99, 71, 0.3)",
             line=dict(color="#ff6347", width=2),
@@ -298,20 +316,13 @@ def create_risk_radar_chart(
 
     # Target risk profile (if provided)
     if target_risk:
-        target_values = [
-            target_risk.get("market_risk", 50),
-            target_risk.get("volatility_risk", 50),
-            target_risk.get("liquidity_risk", 30),
-            target_risk.get("event_risk", 30),
-            target_risk.get("concentration_risk", 50),
-            target_risk.get("sentiment_risk", 50),
-        ]
+        target_values = _risk_values(target_risk)
         target_values_closed = target_values + [target_values[0]]
 
         fig.add_trace(
             go.Scatterpolar(
                 r=target_values_closed,
-                theta=categories_closed,
+                theta=_DIMENSIONS_CLOSED,
                 fill="toself",
                 fillcolor="rgba(0, 204, 136, 0.2)",
                 line=dict(color="#00cc88", width=2, dash="dash"),
@@ -358,7 +369,8 @@ def create_risk_radar_chart(
     return fig
 
 
-def create_risk_breakdown_bars(risk_data: Dict[str, float]) -> go.Figure:
+@memoize_figure()
+def create_risk_breakdown_bars(risk_data: Dict[str, float]) -> Dict:
     """
     Create a horizontal bar chart showing risk breakdown by dimension
 
@@ -366,42 +378,17 @@ def create_risk_breakdown_bars(risk_data: Dict[str, float]) -> go.Figure:
         risk_data: Risk scores for each dimension
 
     Returns:
-        Plotly figure with bar chart
+        Plotly figure dict with bar chart (cached by input)
     """
-    dimensions = [
-        "Market Risk",
-        "Volatility",
-        "Liquidity",
-        "Event Risk",
-        "Concentration",
-        "Sentiment",
-    ]
-
-    values = [
-        risk_data.get("market_risk", 50),
-        risk_data.get("volatility_risk", 50),
-        risk_data.get("liquidity_risk", 30),
-        risk_data.get("event_risk", 30),
-        risk_data.get("concentration_risk", 50),
-        risk_data.get("sentiment_risk", 50),
-    ]
+    values = _risk_values(risk_data)
 
     # Color based on risk level
-    colors = []
-    for v in values:
-        if v < 30:
-            colors.append("#00cc88")
-        elif v < 50:
-            colors.append("#00ccff")
-        elif v < 70:
-            colors.append("#ffaa00")
-        else:
-            colors.append("#ff4444")
+    colors = _BAR_COLORS[np.searchsorted(_RISK_THRESHOLDS, values, side="right")].tolist()
 
     fig = go.Figure(
         go.Bar(
             x=values,
-            y=dimensions,
+            y=_DIMENSIONS,
             orientation="h",
             marker_color=colors,
             text=[f"{v:.0f}" for v in values],
@@ -8,57 +8,142 @@ Visualizes the rate of change in market sentiment with:
 - Trading signal badges
 """
 
+import bisect
+import logging
+import time
+
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import dash_bootstrap_components as dbc
 from dash import html, dcc
 from typing import Dict, List, Any, Optional
-import requests
 
-from components.config import API_BASE, get_headers, API_TIMEOUT
+from components.config import API_BASE, API_TIMEOUT, EXECUTOR, SESSION, parse_json, ttl_cache
+from components.figure_cache import memoize_figure
+
+_logger = logging.getLogger(__name__)
+
+# Seconds each read is reused: velocity tracks the latest articles, history
+# only grows. A failed refresh may fall back to a result up to
+# _SENTIMENT_STALE seconds past its TTL.
+_VELOCITY_TTL = 5
+_HISTORY_TTL = 30
+_SENTIMENT_STALE = 300
+
+# After a 404/405 from the combined dashboard route (an older backend), skip it
+# for this many seconds so fetch_all goes straight to the per-endpoint reads.
+_BUNDLE_RETRY = 300
+_bundle_missing_at = None
+
+# Velocity bands (per day) for bisect_left, each closed above: up to -2,
+# -2 to -0.5, -0.5 to 0.5 (flat), 0.5 to 2, above 2. Card colors/icons and
+# gauge bar colors follow the same bands.
+_VELOCITY_THRESHOLDS = (-2.0, -0.5, 0.5, 2.0)
+_VELOCITY_COLORS = ("danger", "warning", "secondary", "info", "success")
+_VELOCITY_ICONS = (
+    "bi-arrow-down-circle-fill",
+    "bi-arrow-down-right",
+    "bi-dash-circle",
+    "bi-arrow-up-right",
+    "bi-arrow-up-circle-fill",
+)
+_GAUGE_BAR_COLORS = ("#ff0000", "#ff8800", "#888888", "#00cc88", "#00ff00")
+
+_SIGNAL_COLORS = {
+    "AcceleratingPositive": "success",
+    "AcceleratingNegative": "danger",
+    "Decelerating": "warning",
+    "TurningPoint": "info",
+    "Stable": "secondary",
+}
 
 
 class SentimentVelocityComponent:
     """Component for displaying sentiment velocity analysis"""
 
     @staticmethod
+    @ttl_cache(_VELOCITY_TTL, stale=_SENTIMENT_STALE)
     def fetch_velocity_data(symbol: str, days: int = 7) -> Optional[Dict]:
         """Fetch sentiment velocity data from API"""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{API_BASE}/api/sentiment/{symbol}/velocity",
                 params={"days": days},
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get("success"):
                     return data.get("data")
             return None
         except Exception as e:
-            print(f"Error fetching velocity data: {e}")
+            _logger.warning("Error fetching velocity data: %s", e)
             return None
 
     @staticmethod
+    @ttl_cache(_HISTORY_TTL, stale=_SENTIMENT_STALE)
     def fetch_history_data(symbol: str, days: int = 30) -> Optional[Dict]:
         """Fetch sentiment history data from API"""
         try:
-            response = requests.get(
+            response = SESSION.get(
                 f"{API_BASE}/api/sentiment/{symbol}/history",
                 params={"days": days},
-                headers=get_headers(),
                 timeout=API_TIMEOUT,
             )
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data.get("success"):
                     return data.get("data")
             return None
         except Exception as e:
-            print(f"Error fetching history data: {e}")
+            _logger.warning("Error fetching history data: %s", e)
             return None
 
+    @staticmethod
+    @ttl_cache(_VELOCITY_TTL, stale=_SENTIMENT_STALE)
+    def fetch_dashboard_bundle(symbol: str, velocity_days: int = 7, history_days: int = 30) -> Optional[Dict]:
+        """Fetch velocity and history from the combined route in one request.
+
+        Returns a dict keyed velocity/history (either may be None), or None if
+        the route failed or is known to be missing (e.g. an older backend).
+        """
+        global _bundle_missing_at
+        if _bundle_missing_at is not None and time.monotonic() - _bundle_missing_at < _BUNDLE_RETRY:
+            return None
+        try:
+            response = SESSION.get(
+                f"{API_BASE}/api/sentiment/{symbol}/dashboard",
+                params={"days": velocity_days, "history_days": history_days},
+                timeout=API_TIMEOUT,
+            )
+            if response.status_code in (404, 405):
+                _bundle_missing_at = time.monotonic()
+            elif response.status_code == 200:
+                data = parse_json(response)
+                if data.get("success"):
+                    return data.get("data")
+            return None
+        except Exception as e:
+            _logger.warning("Error fetching sentiment dashboard: %s", e)
+            return None
+
+    @staticmethod
+    def fetch_all(symbol: str, velocity_days: int = 7, history_days: int = 30):
+        """Fetch velocity and history; returns (velocity, history).
+
+        Uses the combined route when the backend has it, otherwise overlaps
+        the two per-endpoint requests. Each slot is None on its own failure.
+        Call from a callback thread, not from an EXECUTOR task.
+        """
+        bundle = SentimentVelocityComponent.fetch_dashboard_bundle(symbol, velocity_days, history_days)
+        if bundle is not None:
+            return bundle.get("velocity"), bundle.get("history")
+
+        f_velocity = EXECUTOR.submit(SentimentVelocityComponent.fetch_velocity_data, symbol, velocity_days)
+        f_history = EXECUTOR.submit(SentimentVelocityComponent.fetch_history_data, symbol, history_days)
+        return f_velocity.result(), f_history.result()
+
     @staticmethod
     def create_velocity_card(velocity_data: Optional[Dict], symbol: str) -> dbc.Card:
         """Create a card displaying sentiment velocity information"""
@@ -86,31 +171,12 @@ class SentimentVelocityComponent:
         narrative_shift = dynamics.get("narrative_shift")
 
         # Determine colors based on velocity
-        if velocity > 2:
-            velocity_color = "success"
-            velocity_icon = "bi-arrow-up-circle-fill"
-        elif velocity > 0.5:
-            velocity_color = "info"
-            velocity_icon = "bi-arrow-up-right"
-        elif velocity > -0.5:
-            velocity_color = "secondary"
-            velocity_icon = "bi-dash-circle"
-        elif velocity > -2:
-            velocity_color = "warning"
-            velocity_icon = "bi-arrow-down-right"
-        else:
-            velocity_color = "danger"
-            velocity_icon = "bi-arrow-down-circle-fill"
+        band = bisect.bisect_left(_VELOCITY_THRESHOLDS, velocity)
+        velocity_color = _VELOCITY_COLORS[band]
+        velocity_icon = _VELOCITY_ICONS[band]
 
         # Signal badge color
-        signal_colors = {
-            "AcceleratingPositive": "success",
-            "AcceleratingNegative": "danger",
-            "Decelerating": "warning",
-            "TurningPoint": "info",
-            "Stable": "secondary",
-        }
-        signal_color = signal_colors.get(signal, "secondary")
+        signal_color = _SIGNAL_COLORS.get(signal, "secondary")
 
         card_content = [
             html.Div(
@@ -201,12 +267,13 @@ class SentimentVelocityComponent:
         return dbc.Card(dbc.CardBody(card_content), className="mb-3")
 
 
+@memoize_figure()
 def create_velocity_gauge(
     velocity: float,
     current_sentiment: float,
     signal: str,
     title: str = "Sentiment Velocity",
-) -> go.Figure:
+) -> Dict:
     """
     Create a gauge chart showing sentiment velocity
 
@@ -217,22 +284,13 @@ def create_velocity_gauge(
         title: Chart title
 
     Returns:
-        Plotly figure with gauge visualization
+        Plotly figure dict with gauge visualization (cached by input)
     """
     # Normalize velocity to gauge range (-10 to 10)
     gauge_value = max(min(velocity, 10), -10)
 
     # Determine color based on velocity
-    if velocity > 2:
-        bar_color = "#00ff00"
-    elif velocity > 0.5:
-        bar_color = "#00cc88"
-    elif velocity > -0.5:
-        bar_color = "#888888"
-    elif velocity > -2:
-        bar_color = "#ff8800"
-    else:
-        bar_color = "#ff0000"
+    bar_color = _GAUGE_BAR_COLORS[bisect.bisect_left(_VELOCITY_THRESHOLDS, velocity)]
 
     fig = go.Figure(
         go.Indicator(
@@ -330,9 +388,15 @@ def create_sentiment_history_chart(
         )
         return fig
 
-    timestamps = [h.get("timestamp", "") for h in history]
-    scores = [h.get("sentiment_score", 0) for h in history]
-    article_counts = [h.get("article_count", 0) for h in history]
+    # One pass over the points; plotly serializes the arrays directly.
+    n = len(history)
+    timestamps = [None] * n
+    scores = np.empty(n, dtype=np.float64)
+    article_counts = np.empty(n, dtype=np.int32)
+    for i, h in enumerate(history):
+        timestamps[i] = h.get("timestamp", "")
+        scores[i] = h.get("sentiment_score", 0)
+        article_counts[i] = h.get("article_count", 0)
 
     fig = make_subplots(
         rows=2,
@@ -373,7 +437,7 @@ def create_sentiment_history_chart(
     )
 
     # Article count bars
-    colors = ["#00ff00" if s > 0 else "#ff0000" if s < 0 else "#888888" for s in scores]
+    colors = np.where(scores > 0, "#00ff00", np.where(scores < 0, "#ff0000", "#888888")).tolist()
     fig.add_trace(
         go.Bar(
             x=timestamps,
@@ -132,3 +132,101 @@ class TestConfig:
         from components.config import API_KEY
 
         assert API_KEY == "primary-key"
+
+
+class TestTtlCache:
+    """Test suite for the ttl_cache fetch decorator."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, set_api_env_vars):
+        """Setup for each test - reload config with test env vars."""
+        if 'components.config' in sys.modules:
+            del sys.modules['components.config']
+
+    def test_reuses_result_within_ttl(self):
+        """Test that identical calls inside the TTL hit the fetcher once."""
+        from components.config import ttl_cache
+
+        calls = []
+
+        @ttl_cache(60)
+        def fetch(symbol):
+            calls.append(symbol)
+            return {"symbol": symbol}
+
+        assert fetch("AAPL") == fetch("AAPL")
+        fetch("MSFT")
+
+        assert calls == ["AAPL", "MSFT"]
+
+    def test_expired_entries_refetch(self, monkeypatch):
+        """Test that a call after the TTL goes back to the fetcher."""
+        import components.config as config
+
+        clock = [100.0]
+        monkeypatch.setattr(config.time, "monotonic", lambda: clock[0])
+        calls = []
+
+        @config.ttl_cache(3)
+        def fetch():
+            calls.append(1)
+            return {}
+
+        fetch()
+        clock[0] += 2
+        fetch()
+        clock[0] += 2
+        fetch()
+
+        assert len(calls) == 2
+
+    def test_none_is_not_cached_and_cache_clear(self):
+        """Test that failures are retried and cache_clear drops entries."""
+        from components.config import ttl_cache
+
+        results = [None, {"ok": True}, {"ok": False}]
+
+        @ttl_cache(60)
+        def fetch():
+            return results.pop(0)
+
+        assert fetch() is None
+        assert fetch() == {"ok": True}
+        assert fetch() == {"ok": True}
+        fetch.cache_clear()
+        assert fetch() == {"ok": False}
+
+    def test_stale_result_is_served_when_refresh_fails(self, monkeypatch):
+        """Test that a failed refresh falls back to the expired value within the stale window."""
+        import components.config as config
+
+        clock = [100.0]
+        monkeypatch.setattr(config.time, "monotonic", lambda: clock[0])
+        results = [{"v": 1}, None, None]
+
+        @config.ttl_cache(5, stale=10)
+        def fetch():
+            return results.pop(0)
+
+        assert fetch() == {"v": 1}
+        clock[0] += 8
+        assert fetch() == {"v": 1}
+        clock[0] += 10
+        assert fetch() is None
+
+    def test_keyword_arguments_are_part_of_the_key(self):
+        """Test that keyword and positional calls are cached separately by value."""
+        from components.config import ttl_cache
+
+        calls = []
+
+        @ttl_cache(60)
+        def fetch(limit=20):
+            calls.append(limit)
+            return {"limit": limit}
+
+        assert fetch(limit=5) == {"limit": 5}
+        assert fetch(limit=5) == {"limit": 5}
+        assert fetch(limit=10) == {"limit": 10}
+
+        assert calls == [5, 10]
@@ -0,0 +1,94 @@
+"""Tests for components/figure_cache.py module."""
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from components.figure_cache import memoize_figure
+
+
+class TestMemoizeFigure:
+    """Test suite for the content-hash figure cache."""
+
+    def test_identical_inputs_build_once(self):
+        """Test that repeated calls with equal data reuse the cached figure."""
+        calls = []
+
+        @memoize_figure()
+        def build(data):
+            calls.append(data)
+            return go.Figure(go.Bar(x=list(data), y=list(data.values())))
+
+        first = build({"a": 1, "b": 2})
+        second = build({"b": 2, "a": 1})
+
+        assert len(calls) == 1
+        assert isinstance(first, dict)
+        assert first == second
+        assert first is not second
+
+    def test_different_inputs_miss(self):
+        """Test that changed data triggers a rebuild."""
+        calls = []
+
+        @memoize_figure()
+        def build(data):
+            calls.append(data)
+            return {"data": [], "layout": {"height": data["h"]}}
+
+        build({"h": 200})
+        build({"h": 220})
+
+        assert len(calls) == 2
+
+    def test_large_arrays_are_keyed_by_content(self):
+        """Test that arrays differing only mid-way (elided by str()) still miss."""
+        pytest.importorskip("orjson")
+        calls = []
+
+        @memoize_figure()
+        def build(values):
+            calls.append(values)
+            return {"data": [{"type": "bar", "y": values}], "layout": {}}
+
+        a = np.zeros(5000)
+        b = a.copy()
+        b[2500] = 1.0
+        build(a)
+        build(b)
+
+        assert len(calls) == 2
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted past maxsize."""
+        calls = []
+
+        @memoize_figure(maxsize=2)
+        def build(n):
+            calls.append(n)
+            return {"data": [], "layout": {"height": n}}
+
+        build(1)
+        build(2)
+        build(1)
+        build(3)  # evicts 2
+        build(1)
+        build(2)
+
+        assert calls == [1, 2, 3, 2]
+
+    def test_import_does_not_load_plotly(self):
+        """Test that figure_cache on its own leaves plotly unimported."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        path = Path(__file__).resolve().parent.parent / "components" / "figure_cache.py"
+        code = (
+            "import importlib.util, sys\n"
+            f"spec = importlib.util.spec_from_file_location('figure_cache', {str(path)!r})\n"
+            "spec.loader.exec_module(importlib.util.module_from_spec(spec))\n"
+            "print('plotly' in sys.modules)\n"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert out.stdout.strip() == "False"
@@ -0,0 +1,67 @@
+"""Tests for ml_strategy_weights component."""
+import pytest
+import responses
+import sys
+
+
+WEIGHTS_URL = "http://localhost:3000/api/ml/strategy-weights"
+
+
+class TestMLStrategyWeightsComponent:
+    """Test suite for MLStrategyWeightsComponent."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, set_api_env_vars):
+        """Setup for each test - reload modules with test env vars."""
+        if 'components.config' in sys.modules:
+            del sys.modules['components.config']
+        if 'components.ml_strategy_weights' in sys.modules:
+            del sys.modules['components.ml_strategy_weights']
+
+    @responses.activate
+    def test_fetch_data_revalidates_with_etag(self):
+        """Test that a 304 reuses the body from the previous 200."""
+        from components.ml_strategy_weights import MLStrategyWeightsComponent
+
+        responses.add(
+            responses.GET, WEIGHTS_URL,
+            json={"success": True, "data": {"weights": {"technical": 0.6}}},
+            headers={"ETag": '"v1"'},
+            status=200,
+        )
+        responses.add(responses.GET, WEIGHTS_URL, status=304)
+
+        first = MLStrategyWeightsComponent.fetch_data()
+        second = MLStrategyWeightsComponent.fetch_data()
+
+        assert first == {"weights": {"technical": 0.6}}
+        assert second == first
+        assert "If-None-Match" not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    @responses.activate
+    def test_fetch_data_without_etag_sends_no_validator(self):
+        """Test that responses without an ETag are not revalidated."""
+        from components.ml_strategy_weights import MLStrategyWeightsComponent
+
+        responses.add(
+            responses.GET, WEIGHTS_URL,
+            json={"success": True, "data": {"weights": {"technical": 0.6}}},
+            status=200,
+        )
+
+        MLStrategyWeightsComponent.fetch_data()
+        MLStrategyWeightsComponent.fetch_data()
+
+        assert "If-None-Match" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_fetch_data_unavailable_with_non_json_body(self):
+        """Test that a 503 with a plain-text body still reports unavailable."""
+        from components.ml_strategy_weights import MLStrategyWeightsComponent
+
+        responses.add(responses.GET, WEIGHTS_URL, body="Service Unavailable", status=503)
+
+        result = MLStrategyWeightsComponent.fetch_data()
+
+        assert result == {"_unavailable": True, "_message": "Model not loaded"}
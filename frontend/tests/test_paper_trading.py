@@ -151,6 +151,101 @@ class TestPaperTradingComponent:
         assert result["symbol"] == "AAPL"
         assert result["qty"] == "100"
 
+    @responses.activate
+    def test_fetch_account_and_positions(self, mock_account_response, mock_position_response):
+        """Test that account and positions are fetched together."""
+        from components.paper_trading import PaperTradingComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/account",
+            json=mock_account_response,
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/positions",
+            json={"success": True, "data": [mock_position_response["data"]]},
+            status=200
+        )
+
+        account, positions = PaperTradingComponent.fetch_account_and_positions()
+
+        assert account["status"] == "ACTIVE"
+        assert PaperTradingComponent.find_position(positions, "aapl") == mock_position_response["data"]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_fetch_position_direct(self, mock_position_response):
+        """Test single-symbol fetch uses the per-symbol route."""
+        from components.paper_trading import PaperTradingComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/positions/AAPL",
+            json=mock_position_response,
+            status=200
+        )
+
+        result = PaperTradingComponent.fetch_position_direct("aapl")
+
+        assert result["symbol"] == "AAPL"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_fetch_position_direct_falls_back_to_list(self, mock_position_response):
+        """Test single-symbol fetch falls back to the positions list."""
+        from components.paper_trading import PaperTradingComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/positions/AAPL",
+            status=405
+        )
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/positions",
+            json={"success": True, "data": [mock_position_response["data"]]},
+            status=200
+        )
+
+        result = PaperTradingComponent.fetch_position_direct("AAPL")
+
+        assert result["symbol"] == "AAPL"
+
+    @responses.activate
+    def test_fetch_position_direct_error_does_not_fetch_list(self):
+        """Test a broker error on the per-symbol route skips the positions list."""
+        from components.paper_trading import PaperTradingComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/positions/AAPL",
+            json={"success": False, "error": "broker down"},
+            status=500
+        )
+
+        result = PaperTradingComponent.fetch_position_direct("AAPL")
+
+        assert result is None
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_fetch_position_direct_caches_no_position(self):
+        """Test a null position is reused within the TTL like a real one."""
+        from components.paper_trading import PaperTradingComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/positions/AAPL",
+            json={"success": True, "data": None},
+            status=200
+        )
+
+        assert PaperTradingComponent.fetch_position_direct("AAPL") is None
+        assert PaperTradingComponent.fetch_position_direct("AAPL") is None
+        assert len(responses.calls) == 1
+
     @responses.activate
     def test_fetch_position_not_found(self):
         """Test fetch_position returns None when symbol not in positions."""
@@ -236,6 +331,68 @@ class TestPaperTradingComponent:
         assert b'"shares": 10' in request_body
         assert b'"notes": "Executed from main dashboard"' in request_body
 
+    @responses.activate
+    def test_execute_trade_sends_live_key_over_session_headers(self, monkeypatch):
+        """Test that the live trading key is merged over the session auth headers."""
+        monkeypatch.setenv("LIVE_TRADING_KEY", "live-secret-key-xyz")
+        from components.paper_trading import PaperTradingComponent
+
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/broker/execute",
+            json={"success": False, "error": "rejected"},
+            status=200
+        )
+
+        PaperTradingComponent.execute_trade("AAPL", "buy", 10)
+
+        headers = responses.calls[0].request.headers
+        assert headers["X-API-Key"] == "test-api-key-12345"
+        assert headers["X-Live-Trading-Key"] == "live-secret-key-xyz"
+
+    @responses.activate
+    def test_fetch_account_reuses_recent_result(self, mock_account_response):
+        """Test that repeated reads within the TTL issue one request."""
+        from components.paper_trading import PaperTradingComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/account",
+            json=mock_account_response,
+            status=200
+        )
+
+        first = PaperTradingComponent.fetch_account()
+        second = PaperTradingComponent.fetch_account()
+
+        assert first == second
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_execute_trade_success_invalidates_cache(self, mock_account_response):
+        """Test that a successful trade forces fresh account/positions reads."""
+        from components.paper_trading import PaperTradingComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/account",
+            json=mock_account_response,
+            status=200
+        )
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/broker/execute",
+            json={"success": True, "data": {"order_id": "ord_1"}},
+            status=200
+        )
+
+        PaperTradingComponent.fetch_account()
+        PaperTradingComponent.execute_trade("AAPL", "buy", 1)
+        PaperTradingComponent.fetch_account()
+
+        account_calls = [c for c in responses.calls if c.request.url.endswith("/account")]
+        assert len(account_calls) == 2
+
     @responses.activate
     def test_execute_trade_failure(self):
         """Test execute_trade handles API errors."""
@@ -269,6 +426,53 @@ class TestPaperTradingComponent:
         assert result["success"] is False
         assert "error" in result
 
+    @responses.activate
+    def test_submit_trade_resolves_through_get_trade_result(self, tmp_path, monkeypatch):
+        """Test that a submitted trade's result is returned once when done."""
+        import time
+        import diskcache
+        import components.paper_trading as paper_trading
+        from components.paper_trading import PaperTradingComponent
+
+        monkeypatch.setattr(paper_trading, "_trade_store", diskcache.Cache(str(tmp_path)))
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/broker/execute",
+            json={"success": True, "data": {"order_id": "ord_1", "status": "filled"}},
+            status=200
+        )
+
+        trade_id = PaperTradingComponent.submit_trade("AAPL", "buy", 10)
+        result = None
+        for _ in range(100):
+            result = PaperTradingComponent.get_trade_result(trade_id)
+            if result is not None:
+                break
+            time.sleep(0.05)
+
+        assert result["success"] is True
+        assert result["data"]["order_id"] == "ord_1"
+        assert PaperTradingComponent.get_trade_result(trade_id) is None
+
+    def test_get_trade_result_pending_or_unknown(self, tmp_path, monkeypatch):
+        """Test that pending and unknown trade ids both report None, not a failure."""
+        import diskcache
+        import components.paper_trading as paper_trading
+        from components.paper_trading import PaperTradingComponent
+
+        store = diskcache.Cache(str(tmp_path))
+        monkeypatch.setattr(paper_trading, "_trade_store", store)
+        store.set(paper_trading._trade_key("pending-id"), paper_trading._TRADE_PENDING)
+
+        assert PaperTradingComponent.get_trade_result("pending-id") is None
+        assert PaperTradingComponent.get_trade_result("unknown-id") is None
+
+    def test_import_does_not_open_trade_store(self):
+        """Test that the trade store is only opened on first use."""
+        import components.paper_trading as paper_trading
+
+        assert paper_trading._trade_store is None
+
     def test_create_panel_with_none_account(self):
         """Test create_panel handles None account gracefully."""
         from components.paper_trading import PaperTradingComponent
@@ -0,0 +1,119 @@
+"""Tests for portfolio_analytics component."""
+import pytest
+import responses
+import sys
+
+
+class TestPortfolioAnalyticsComponent:
+    """Test suite for PortfolioAnalyticsComponent."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, set_api_env_vars):
+        """Setup for each test - reload modules with test env vars."""
+        if 'components.config' in sys.modules:
+            del sys.modules['components.config']
+        if 'components.portfolio_analytics' in sys.modules:
+            del sys.modules['components.portfolio_analytics']
+
+    def test_lttb_keeps_short_series(self):
+        """Test that series under the threshold are returned whole."""
+        from components.portfolio_analytics import _lttb_indices
+
+        assert list(_lttb_indices([1, 2, 3], 2000)) == [0, 1, 2]
+
+    def test_lttb_downsamples_long_series(self):
+        """Test that long series are cut to the threshold, keeping both ends in order."""
+        from components.portfolio_analytics import _lttb_indices
+
+        values = [float(i % 50) for i in range(10000)]
+        idx = list(_lttb_indices(values, 500))
+
+        assert len(idx) == 500
+        assert idx[0] == 0
+        assert idx[-1] == 9999
+        assert idx == sorted(set(idx))
+
+    def test_benchmark_panel_caps_points_per_trace(self):
+        """Test that the benchmark chart draws at most _MAX_LINE_POINTS per line."""
+        from components.portfolio_analytics import PortfolioAnalyticsComponent, _MAX_LINE_POINTS
+
+        series = [{"date": f"d{i}", "value": 100 + i % 7} for i in range(5000)]
+        panel = PortfolioAnalyticsComponent.create_benchmark_panel(
+            {"portfolio_indexed": series, "benchmark_indexed": series[:10]}
+        )
+
+        fig = panel.children[1].figure
+        assert len(fig.data[0].x) == _MAX_LINE_POINTS
+        assert len(fig.data[1].x) == 10
+
+    def test_performance_heatmap_fills_missing_months_with_nan(self):
+        """Test that the monthly heatmap places returns by year/month and blanks the rest."""
+        import math
+        from components.portfolio_analytics import PortfolioAnalyticsComponent
+
+        panel = PortfolioAnalyticsComponent.create_performance_panel({
+            "monthly_returns": [
+                {"year": 2024, "month": 3, "return_percent": -2.0},
+                {"year": 2023, "month": 1, "return_percent": 1.25},
+            ],
+        })
+
+        heatmap = panel.children[1].figure.data[0]
+        assert list(heatmap.y) == ["2023", "2024"]
+        assert heatmap.z[0][0] == 1.25
+        assert heatmap.z[1][2] == -2.0
+        assert math.isnan(heatmap.z[1][0])
+
+    @responses.activate
+    def test_fetch_all_uses_bundle(self):
+        """Test that fetch_all takes every section from the bundle in one request."""
+        from components.portfolio_analytics import PortfolioAnalyticsComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/portfolio/bundle",
+            json={"success": True, "data": {
+                "risk": {"sharpe_ratio": 1.2},
+                "performance": {"total_return_percent": 8.0},
+                "benchmark": {"alpha": 0.5},
+                "drift": [],
+                "allocations": [],
+                "rebalance": {"trades": []},
+            }},
+            status=200,
+        )
+
+        results = PortfolioAnalyticsComponent.fetch_all()
+
+        assert len(responses.calls) == 1
+        assert "days=365" in responses.calls[0].request.url
+        assert "risk_days=90" in responses.calls[0].request.url
+        assert results["risk"] == {"sharpe_ratio": 1.2}
+        assert results["benchmark"] == {"alpha": 0.5}
+        assert results["rebalance"] is None
+
+    @responses.activate
+    def test_fetch_all_falls_back_without_bundle(self):
+        """Test that fetch_all uses the per-endpoint routes when the bundle 404s."""
+        from components.portfolio_analytics import PortfolioAnalyticsComponent
+
+        responses.add(responses.GET, "http://localhost:3000/api/portfolio/bundle", status=404)
+        for path, data in (
+            ("risk-metrics", {"sharpe_ratio": 1.2}),
+            ("performance-analytics", {"total_return_percent": 8.0}),
+            ("benchmark", {"alpha": 0.5}),
+            ("drift", [{"symbol": "AAPL", "drift_percent": 6.0}]),
+            ("rebalance", {"trades": []}),
+        ):
+            responses.add(
+                responses.GET,
+                f"http://localhost:3000/api/portfolio/{path}",
+                json={"success": True, "data": data},
+                status=200,
+            )
+
+        results = PortfolioAnalyticsComponent.fetch_all()
+
+        assert results["risk"] == {"sharpe_ratio": 1.2}
+        assert results["drift"] == [{"symbol": "AAPL", "drift_percent": 6.0}]
+        assert results["rebalance"] == {"trades": []}
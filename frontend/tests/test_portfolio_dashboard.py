@@ -130,6 +130,23 @@ class TestPortfolioDashboardComponent:
         # Verify query params
         assert "limit=20" in responses.calls[0].request.url
 
+    @responses.activate
+    def test_fetch_orders_clamps_limit_to_route_max(self):
+        """A limit above what the route serves is clamped instead of sent as-is."""
+        from components.portfolio_dashboard import PortfolioDashboardComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/orders",
+            json={"success": True, "data": []},
+            status=200
+        )
+
+        PortfolioDashboardComponent.fetch_orders(limit=500)
+
+        assert len(responses.calls) == 1
+        assert "limit=50" in responses.calls[0].request.url
+
     @responses.activate
     def test_fetch_orders_failure(self):
         """Test fetch_orders returns empty list on failure."""
@@ -146,6 +163,72 @@ class TestPortfolioDashboardComponent:
 
         assert result == []
 
+    @responses.activate
+    def test_fetch_positions_error_page(self):
+        """Test fetch_positions skips parsing a non-200 HTML error body."""
+        from components.portfolio_dashboard import PortfolioDashboardComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/positions",
+            body="<html>Bad Gateway</html>",
+            status=502
+        )
+
+        result = PortfolioDashboardComponent.fetch_positions()
+
+        assert result == []
+
+    @responses.activate
+    def test_fetch_all(self, mock_account_response, mock_position_response):
+        """Test fetch_all returns account, positions and orders together."""
+        from components.portfolio_dashboard import PortfolioDashboardComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/account",
+            json=mock_account_response,
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/positions",
+            json={"success": True, "data": [mock_position_response["data"]]},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/orders",
+            json={"success": False, "error": "Server error"},
+            status=500
+        )
+
+        account, positions, orders = PortfolioDashboardComponent.fetch_all(20)
+
+        assert account["buying_power"] == "100000.00"
+        assert positions[0]["symbol"] == "AAPL"
+        assert orders == []
+
+    @responses.activate
+    def test_fetch_account_cached_until_invalidated(self, mock_account_response):
+        """Test that account reads are reused until invalidate_cache is called."""
+        from components.portfolio_dashboard import PortfolioDashboardComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/broker/account",
+            json=mock_account_response,
+            status=200
+        )
+
+        PortfolioDashboardComponent.fetch_account()
+        PortfolioDashboardComponent.fetch_account()
+        assert len(responses.calls) == 1
+
+        PortfolioDashboardComponent.invalidate_cache()
+        PortfolioDashboardComponent.fetch_account()
+        assert len(responses.calls) == 2
+
     def test_create_dashboard_with_none_account(self):
         """Test create_dashboard handles None account gracefully."""
         from components.portfolio_dashboard import PortfolioDashboardComponent
@@ -294,6 +377,21 @@ class TestPortfolioDashboardComponent:
         # Internal logic should handle positive (green) and negative (red) coloring
         assert dashboard is not None
 
+    def test_positions_table_holds_raw_numbers(self, mock_account_response, mock_position_response):
+        """Test the positions DataTable carries floats and leaves formatting to the browser."""
+        from dash import dash_table
+        from components.portfolio_dashboard import PortfolioDashboardComponent
+
+        dashboard = PortfolioDashboardComponent.create_dashboard(
+            mock_account_response["data"], [mock_position_response["data"]], []
+        )
+
+        table = next(c for c in dashboard._traverse() if isinstance(c, dash_table.DataTable))
+        row = table.data[0]
+        assert row["symbol"] == "AAPL"
+        assert isinstance(row["pnl"], float)
+        assert row["pnl_pct"] == float(mock_position_response["data"]["unrealized_plpc"])
+
     def test_order_status_badge_colors(self, mock_account_response):
         """Test order history applies correct badge colors for status."""
         from components.portfolio_dashboard import PortfolioDashboardComponent
@@ -350,3 +448,125 @@ class TestPortfolioDashboardComponent:
 
         # Should only include GOOGL (positive market value)
         assert isinstance(fig, go.Figure)
+
+    def test_allocation_chart_folds_long_tail_into_other(self):
+        """Test allocation chart keeps the top 10 positions and sums the rest."""
+        from components.portfolio_dashboard import PortfolioDashboardComponent
+
+        positions = [
+            {"symbol": f"S{i:02d}", "market_value": str(1000 - i)}
+            for i in range(15)
+        ]
+
+        fig = PortfolioDashboardComponent._create_allocation_chart(positions)
+
+        pie = fig.data[0]
+        assert len(pie.labels) == 11
+        assert pie.labels[0] == "S00"
+        assert pie.labels[-1] == "Other"
+        assert pie.values[-1] == sum(1000 - i for i in range(10, 15))
+        assert pie.customdata[-1] == "S10, S11, S12, S13, S14"
+
+    def test_pl_bar_figure_is_cached_dict(self):
+        """Test the P&L bar figure is built once per distinct (symbol, P&L) set."""
+        from components.portfolio_dashboard import PortfolioDashboardComponent
+
+        first = PortfolioDashboardComponent._pl_bar_figure(["MSFT", "AAPL"], [-10.0, 25.0])
+        second = PortfolioDashboardComponent._pl_bar_figure(["MSFT", "AAPL"], [-10.0, 25.0])
+
+        assert isinstance(first, dict)
+        assert first["data"] is second["data"]
+        assert list(first["data"][0]["y"]) == ["AAPL", "MSFT"]
+
+    def test_dashboard_reuses_charts_when_only_prices_move(self, mock_account_response, monkeypatch):
+        """Test chart figures are cached on the charted fields, not whole positions."""
+        from components.portfolio_dashboard import PortfolioDashboardComponent
+
+        positions = [{"symbol": "AAPL", "market_value": "1500", "unrealized_pl": "50",
+                      "current_price": "150.00"}]
+        moved = [dict(positions[0], current_price="150.25")]
+
+        built = []
+        real_pie = PortfolioDashboardComponent._allocation_pie
+        monkeypatch.setattr(
+            PortfolioDashboardComponent, "_allocation_pie",
+            staticmethod(lambda labels, values: built.append(labels) or real_pie(labels, values)),
+        )
+
+        data = mock_account_response["data"]
+        PortfolioDashboardComponent.create_dashboard(data, positions, [])
+        PortfolioDashboardComponent.create_dashboard(data, moved, [])
+
+        assert built == [["AAPL"]]
+
+    def test_positions_to_soa_parses_strings_once(self):
+        """Test positions are split into float columns, with missing fields as 0."""
+        from components.portfolio_dashboard import _positions_to_soa
+
+        soa = _positions_to_soa([
+            {"symbol": "AAPL", "qty": "10", "unrealized_pl": "25.50"},
+            {"symbol": "MSFT", "unrealized_pl": "-5", "cost_basis": None},
+        ])
+
+        assert soa["symbol"] == ["AAPL", "MSFT"]
+        assert soa["qty"].tolist() == [10.0, 0.0]
+        assert soa["unrealized_pl"].sum() == 20.5
+        assert soa["cost_basis"].tolist() == [0.0, 0.0]
+
+    def test_bank_sections_render_into_named_containers(self, mock_account_response):
+        """Test store-driven sections are wrapped so they can be updated on their own."""
+        from components.portfolio_dashboard import PortfolioDashboardComponent
+
+        card = PortfolioDashboardComponent.create_dashboard(
+            mock_account_response["data"], [], [], None, []
+        )
+        ids = [getattr(child, "id", None) for child in card.children[1].children]
+        assert "portfolio-bank-section" in ids
+
+        bank_section, history = PortfolioDashboardComponent.build_bank_sections(None, [
+            {"date": "2024-01-01T00:00", "totalAmount": 100,
+             "splits": [{"bankId": "pnc", "amount": 40, "pct": 40}]},
+        ])
+        assert len(bank_section.children[1].children) == 2
+        assert len(history.children[1].children) == 1
+
+    def test_pl_bar_chart_keeps_largest_movers(self):
+        """Test the P&L chart is capped to the biggest |P&L| positions."""
+        from components.portfolio_dashboard import PortfolioDashboardComponent, _PL_CHART_MAX_BARS
+
+        positions = [{"symbol": f"S{i:02d}", "unrealized_pl": str(i - 20)} for i in range(40)]
+
+        chart = PortfolioDashboardComponent._create_pl_bar_chart(positions)
+
+        bars = chart.children[1].figure["data"][0]
+        assert len(bars["y"]) == _PL_CHART_MAX_BARS
+        assert "S00" in bars["y"] and "S39" in bars["y"]
+        assert "S20" not in bars["y"]
+
+    def test_pl_bar_chart_treats_null_pl_as_zero(self):
+        """Test a null unrealized_pl renders as a zero bar instead of raising."""
+        from components.portfolio_dashboard import PortfolioDashboardComponent
+
+        positions = [{"symbol": "X", "unrealized_pl": None}, {"symbol": "Y", "unrealized_pl": "5"}]
+
+        chart = PortfolioDashboardComponent._create_pl_bar_chart(positions)
+
+        bars = chart.children[1].figure["data"][0]
+        assert list(bars["x"]) == [5.0, 0.0]
+
+    def test_allocation_chart_folds_dust_into_other(self):
+        """Test slices under 1% of the portfolio fold into "Other" even below the top N."""
+        from components.portfolio_dashboard import PortfolioDashboardComponent
+
+        positions = [
+            {"symbol": "BIG", "market_value": "9000"},
+            {"symbol": "MID", "market_value": "950"},
+            {"symbol": "DUST1", "market_value": "30"},
+            {"symbol": "DUST2", "market_value": "20"},
+        ]
+
+        pie = PortfolioDashboardComponent._create_allocation_chart(positions).data[0]
+
+        assert list(pie.labels) == ["BIG", "MID", "Other"]
+        assert pie.values[-1] == 50
+        assert pie.customdata[-1] == "DUST1, DUST2"
@@ -108,6 +108,39 @@ class TestRiskRadarComponent:
         # Volatility risk is blended: min(100, 60*2)*0.6 + abs(-40)*2*0.4 = 60 + 32 = 92
         assert risk_scores["volatility_risk"] == 92.0
 
+    def test_calculate_risk_from_portfolio_matches_per_symbol(self, mock_analysis_response):
+        """Test that batch scoring gives the same rows as scoring each analysis."""
+        from components.risk_radar import RiskRadarComponent
+
+        analyses = [
+            mock_analysis_response["data"],
+            {},
+            {"quant": {"metrics": {"beta": 3.0, "volatility": 60.0, "max_drawdown": -40.0}}},
+        ]
+
+        scores = RiskRadarComponent.calculate_risk_from_portfolio(analyses)
+
+        assert scores.shape == (3, 6)
+        for row, analysis in zip(scores, analyses):
+            expected = RiskRadarComponent.calculate_risk_from_analysis(analysis)
+            assert row.tolist() == pytest.approx(list(expected.values()))
+        assert RiskRadarComponent.calculate_risk_from_portfolio([]).shape == (0, 6)
+
+    def test_risk_charts_are_cached_figure_dicts(self):
+        """Test that identical risk inputs reuse the cached radar and breakdown figures."""
+        from components.risk_radar import create_risk_radar_chart, create_risk_breakdown_bars
+
+        risk = {"market_risk": 70.0, "volatility_risk": 40.0}
+
+        radar = create_risk_radar_chart(risk, title="Risk Radar - AAPL")
+        assert isinstance(radar, dict)
+        assert radar == create_risk_radar_chart(dict(risk), title="Risk Radar - AAPL")
+        assert radar["data"][0]["r"][-1] == radar["data"][0]["r"][0]
+
+        bars = create_risk_breakdown_bars(risk)
+        assert bars["data"][0]["marker"]["color"][:2] == ["#ff4444", "#00ccff"]
+        assert bars is not create_risk_breakdown_bars(risk)
+
     @responses.activate
     def test_fetch_risk_radar_success(self):
         """Test successful fetch of risk radar data from API."""
@@ -170,6 +203,24 @@ class TestRiskRadarComponent:
 
         assert result is None
 
+    @responses.activate
+    def test_fetch_risk_radar_reuses_recent_result(self):
+        """Test that a repeat fetch for the same symbol is served from cache."""
+        from components.risk_radar import RiskRadarComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/risk/radar/AAPL",
+            json={"success": True, "data": {"market_risk": 60.0}},
+            status=200
+        )
+
+        first = RiskRadarComponent.fetch_risk_radar("AAPL")
+        second = RiskRadarComponent.fetch_risk_radar("AAPL")
+
+        assert first == second == {"market_risk": 60.0}
+        assert len(responses.calls) == 1
+
     @responses.activate
     def test_fetch_risk_radar_without_symbol(self):
         """Test fetch_risk_radar without symbol uses portfolio endpoint."""
@@ -0,0 +1,84 @@
+"""Tests for sentiment_velocity component."""
+import pytest
+import responses
+import sys
+
+
+class TestSentimentVelocityComponent:
+    """Test suite for SentimentVelocityComponent."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, set_api_env_vars):
+        """Setup for each test - reload modules with test env vars."""
+        if 'components.config' in sys.modules:
+            del sys.modules['components.config']
+        if 'components.sentiment_velocity' in sys.modules:
+            del sys.modules['components.sentiment_velocity']
+
+    @responses.activate
+    def test_fetch_all_uses_bundle(self):
+        """Test that fetch_all takes velocity and history from one request."""
+        from components.sentiment_velocity import SentimentVelocityComponent
+
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/sentiment/AAPL/dashboard",
+            json={"success": True, "data": {
+                "velocity": {"dynamics": {"velocity": 1.5}},
+                "history": {"history": [{"sentiment_score": 12.0}]},
+            }},
+            status=200,
+        )
+
+        velocity, history = SentimentVelocityComponent.fetch_all("AAPL")
+
+        assert len(responses.calls) == 1
+        assert "days=7" in responses.calls[0].request.url
+        assert "history_days=30" in responses.calls[0].request.url
+        assert velocity == {"dynamics": {"velocity": 1.5}}
+        assert history == {"history": [{"sentiment_score": 12.0}]}
+
+    @responses.activate
+    def test_fetch_all_falls_back_without_bundle(self):
+        """Test that fetch_all uses the per-endpoint routes when the bundle 404s."""
+        from components.sentiment_velocity import SentimentVelocityComponent
+
+        responses.add(responses.GET, "http://localhost:3000/api/sentiment/AAPL/dashboard", status=404)
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/sentiment/AAPL/velocity",
+            json={"success": True, "data": {"dynamics": {"velocity": -0.3}}},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/sentiment/AAPL/history",
+            status=500,
+        )
+
+        velocity, history = SentimentVelocityComponent.fetch_all("AAPL")
+
+        assert velocity == {"dynamics": {"velocity": -0.3}}
+        assert history is None
+
+    @responses.activate
+    def test_fetch_all_remembers_missing_bundle(self):
+        """Test that a 404 from the bundle route is not retried on the next render."""
+        from components.sentiment_velocity import SentimentVelocityComponent
+
+        responses.add(responses.GET, "http://localhost:3000/api/sentiment/AAPL/dashboard", status=404)
+        responses.add(responses.GET, "http://localhost:3000/api/sentiment/MSFT/dashboard", status=404)
+        for symbol in ("AAPL", "MSFT"):
+            for route in ("velocity", "history"):
+                responses.add(
+                    responses.GET,
+                    f"http://localhost:3000/api/sentiment/{symbol}/{route}",
+                    json={"success": True, "data": {}},
+                    status=200,
+                )
+
+        SentimentVelocityComponent.fetch_all("AAPL")
+        SentimentVelocityComponent.fetch_all("MSFT")
+
+        bundle_calls = [c for c in responses.calls if "/dashboard" in c.request.url]
+        assert len(bundle_calls) == 1